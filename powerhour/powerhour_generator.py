@@ -83,7 +83,7 @@ def analyze_loudness(video_file, log_file_path, json_output_dir):
         json_file_name = os.path.basename(video_file) + '_loudness.json'
         json_file_path = os.path.join(json_output_dir, json_file_name)
         with open(json_file_path, 'w') as json_file:
-            json.dump(loudness_info, json_file, indent=4)
+            json_file.write(json.dumps(loudness_info, indent=4))
 
     except subprocess.CalledProcessError as e:
         print(f"Error analyzing loudness for {video_file}. See {log_file_path}")
@@ -23,6 +23,7 @@ Dependencies:
     - tkinter: GUI framework
     - powerhour_processor: Backend video processing
     - psutil (optional): System resource monitoring
+    - orjson (optional): Faster config file (de)serialization
     - ffmpeg: External video processing tool
 
 Author: Anthony Izzo
@@ -30,12 +31,15 @@ License: AGPL-3.0-or-later
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import ttk, messagebox
 from tkinter.scrolledtext import ScrolledText
 import threading
 import queue
 import json
 import os
+import shutil
+import subprocess
+import stat
 from pathlib import Path
 import sys
 import time
@@ -44,31 +48,381 @@ import platform
 import traceback
 import tempfile
 import atexit
-import webbrowser
-from datetime import datetime
-from typing import Optional, Dict, Any
+import functools
+import itertools
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterable, List, NamedTuple, Set, Tuple, Union
 
-# Import the processor for video generation
+# Import the processor for video generation. If the worker modules are
+# missing, the GUI still starts and _WORKER_IMPORT_ERROR holds the reason.
+_WORKER_IMPORT_ERROR: Optional[str] = None
 try:
     from . import __version__ as APP_VERSION
-    from .powerhour_processor import ProcessorThread
+    from .powerhour_processor import ProcessorThread, URL_PREFIXES, list_video_files
     from .ytdlp_updater import YtDlpUpdaterThread, YTDLP_INSTALL_DOCS_URL
 except ImportError:
     APP_VERSION = "(dev)"
     try:
         # Fallback for when running as a script
-        from powerhour_processor import ProcessorThread
+        from powerhour_processor import ProcessorThread, URL_PREFIXES, list_video_files
         from ytdlp_updater import YtDlpUpdaterThread, YTDLP_INSTALL_DOCS_URL
     except ImportError as e:
-        print(f"Error: Could not import ProcessorThread/YtDlpUpdaterThread: {e}")
-        print("Please ensure powerhour_processor.py and ytdlp_updater.py are present.")
-        sys.exit(1)
+        # Don't exit here: let the window come up and report the problem
+        # from start_processing() instead of dying before any UI exists.
+        print(f"Error: Could not import ProcessorThread/YtDlpUpdaterThread: {e}", file=sys.stderr)
+        ProcessorThread = None
+        URL_PREFIXES = ('http://', 'https://')
+        list_video_files = None
+        YtDlpUpdaterThread = None
+        YTDLP_INSTALL_DOCS_URL = "https://github.com/izzoa/powerhour-generator#yt-dlp"
+        _WORKER_IMPORT_ERROR = str(e)
 
-# Try to import psutil for resource monitoring (optional)
+# Supported video-platform URLs, compiled once rather than per validation.
+# Scheme and host are case-insensitive, so match them that way instead of
+# lowercasing the input on every call.
+_URL_PATTERN = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:www\.)?'  # optional www.
+    r'(?:youtube\.com|youtu\.be|'  # YouTube domains
+    r'vimeo\.com|dailymotion\.com)',  # Other supported sites
+    re.IGNORECASE
+)
+
+# Status keyword -> (stage label, color) for update_processing_stage
+_STAGE_MAP = MappingProxyType({
+    "Initializing": ("Initializing", "lightblue"),
+    "Downloading": ("Downloading", "yellow"),
+    "Analyzing": ("Analyzing", "orange"),
+    "Processing": ("Encoding", "green"),
+    "Concatenating": ("Finalizing", "blue"),
+    "Complete": ("Complete", "darkgreen"),
+})
+_STAGE_RE = re.compile('|'.join(map(re.escape, _STAGE_MAP)))
+
+# Error-message keyword -> user-friendly hint for get_user_friendly_error.
+# Listed in priority order: when a message mentions several keywords, the
+# one listed first wins. All keywords are found in one case-insensitive pass.
+_DISK_HINT = "Insufficient disk space. Please free up space and try again."
+_NETWORK_HINT = "Network error. Please check your internet connection."
+_ERROR_KEYWORD_HINTS = MappingProxyType({
+    "ffmpeg": "FFmpeg error. Please ensure FFmpeg is installed correctly.",
+    "ffprobe": "FFprobe error. Please ensure FFprobe is installed correctly.",
+    "yt-dlp": "YouTube download error. Please check the URL and internet connection.",
+    "disk": _DISK_HINT,
+    "space": _DISK_HINT,
+    "network": _NETWORK_HINT,
+    "connection": _NETWORK_HINT,
+})
+_ERROR_KEYWORD_RANK = MappingProxyType({keyword: rank for rank, keyword in enumerate(_ERROR_KEYWORD_HINTS)})
+_ERROR_KEYWORD_RE = re.compile('|'.join(map(re.escape, _ERROR_KEYWORD_HINTS)), re.IGNORECASE)
+
+# Exception class -> user-friendly message, when no keyword hint matched
+_ERROR_CLASS_MAP = MappingProxyType({
+    FileNotFoundError: "The specified file or folder could not be found.",
+    PermissionError: "Permission denied. Please check file permissions.",
+    OSError: "System error occurred. Please check disk space and permissions.",
+    json.JSONDecodeError: "Configuration file is corrupted. Using defaults.",
+    subprocess.CalledProcessError: "Video processing failed. Check FFmpeg installation.",
+    MemoryError: "Out of memory. Try processing fewer videos.",
+    KeyboardInterrupt: "Operation cancelled by user.",
+    ValueError: "Invalid input value provided.",
+})
+
+# Errors handle_error logs as one line; their tracebacks add nothing useful
+_EXPECTED_ERRORS = (ValueError, FileNotFoundError)
+
+# Validation state -> (border color, field background while focused)
+_VALIDATION_COLORS = MappingProxyType({
+    "Valid": ("green", "lightgreen"),
+    "Invalid": ("red", "lightpink"),
+    "Warning": ("orange", "lightyellow"),
+})
+
+# Validation styles the input widgets switch between (see setup_styles)
+_VALIDATION_STYLES = (
+    "Valid.TSpinbox", "Invalid.TSpinbox",
+    "Valid.TCombobox", "Invalid.TCombobox", "Warning.TCombobox",
+)
+
+# Built-in presets applied by PowerHourGUI.apply_preset (read-only)
+_BUILTIN_PRESETS = MappingProxyType({
+    'party': MappingProxyType({
+        'fade_duration': 2.0,
+        'video_quality': 'medium',
+        'audio_normalization': True,
+        'output_format': 'mp4'
+    }),
+    'archive': MappingProxyType({
+        'fade_duration': 3.0,
+        'video_quality': 'high',
+        'audio_normalization': True,
+        'output_format': 'mkv'
+    }),
+    'fast': MappingProxyType({
+        'fade_duration': 1.0,
+        'video_quality': 'low',
+        'audio_normalization': False,
+        'output_format': 'mp4'
+    }),
+})
+
+
+def _stat_mode(path: str) -> Optional[int]:
+    """
+    Return the st_mode of a path, or None if it cannot be stat'ed.
+
+    One os.stat call answers "exists?", "is a dir?" and "is a file?"
+    together, instead of a separate syscall for each os.path check.
+    """
+    try:
+        return os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+
+
+def _empty_dir(path: str) -> None:
+    """
+    Delete everything inside a directory bottom-up, keeping the directory.
+
+    Each entry's type comes from the DirEntry (cached from the directory
+    read on most platforms), so no extra stat is issued per file.
+    Symlinks to directories are unlinked, never followed. An entry that
+    disappears mid-walk (e.g. a worker's TemporaryDirectory deleting the
+    same tree) counts as deleted.
+
+    Raises:
+        OSError: If an entry cannot be removed
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    _fast_rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+def _fast_rmtree(path: str) -> None:
+    """
+    Delete a directory tree bottom-up using os.scandir (see _empty_dir).
+
+    Raises:
+        OSError: If an entry or the directory itself cannot be removed
+    """
+    _empty_dir(path)
+    try:
+        os.rmdir(path)
+    except FileNotFoundError:
+        pass
+
+
+# Directories with more top-level entries than this are removed with the
+# native rm command (POSIX only), which beats a per-entry Python walk once
+# spawn cost is amortized
+_NATIVE_RMTREE_MIN_ENTRIES = 1000
+
+
+def _remove_tree(path: str) -> None:
+    """
+    Delete a directory tree, shelling out to rm -rf for large trees.
+
+    Small trees go through _fast_rmtree, as does every tree on Windows:
+    the native rd only runs through cmd, which re-parses its command line,
+    so a path containing & or | would split into a second command. If rm
+    is missing or leaves anything behind, the Python walk finishes the
+    job. A mount
+    point (e.g. a working dir bind-mounted into a container) is emptied
+    but left in place, since removing it would only fail with EBUSY.
+
+    Raises:
+        OSError: If the tree cannot be removed
+    """
+    if os.path.ismount(path):
+        _empty_dir(path)
+        return
+    if _SYSTEM == "Windows":
+        _fast_rmtree(path)
+        return
+    with os.scandir(path) as entries:
+        large = sum(1 for _ in itertools.islice(entries, _NATIVE_RMTREE_MIN_ENTRIES + 1)) \
+            > _NATIVE_RMTREE_MIN_ENTRIES
+    if large:
+        try:
+            subprocess.run(["rm", "-rf", "--", path], check=False,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            pass
+        if not os.path.lexists(path):
+            return
+    _fast_rmtree(path)
+
+
+def _delete_temp_path(path: str) -> None:
+    """
+    Delete a temp file or directory tree, ignoring any failure.
+
+    Tries os.unlink first (one syscall for the common file case) and only
+    falls back to a tree delete when the path turns out to be a directory
+    (IsADirectoryError on Linux, PermissionError on macOS/Windows). A path
+    that is already gone counts as deleted.
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except (IsADirectoryError, PermissionError):
+        try:
+            _remove_tree(path)
+        except OSError:
+            pass
+    except OSError:
+        pass
+
+
+# Try to import orjson for faster config (de)serialization (optional)
 try:
-    import psutil
+    import orjson
 except ImportError:
-    psutil = None
+    orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from raw bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to indented UTF-8 JSON bytes.
+
+    Uses orjson when it is installed, otherwise the stdlib encoder with
+    matching settings, so the on-disk format is the same either way.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=1)
+def _psutil_module() -> Optional[Any]:
+    """
+    Import psutil for resource monitoring on first use (optional).
+
+    Deferred out of module import because psutil's import is noticeably
+    slow on Windows and nothing needs it before the window has painted.
+    Returns None when psutil is not installed.
+    """
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil
+
+
+@functools.lru_cache(maxsize=1)
+def _filedialog_module() -> Any:
+    """
+    Import tkinter.filedialog on first use.
+
+    filedialog drags in tkinter.dialog, tkinter.simpledialog and fnmatch,
+    none of which are needed until the user clicks a Browse button.
+    """
+    from tkinter import filedialog
+    return filedialog
+
+
+@functools.lru_cache(maxsize=1)
+def _default_config() -> 'MappingProxyType[str, Any]':
+    """
+    Build the read-only default configuration once per process.
+
+    List-valued defaults are stored as tuples so the cached mapping is
+    immutable all the way down; PowerHourGUI.get_default_config() hands
+    out mutable copies.
+    """
+    return MappingProxyType({
+        "recent_sources": (),
+        "recent_outputs": (),
+        "recent_common_clips": (),
+        "default_fade_duration": 3.0,
+        "last_video_source": "",
+        "last_common_clip": "",
+        "last_output_dir": "",
+        "window_geometry": "800x600",
+        "max_recent_items": 10,
+        "audio_normalization_mode": "two_pass"
+    })
+
+
+# Host OS name, looked up once (platform.system() re-probes on every call)
+_SYSTEM = platform.system()
+
+
+@functools.lru_cache(maxsize=1)
+def _config_path() -> str:
+    """Resolve (and create the directory for) the per-OS config file path once."""
+    system = _SYSTEM
+
+    if system == "Windows":
+        config_dir = os.path.join(os.environ.get('APPDATA', ''), 'PowerHour')
+    elif system == "Darwin":  # macOS
+        config_dir = os.path.expanduser('~/Library/Application Support/PowerHour')
+    else:  # Linux and others
+        config_dir = os.path.expanduser('~/.config/PowerHour')
+
+    # Create directory if it doesn't exist
+    os.makedirs(config_dir, exist_ok=True)
+
+    return os.path.join(config_dir, 'config.json')
+
+
+@functools.lru_cache(maxsize=1)
+def _error_log_path() -> str:
+    """Resolve the error log path (alongside the config file) once."""
+    return os.path.join(os.path.dirname(_config_path()), 'error.log')
+
+
+class _OutputContext(NamedTuple):
+    """Output path facts shared by the output validators for one check."""
+    
+    path: str
+    directory: str
+    dir_mode: Optional[int]  # st_mode of directory, None if it doesn't exist
+
+
+class _ProgressState:
+    """
+    Per-run processing progress, read on every progress message.
+    
+    A small __slots__ container keeps these hot fields together instead of
+    scattered across the PowerHourGUI instance dict. speed_window holds the
+    last 10 videos/minute samples (running total in speed_sum) used for the
+    rolling speed average;
+    eta_window holds the last 16 per-video durations (with a running sum in
+    eta_sum) used for the ETA.
+    """
+    
+    __slots__ = ('start_time', 'videos_processed', 'speed_window', 'speed_sum', 'current_file', 'stage',
+                 'eta_window', 'eta_sum', 'last_tick_time', 'last_tick_current')
+    
+    def __init__(self) -> None:
+        self.start_time: Optional[float] = None
+        self.videos_processed = 0
+        self.speed_window: deque = deque(maxlen=10)
+        self.speed_sum = 0.0
+        self.current_file = ""
+        self.stage = ""
+        self.eta_window: deque = deque(maxlen=16)
+        self.eta_sum = 0.0
+        self.last_tick_time: Optional[float] = None
+        self.last_tick_current = 0
 
 
 class PowerHourGUI(tk.Tk):
@@ -84,7 +438,7 @@ class PowerHourGUI(tk.Tk):
         config_file (str): Path to the configuration JSON file
         processing_thread (Optional[ProcessorThread]): Active video processing thread
         message_queue (queue.Queue): Queue for thread communication
-        temp_files (List[str]): List of temporary files for cleanup
+        temp_files (Set[str]): Temporary files and directories to clean up
         error_log_file (str): Path to the error log file
         
     Methods:
@@ -96,6 +450,51 @@ class PowerHourGUI(tk.Tk):
     Complexity: O(1) for UI operations, O(n) for processing n videos
     """
     
+    # Upper bound on messages handled per process_queue tick
+    _QUEUE_DRAIN_LIMIT = 256
+    
+    # process_queue poll interval (ms) while work is in flight / while idle
+    _QUEUE_POLL_ACTIVE_MS = 100
+    _QUEUE_POLL_IDLE_MS = 500
+    
+    # Message types where only the newest per tick is applied to the UI
+    _COALESCED_MESSAGE_TYPES = frozenset({'progress', 'status', 'video_progress'})
+    
+    # Quiet period after the last keystroke before realtime validation runs
+    _VALIDATION_DEBOUNCE_MS = 250
+    
+    # Validator stat cache: entry lifetime (seconds) and maximum entries
+    _STAT_CACHE_TTL = 2.0
+    _STAT_CACHE_SIZE = 64
+    
+    # Seconds a free-space reading is reused by check_disk_space
+    _DISK_CACHE_TTL = 5.0
+    
+    # Saved presets listed directly in the Load Preset cascade
+    _PRESET_MENU_LIMIT = 8
+    
+    # Delay (ms) over which config changes are coalesced into one save
+    _CONFIG_SAVE_DELAY_MS = 1000
+    
+    # Shared bindtag carrying validation bindings for all input fields
+    _INPUT_BINDTAG = "PowerHourInput"
+    
+    # Resource-usage readout: check cadence (ms) and minimum seconds
+    # between refreshes while processing / while idle / while minimized
+    _RESOURCE_POLL_MS = 500
+    _RESOURCE_INTERVAL_ACTIVE = 1.0
+    _RESOURCE_INTERVAL_IDLE = 2.0
+    _RESOURCE_INTERVAL_ICONIFIED = 5.0
+    
+    # Output Log size cap, and how many appended lines between trims
+    _LOG_MAX_LINES = 2000
+    _LOG_TRIM_EVERY = 100
+    
+    # error.log size (bytes) above which it is rotated to error.log.old
+    _LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+    # Write buffer for the persistent error.log handle
+    _LOG_BUFFER_SIZE = 4096
+    
     def __init__(self) -> None:
         """
         Initialize the PowerHour GUI application.
@@ -112,21 +511,37 @@ class PowerHourGUI(tk.Tk):
         """
         super().__init__()
         
+        # Initialize queue for thread communication. Created first because
+        # log_message() enqueues onto it from any thread.
+        self.message_queue = queue.Queue()
+        self._drain_scheduled = False
+        
         # Set up global exception handler
         self.setup_exception_handler()
         
-        # Initialize error log
+        # Initialize error log. The file is opened on first write and kept
+        # open; _log_bytes tracks its size so no per-line stat is needed.
         self.error_log_file = self.get_error_log_path()
-        
-        # Track temporary files for cleanup
-        self.temp_files = []
+        self._log_lock = threading.RLock()
+        self._log_fp: Optional[Any] = None
+        self._log_bytes = 0
+        # (epoch second, formatted timestamp) reused for same-second bursts
+        self._log_stamp = (-1, '')
+        
+        # Track temporary files for cleanup. Everything a run writes lives
+        # under one per-session root (created on first use, see _temp_root)
+        self.temp_files: Set[str] = set()
+        self._system_tmp = tempfile.gettempdir()
+        self._ph_root: Optional[str] = None
         
         # Register cleanup on exit
         atexit.register(self.cleanup_on_exit)
         
-        # Initialize configuration
+        # Initialize configuration. _config_digest fingerprints the config
+        # as last loaded or written, so unchanged saves can be skipped.
         self.app_config = self.get_default_config()
         self.config_file = self.get_config_path()
+        self._config_digest: Optional[int] = None
         self.load_config()
         
         # Set window properties
@@ -147,11 +562,44 @@ class PowerHourGUI(tk.Tk):
         self.grid_columnconfigure(0, weight=1)
         
         # Initialize processing state
-        self.processing_start_time = None
-        self.videos_processed = 0
-        self.processing_speed = []
-        self.current_file_being_processed = ""
-        self.processing_stage = ""
+        self._progress_state = _ProgressState()
+        
+        # Working directory at startup; browse dialogs open here. The app
+        # never chdirs, so one getcwd() call is enough.
+        self._cwd = Path.cwd()
+        
+        # Fields awaiting debounced validation, the single after() token
+        # and the monotonic time of the last keystroke
+        self._pending_validations: set = set()
+        self._validation_after_id: Optional[str] = None
+        self._last_keystroke = 0.0
+        
+        # Recent stat results for the validators: path -> (timestamp, st_mode)
+        self._stat_cache: Dict[str, tuple] = {}
+        
+        # Last validated value per field: field -> (value, result, timestamp)
+        self._last_validated: Dict[str, Tuple[str, bool, float]] = {}
+        
+        # Recent free-space readings: directory -> (timestamp, free bytes)
+        self._disk_cache: Dict[str, tuple] = {}
+        
+        # Unsaved config changes and the pending coalesced-save after() token
+        self._config_dirty = False
+        self._config_save_after_id: Optional[str] = None
+        
+        # Validation tooltip window (created on first show, then reused)
+        self._tooltip: Optional[tk.Toplevel] = None
+        self._tooltip_label: Optional[ttk.Label] = None
+        self._tooltip_after_id: Optional[str] = None
+        self._tooltip_visible = False
+        
+        # Hover help tooltip shared by every add_tooltip widget (created on
+        # first hover, then repositioned and withdrawn rather than rebuilt)
+        self._hover_tooltip: Optional[tk.Toplevel] = None
+        self._hover_tooltip_label: Optional[tk.Label] = None
+        
+        # Log widget; None until build_log_section runs
+        self.log_text: Optional[ScrolledText] = None
         
         # Initialize instance variables for widgets
         self.video_source_var = tk.StringVar(value=self.app_config.get('last_video_source', ''))
@@ -161,7 +609,7 @@ class PowerHourGUI(tk.Tk):
         # Set output file with default directory
         last_output_dir = self.app_config.get('last_output_dir', '')
         if last_output_dir:
-            default_output = os.path.join(last_output_dir, "powerhour_output.mp4")
+            default_output = str(Path(last_output_dir) / "powerhour_output.mp4")
         else:
             default_output = "powerhour_output.mp4"
         self.output_file_var = tk.StringVar(value=default_output)
@@ -170,8 +618,6 @@ class PowerHourGUI(tk.Tk):
         self.overall_progress_var = tk.IntVar()
         self.eta_var = tk.StringVar(value="")
         
-        # Initialize queue for thread communication
-        self.message_queue = queue.Queue()
         self.processing_thread = None
 
         # yt-dlp updater state — must be set before build_status_bar/process_queue.
@@ -179,6 +625,9 @@ class PowerHourGUI(tk.Tk):
         self._ytdlp_update_in_progress = False
         self._processing_active = False
 
+        # Define all ttk styles once, before any widget references them
+        self.setup_styles()
+        
         # Build GUI sections
         self.build_menu_bar()
         self.build_input_section()
@@ -197,7 +646,8 @@ class PowerHourGUI(tk.Tk):
         # network or subprocess call happens on the main loop before mainloop()
         # enters its first iteration — process_queue has already been scheduled
         # above, so any messages this thread enqueues will be consumed.
-        YtDlpUpdaterThread(self.message_queue, mode='check_only').start()
+        if YtDlpUpdaterThread is not None:
+            YtDlpUpdaterThread(self.message_queue, mode='check_only').start()
 
         # Log startup
         self.log_to_file("info", "Application started")
@@ -217,6 +667,32 @@ class PowerHourGUI(tk.Tk):
         Flow: Called once during initialization by __init__
         Dependencies: Requires self.app_config to be loaded first
         """
+        # Capped snapshot of the recent-items lists (most recent first),
+        # shared by the dropdowns below and add_to_recent(). _recent_order
+        # keeps the same items in an OrderedDict for O(1) promotion and
+        # eviction. Oversized or duplicated lists from older configs are
+        # cleaned back into app_config too.
+        max_items = self.app_config.get('max_recent_items', 10)
+        self._recent = {}
+        self._recent_order: Dict[str, OrderedDict] = {}
+        for key in ('recent_sources', 'recent_common_clips', 'recent_outputs'):
+            order = OrderedDict.fromkeys(self.app_config.get(key, ()))
+            while len(order) > max_items:
+                order.popitem()
+            self._recent_order[key] = order
+            self._recent[key] = tuple(order)
+            self.app_config[key] = list(self._recent[key])
+        
+        # Last values tuple pushed to each Combobox (see _set_combo_values)
+        self._combo_values_cache = {}
+        
+        # Validation events for all input fields go through one shared
+        # bindtag; _widget_kind maps each widget to its validate_* methods.
+        self._widget_kind = {}
+        self.bind_class(self._INPUT_BINDTAG, "<FocusOut>", self._on_input_commit)
+        self.bind_class(self._INPUT_BINDTAG, "<<ComboboxSelected>>", self._on_input_commit)
+        self.bind_class(self._INPUT_BINDTAG, "<KeyRelease>", self._on_input_keyrelease)
+        
         # Create LabelFrame for input parameters
         input_frame = ttk.LabelFrame(self, text="Input Parameters", padding=10)
         input_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=5)
@@ -238,12 +714,10 @@ class PowerHourGUI(tk.Tk):
         self.video_source_combo = ttk.Combobox(
             video_source_frame,
             textvariable=self.video_source_var,
-            values=self.app_config.get('recent_sources', [])
+            values=self._recent['recent_sources']
         )
         self.video_source_combo.grid(row=0, column=0, sticky="ew")
-        self.video_source_combo.bind("<FocusOut>", self.validate_video_source)
-        self.video_source_combo.bind("<KeyRelease>", self.validate_video_source_realtime)
-        self.video_source_combo.bind("<<ComboboxSelected>>", self.validate_video_source)
+        self._register_input_widget(self.video_source_combo, "video_source")
         
         ttk.Button(
             input_frame, text="Browse", command=self.browse_video_source
@@ -263,12 +737,10 @@ class PowerHourGUI(tk.Tk):
         self.common_clip_combo = ttk.Combobox(
             common_clip_frame,
             textvariable=self.common_clip_var,
-            values=self.app_config.get('recent_common_clips', [])
+            values=self._recent['recent_common_clips']
         )
         self.common_clip_combo.grid(row=0, column=0, sticky="ew")
-        self.common_clip_combo.bind("<FocusOut>", self.validate_common_clip)
-        self.common_clip_combo.bind("<KeyRelease>", self.validate_common_clip_realtime)
-        self.common_clip_combo.bind("<<ComboboxSelected>>", self.validate_common_clip)
+        self._register_input_widget(self.common_clip_combo, "common_clip")
         
         ttk.Button(
             input_frame, text="Browse", command=self.browse_common_clip
@@ -289,8 +761,7 @@ class PowerHourGUI(tk.Tk):
             width=10
         )
         self.fade_duration_spinbox.grid(row=2, column=1, sticky="w", padx=5, pady=5)
-        self.fade_duration_spinbox.bind("<KeyRelease>", self.validate_fade_duration)
-        self.fade_duration_spinbox.bind("<FocusOut>", self.validate_fade_duration)
+        self._register_input_widget(self.fade_duration_spinbox, "fade_duration")
         ttk.Label(input_frame, text="Transition effect duration").grid(
             row=2, column=2, sticky="w", padx=5, pady=5)
         
@@ -308,16 +779,76 @@ class PowerHourGUI(tk.Tk):
         self.output_file_combo = ttk.Combobox(
             output_frame,
             textvariable=self.output_file_var,
-            values=self.app_config.get('recent_outputs', [])
+            values=self._recent['recent_outputs']
         )
         self.output_file_combo.grid(row=0, column=0, sticky="ew")
-        self.output_file_combo.bind("<KeyRelease>", self.validate_output_file_realtime)
-        self.output_file_combo.bind("<FocusOut>", self.validate_output_file)
-        self.output_file_combo.bind("<<ComboboxSelected>>", self.validate_output_file)
+        self._register_input_widget(self.output_file_combo, "output_file")
         
         ttk.Button(
             input_frame, text="Save As", command=self.browse_output_file
         ).grid(row=3, column=2, padx=5, pady=5)
+        
+        # Record the values the dropdowns were created with
+        for combo, key in ((self.video_source_combo, 'recent_sources'),
+                           (self.common_clip_combo, 'recent_common_clips'),
+                           (self.output_file_combo, 'recent_outputs')):
+            self._combo_values_cache[str(combo)] = self._recent[key]
+    
+    def _register_input_widget(self, widget: tk.Widget, kind: str) -> None:
+        """
+        Attach an input widget to the shared validation bindtag.
+        
+        Args:
+            widget: Combobox or Spinbox to validate
+            kind: Field name; selects validate_<kind> and, if present,
+                validate_<kind>_realtime
+            
+        Returns:
+            None
+            
+        Complexity: O(1)
+        Flow: Called by build_input_section for each validated field
+        """
+        self._widget_kind[str(widget)] = kind
+        widget.bindtags((self._INPUT_BINDTAG,) + widget.bindtags())
+    
+    def _on_input_commit(self, event: tk.Event) -> None:
+        """
+        Run full validation for an input field on focus-out or selection.
+        
+        Args:
+            event: Tkinter event from the shared input bindtag
+            
+        Returns:
+            None
+            
+        Complexity: O(1)
+        Flow: Bound to <FocusOut> and <<ComboboxSelected>> on _INPUT_BINDTAG
+        """
+        kind = self._widget_kind.get(str(event.widget))
+        if kind:
+            getattr(self, f"validate_{kind}")(event)
+    
+    def _on_input_keyrelease(self, event: tk.Event) -> None:
+        """
+        Run realtime (debounced) validation for an input field on typing.
+        
+        Fields without a validate_<kind>_realtime method are validated
+        directly.
+        
+        Args:
+            event: Tkinter event from the shared input bindtag
+            
+        Returns:
+            None
+            
+        Complexity: O(1)
+        Flow: Bound to <KeyRelease> on _INPUT_BINDTAG
+        """
+        kind = self._widget_kind.get(str(event.widget))
+        if kind:
+            validator = getattr(self, f"validate_{kind}_realtime", None) or getattr(self, f"validate_{kind}")
+            validator(event)
     
     def build_control_section(self) -> None:
         """
@@ -385,6 +916,9 @@ class PowerHourGUI(tk.Tk):
         - Preset management system
         - Help and documentation access
         
+        The Presets and Help menus are created empty and filled in by
+        their postcommand hooks the first time they are opened.
+        
         Returns:
             None
             
@@ -442,13 +976,43 @@ class PowerHourGUI(tk.Tk):
                                     variable=self.expert_mode_var,
                                     command=self.toggle_expert_mode)
         
-        # Presets menu
+        # Presets menu (items added on first open, see _populate_presets_menu)
         options_menu.add_separator()
-        presets_menu = tk.Menu(options_menu, tearoff=0)
+        self._presets_menu = tk.Menu(options_menu, tearoff=0,
+                                     postcommand=self._populate_presets_menu)
+        options_menu.add_cascade(label="Presets", menu=self._presets_menu)
+        # Saved presets are listed in a cascade rebuilt on open when the set changes
+        self._load_presets_menu = tk.Menu(self._presets_menu, tearoff=0,
+                                          postcommand=self._populate_load_presets_menu)
+        self._load_presets_names = None
+        
+        # Help menu (items added on first open, see _populate_help_menu)
+        self._help_menu = tk.Menu(menubar, tearoff=0,
+                                  postcommand=self._populate_help_menu)
+        menubar.add_cascade(label="Help", menu=self._help_menu)
+        self._menus_populated = set()
+    
+    def _populate_presets_menu(self) -> None:
+        """
+        Fill the Presets menu the first time it is opened.
+        
+        Registered as the menu's postcommand so its entries are not
+        created during startup. Runs once; later opens are a no-op.
+        
+        Returns:
+            None
+            
+        Complexity: O(1)
+        Flow: Called by Tk just before the Presets menu is posted
+        """
+        if 'presets' in self._menus_populated:
+            return
+        self._menus_populated.add('presets')
+        presets_menu = self._presets_menu
         presets_menu.add_command(label="Save Current Settings as Preset",
                                command=self.save_preset)
-        presets_menu.add_command(label="Load Preset",
-                               command=self.load_preset)
+        presets_menu.add_cascade(label="Load Preset",
+                               menu=self._load_presets_menu)
         presets_menu.add_separator()
         presets_menu.add_command(label="Quick Party Mix",
                                command=lambda: self.apply_preset('party'))
@@ -456,12 +1020,52 @@ class PowerHourGUI(tk.Tk):
                                command=lambda: self.apply_preset('archive'))
         presets_menu.add_command(label="Fast Processing",
                                command=lambda: self.apply_preset('fast'))
-        options_menu.add_cascade(label="Presets", menu=presets_menu)
+    
+    def _populate_load_presets_menu(self) -> None:
+        """
+        Fill the Load Preset cascade with the saved preset names.
         
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
+        Small preset sets are listed directly so loading one does not
+        build a selection window. Larger sets get a single entry that
+        opens the full load_preset dialog. Entries are only rebuilt when
+        the saved names have changed since the last open.
         
+        Returns:
+            None
+            
+        Complexity: O(n) where n is number of saved presets, O(n) compare otherwise
+        Flow: Called by Tk just before the Load Preset cascade is posted
+        """
+        names = tuple(self.app_config.get('presets') or ())
+        if names == self._load_presets_names:
+            return
+        self._load_presets_names = names
+        menu = self._load_presets_menu
+        menu.delete(0, 'end')
+        if names and len(names) <= self._PRESET_MENU_LIMIT:
+            for name in names:
+                menu.add_command(label=name,
+                                 command=lambda n=name: self.apply_saved_preset(n))
+        else:
+            menu.add_command(label="Browse Presets...", command=self.load_preset)
+    
+    def _populate_help_menu(self) -> None:
+        """
+        Fill the Help menu the first time it is opened.
+        
+        Registered as the menu's postcommand so its entries are not
+        created during startup. Runs once; later opens are a no-op.
+        
+        Returns:
+            None
+            
+        Complexity: O(1)
+        Flow: Called by Tk just before the Help menu is posted
+        """
+        if 'help' in self._menus_populated:
+            return
+        self._menus_populated.add('help')
+        help_menu = self._help_menu
         help_menu.add_command(label="About PowerHour", command=self.show_about)
         help_menu.add_command(label="User Guide", command=self.show_user_guide)
         help_menu.add_separator()
@@ -476,7 +1080,9 @@ class PowerHourGUI(tk.Tk):
         - Current operation details (center)
         - System resource usage (right side)
         
-        Starts automatic resource monitoring that updates every 2 seconds.
+        Schedules automatic resource monitoring to start shortly after the
+        window first paints, then update every 2 seconds (every second
+        while processing).
         
         Returns:
             None
@@ -522,8 +1128,16 @@ class PowerHourGUI(tk.Tk):
         self.operation_label = ttk.Label(self.status_bar, text="", font=("Arial", 9, "italic"))
         self.operation_label.pack(side="left", padx=20)
 
-        # Start resource monitoring
-        self.update_resource_usage()
+        # Start resource monitoring once the window has had a chance to paint.
+        # _resource_job holds the pending after() token so on_closing can
+        # cancel it; minimizing the window slows the refresh down.
+        self._cpu_percent_primed = False
+        self._resource_text: Optional[str] = None
+        self._last_resource_ts = 0.0
+        self._window_iconified = False
+        self.bind("<Unmap>", lambda event: self._set_iconified(event, True), add="+")
+        self.bind("<Map>", lambda event: self._set_iconified(event, False), add="+")
+        self._resource_job: Optional[str] = self.after(500, self.update_resource_usage)
     
     def build_progress_section(self) -> None:
         """
@@ -626,6 +1240,18 @@ class PowerHourGUI(tk.Tk):
                                          font=("Courier", 8))
         self.ffmpeg_params_text.grid(row=1, column=0, padx=5, pady=2)
         self.ffmpeg_params_text.insert("1.0", "-c:v libx264 -preset medium -crf 23")
+        
+        # Single-pass loudnorm skips the loudness measurement run over every video
+        self.fast_normalization_var = tk.BooleanVar(
+            value=self.app_config.get('audio_normalization_mode') == 'single_pass'
+        )
+        self.fast_normalization_check = ttk.Checkbutton(
+            self.expert_frame,
+            text="Fast audio normalization (single pass)",
+            variable=self.fast_normalization_var,
+            command=self.toggle_fast_normalization
+        )
+        self.fast_normalization_check.grid(row=2, column=0, sticky="w", padx=5, pady=2)
     
     def build_log_section(self) -> None:
         """
@@ -636,7 +1262,8 @@ class PowerHourGUI(tk.Tk):
         - Warning messages in orange
         - Error messages in red
         
-        Includes auto-scroll functionality and a clear button.
+        Includes auto-scroll functionality and a clear button. The log
+        keeps at most the last _LOG_MAX_LINES lines.
         
         Returns:
             None
@@ -667,6 +1294,7 @@ class PowerHourGUI(tk.Tk):
             state="disabled"
         )
         self.log_text.grid(row=0, column=0, sticky="nsew")
+        self._log_insert_count = 0
         
         # Configure tags for colored text
         self.log_text.tag_config("info", foreground="black")
@@ -729,10 +1357,14 @@ class PowerHourGUI(tk.Tk):
     
     def log_message(self, message: str, tag: str = "info") -> None:
         """
-        Generic log message method with auto-scroll functionality.
+        Generic log message method, safe to call from any thread.
         
-        Adds a message to the log display with appropriate color tagging
-        and automatically scrolls to show the latest message.
+        Enqueues a 'log' message on message_queue rather than touching the
+        log widget, so the queue drain on the Tk main thread is the only
+        writer to log_text. The message appears in order with worker
+        output: at the next idle point when called on the Tk thread, or on
+        the next poll otherwise. log_info/log_warning/log_error are
+        therefore thread-safe as well.
         
         Args:
             message: The message to log
@@ -744,12 +1376,51 @@ class PowerHourGUI(tk.Tk):
         Complexity: O(1)
         Flow: Called by specific log methods (log_info, log_warning, log_error)
         """
+        self.message_queue.put({'type': 'log', 'level': tag, 'message': message})
+        
+        # On the Tk thread, drain at the next idle point instead of waiting
+        # for the (possibly idle-rate) poll
+        if not self._drain_scheduled and threading.current_thread() is threading.main_thread():
+            self._drain_scheduled = True
+            self.after_idle(self._drain_queue)
+    
+    def _append_log_lines(self, entries: list) -> None:
+        """
+        Append several tagged lines to the log in a single widget update.
+        
+        All lines go through one Text.insert call (alternating text/tag
+        arguments), so order is preserved across tags, followed by a
+        single auto-scroll. The log is capped at _LOG_MAX_LINES; the
+        oldest lines are dropped in bulk every _LOG_TRIM_EVERY appends.
+        
+        Args:
+            entries: List of (message, tag) tuples in display order
+            
+        Returns:
+            None
+            
+        Complexity: O(n) where n is number of entries
+        Flow: Called only from the queue drain on the Tk main thread
+        """
         # Check if log_text widget has been created yet
-        if hasattr(self, 'log_text'):
-            self.log_text.config(state="normal")
-            self.log_text.insert("end", f"{message}\n", tag)
-            self.log_text.see("end")  # Auto-scroll to bottom
-            self.log_text.config(state="disabled")
+        if not entries or self.log_text is None:
+            return
+        insert_args = []
+        for message, tag in entries:
+            insert_args.extend((f"{message}\n", tag))
+        self.log_text.config(state="normal")
+        self.log_text.insert("end", *insert_args)
+        
+        # Keep the widget bounded; trim in bulk every _LOG_TRIM_EVERY lines
+        self._log_insert_count += len(entries)
+        if self._log_insert_count >= self._LOG_TRIM_EVERY:
+            self._log_insert_count = 0
+            line_count = int(self.log_text.index("end-1c").split(".")[0])
+            if line_count > self._LOG_MAX_LINES:
+                self.log_text.delete("1.0", f"{line_count - self._LOG_MAX_LINES}.0")
+        
+        self.log_text.see("end")  # Auto-scroll to bottom
+        self.log_text.config(state="disabled")
     
     def clear_log(self) -> None:
         """
@@ -780,9 +1451,9 @@ class PowerHourGUI(tk.Tk):
         Flow: Called when user clicks Browse button for video source
         """
         try:
-            folder = filedialog.askdirectory(
+            folder = _filedialog_module().askdirectory(
                 title="Select Video Source Folder",
-                initialdir=os.getcwd()
+                initialdir=str(self._cwd)
             )
             if folder:
                 self.video_source_var.set(folder)
@@ -805,13 +1476,13 @@ class PowerHourGUI(tk.Tk):
         Flow: Called when user clicks Browse button for common clip
         """
         try:
-            filename = filedialog.askopenfilename(
+            filename = _filedialog_module().askopenfilename(
                 title="Select Common Clip",
                 filetypes=[
                     ("Video files", "*.mp4 *.avi *.mkv *.mov"),
                     ("All files", "*.*")
                 ],
-                initialdir=os.getcwd()
+                initialdir=str(self._cwd)
             )
             if filename:
                 self.common_clip_var.set(filename)
@@ -833,14 +1504,14 @@ class PowerHourGUI(tk.Tk):
         Flow: Called when user clicks Save As button for output file
         """
         try:
-            filename = filedialog.asksaveasfilename(
+            filename = _filedialog_module().asksaveasfilename(
                 title="Save Output File As",
                 defaultextension=".mp4",
                 filetypes=[
                     ("MP4 files", "*.mp4"),
                     ("All files", "*.*")
                 ],
-                initialdir=os.getcwd(),
+                initialdir=str(self._cwd),
                 initialfile=self.output_file_var.get()
             )
             if filename:
@@ -848,7 +1519,8 @@ class PowerHourGUI(tk.Tk):
         except Exception as e:
             self.handle_error(e, "Failed to browse for output file")
     
-    def validate_video_source(self, event: Optional[tk.Event] = None) -> bool:
+    def validate_video_source(self, event: Optional[tk.Event] = None,
+                              source: Optional[str] = None) -> bool:
         """
         Validate that the video source path exists and is accessible.
         
@@ -857,6 +1529,8 @@ class PowerHourGUI(tk.Tk):
         
         Args:
             event: Optional Tkinter event (for event binding)
+            source: Source text already read by the caller; read from the
+                field if omitted
             
         Returns:
             bool: True if valid, False otherwise
@@ -864,22 +1538,21 @@ class PowerHourGUI(tk.Tk):
         Complexity: O(1)
         Flow: Called on focus out, selection, or manual validation
         """
-        path = self.video_source_var.get()
-        if path:
-            # Check if it's a URL or a folder
-            if path.startswith("http"):
-                # URL validation (basic check)
-                self.video_source_combo.configure(style="Valid.TCombobox")
-                return True
-            elif os.path.isdir(path):
-                self.video_source_combo.configure(style="Valid.TCombobox")
-                return True
-            else:
-                self.video_source_combo.configure(style="Invalid.TCombobox")
-                return False
-        return False
+        path = self.video_source_var.get() if source is None else source
+        if not path:
+            return False
+        cached = self._recent_validation('video_source', path)
+        if cached is not None:
+            return cached
+        # Check if it's a URL (basic scheme check) or a folder
+        valid = path.startswith(URL_PREFIXES) or (
+            (mode := self._stat_mode_cached(path)) is not None and stat.S_ISDIR(mode)
+        )
+        self.video_source_combo.configure(style="Valid.TCombobox" if valid else "Invalid.TCombobox")
+        return self._remember_validation('video_source', path, valid)
     
-    def validate_common_clip(self, event: Optional[tk.Event] = None) -> bool:
+    def validate_common_clip(self, event: Optional[tk.Event] = None,
+                             path: Optional[str] = None) -> bool:
         """
         Validate that the common clip file exists and is accessible.
         
@@ -888,6 +1561,7 @@ class PowerHourGUI(tk.Tk):
         
         Args:
             event: Optional Tkinter event (for event binding)
+            path: Already-read clip path; read from the Tk variable if omitted
             
         Returns:
             bool: True if file exists, False otherwise
@@ -895,21 +1569,145 @@ class PowerHourGUI(tk.Tk):
         Complexity: O(1)
         Flow: Called on focus out, selection, or manual validation
         """
-        path = self.common_clip_var.get()
-        if path and os.path.isfile(path):
-            self.common_clip_combo.configure(style="Valid.TCombobox")
-            return True
-        elif path:
-            self.common_clip_combo.configure(style="Invalid.TCombobox")
+        if path is None:
+            path = self.common_clip_var.get()
+        if not path:
             return False
-        return False
+        cached = self._recent_validation('common_clip', path)
+        if cached is not None:
+            return cached
+        mode = self._stat_mode_cached(path)
+        valid = mode is not None and stat.S_ISREG(mode)
+        self.common_clip_combo.configure(style="Valid.TCombobox" if valid else "Invalid.TCombobox")
+        return self._remember_validation('common_clip', path, valid)
+    
+    def _recent_validation(self, field: str, value: str) -> Optional[bool]:
+        """
+        Result of validating the same field value moments ago, if any.
+        
+        Focus-out, selection and debounced typing re-validate unchanged
+        fields constantly; an unchanged value validated less than
+        _STAT_CACHE_TTL seconds ago already has the right style applied,
+        so its result is reused without touching the widget or the
+        filesystem. The TTL matches the stat cache so a folder or file
+        created meanwhile is still picked up.
+        
+        Args:
+            field: Validator field name
+            value: Current field text
+            
+        Returns:
+            Optional[bool]: Cached result, or None if it must be recomputed
+        """
+        last = self._last_validated.get(field)
+        if last is not None and last[0] == value and time.monotonic() - last[2] < self._STAT_CACHE_TTL:
+            return last[1]
+        return None
+    
+    def _remember_validation(self, field: str, value: str, result: bool) -> bool:
+        """Record a validation result for _recent_validation and return it."""
+        self._last_validated[field] = (value, result, time.monotonic())
+        return result
+    
+    def _stat_mode_cached(self, path: str) -> Optional[int]:
+        """
+        _stat_mode() with a short-lived per-path cache for the validators.
+        
+        Focus-out, selection and debounced typing often re-validate the
+        same unchanged path within moments; results younger than
+        _STAT_CACHE_TTL seconds are reused instead of hitting the
+        filesystem again. At most _STAT_CACHE_SIZE paths are kept, oldest
+        evicted first.
+        
+        Args:
+            path: Path to stat
+            
+        Returns:
+            Optional[int]: st_mode, or None if the path cannot be stat'ed
+            
+        Complexity: O(1)
+        Flow: Called by validate_video_source, validate_common_clip, validate_output_file
+        """
+        now = time.monotonic()
+        cached = self._stat_cache.get(path)
+        if cached is not None and now - cached[0] < self._STAT_CACHE_TTL:
+            return cached[1]
+        
+        mode = _stat_mode(path)
+        self._stat_cache.pop(path, None)
+        if len(self._stat_cache) >= self._STAT_CACHE_SIZE:
+            del self._stat_cache[next(iter(self._stat_cache))]
+        self._stat_cache[path] = (now, mode)
+        return mode
+    
+    def _schedule_validation(self, field: str) -> None:
+        """
+        Queue a field for validation once typing pauses.
+        
+        All fields share one pending set and a single after() token. A
+        keystroke only adds its field and records the time; the timer is
+        armed if idle, and _check_validation_deadline re-arms it for the
+        remainder of the window instead of each keystroke paying an
+        after_cancel()/after() pair. A burst of typing (even across fields)
+        results in one flush and one (possibly slow, e.g. network path)
+        filesystem probe per field.
+        
+        Args:
+            field: Field name; validate_<field> runs on flush
+            
+        Returns:
+            None
+            
+        Complexity: O(1)
+        Flow: Called by the *_realtime validators on each keystroke
+        """
+        self._pending_validations.add(field)
+        self._last_keystroke = time.monotonic()
+        if self._validation_after_id is None:
+            self._validation_after_id = self.after(self._VALIDATION_DEBOUNCE_MS,
+                                                   self._check_validation_deadline)
+    
+    def _check_validation_deadline(self) -> None:
+        """
+        Flush pending validations once typing has paused long enough.
+        
+        If a keystroke arrived while the timer was running, re-arm it for
+        the rest of the debounce window measured from that keystroke.
+        
+        Returns:
+            None
+            
+        Complexity: O(1) plus the flush
+        Flow: Called by the shared debounce after() token
+        """
+        remaining_ms = self._VALIDATION_DEBOUNCE_MS - (time.monotonic() - self._last_keystroke) * 1000
+        if remaining_ms > 0:
+            self._validation_after_id = self.after(max(1, int(remaining_ms)), self._check_validation_deadline)
+        else:
+            self._flush_validations()
+    
+    def _flush_validations(self) -> None:
+        """
+        Run the validators for every field queued by _schedule_validation.
+        
+        Returns:
+            None
+            
+        Complexity: O(k) where k is number of distinct pending fields (≤ 3)
+        Flow: Called by _check_validation_deadline once the window has passed
+        """
+        pending = self._pending_validations
+        self._pending_validations = set()
+        self._validation_after_id = None
+        for field in pending:
+            getattr(self, f"validate_{field}")()
     
     def validate_video_source_realtime(self, event: Optional[tk.Event] = None) -> bool:
         """
         Real-time validation for video source with debouncing.
         
-        Implements a 500ms debounce to avoid excessive validation during typing.
-        Cancels previous validation timer if still pending.
+        Implements a 250ms debounce to avoid excessive validation during typing.
+        Validation runs once no keystroke has arrived for that long.
         
         Args:
             event: Optional Tkinter event (for event binding)
@@ -920,20 +1718,15 @@ class PowerHourGUI(tk.Tk):
         Complexity: O(1)
         Flow: Called on each keystroke in video source field
         """
-        # Cancel previous validation timer if exists
-        if hasattr(self, '_video_source_timer'):
-            self.after_cancel(self._video_source_timer)
-        
-        # Schedule validation after 500ms of no typing
-        self._video_source_timer = self.after(500, self.validate_video_source)
+        self._schedule_validation("video_source")
         return True
     
     def validate_common_clip_realtime(self, event: Optional[tk.Event] = None) -> bool:
         """
         Real-time validation for common clip with debouncing.
         
-        Implements a 500ms debounce to avoid excessive validation during typing.
-        Cancels previous validation timer if still pending.
+        Implements a 250ms debounce to avoid excessive validation during typing.
+        Validation runs once no keystroke has arrived for that long.
         
         Args:
             event: Optional Tkinter event (for event binding)
@@ -944,15 +1737,11 @@ class PowerHourGUI(tk.Tk):
         Complexity: O(1)
         Flow: Called on each keystroke in common clip field
         """
-        # Cancel previous validation timer if exists
-        if hasattr(self, '_common_clip_timer'):
-            self.after_cancel(self._common_clip_timer)
-        
-        # Schedule validation after 500ms of no typing
-        self._common_clip_timer = self.after(500, self.validate_common_clip)
+        self._schedule_validation("common_clip")
         return True
     
-    def validate_fade_duration(self, event: Optional[tk.Event] = None) -> bool:
+    def validate_fade_duration(self, event: Optional[tk.Event] = None,
+                               value: Optional[float] = None) -> bool:
         """
         Validate fade duration is within acceptable range (0-10 seconds).
         
@@ -961,6 +1750,7 @@ class PowerHourGUI(tk.Tk):
         
         Args:
             event: Optional Tkinter event (for event binding)
+            value: Already-parsed duration; read from the Tk variable if omitted
             
         Returns:
             bool: True if valid, False otherwise
@@ -968,24 +1758,41 @@ class PowerHourGUI(tk.Tk):
         Complexity: O(1)
         Flow: Called on value change or focus out
         """
-        try:
-            value = self.fade_duration_var.get()
-            if 0 <= value <= 10:
-                self.fade_duration_spinbox.configure(style="Valid.TSpinbox")
-                self.hide_tooltip()
-                return True
-            else:
-                self.fade_duration_spinbox.configure(style="Invalid.TSpinbox")
-                self.show_tooltip(self.fade_duration_spinbox,
-                                "Fade duration must be between 0 and 10 seconds")
-                return False
-        except:
+        if value is None:
+            value = self._fade_duration_value()
+        if value is None:
             self.fade_duration_spinbox.configure(style="Invalid.TSpinbox")
             self.show_tooltip(self.fade_duration_spinbox,
                             "Invalid number format")
             return False
+        if 0 <= value <= 10:
+            self.fade_duration_spinbox.configure(style="Valid.TSpinbox")
+            self.hide_tooltip()
+            return True
+        else:
+            self.fade_duration_spinbox.configure(style="Invalid.TSpinbox")
+            self.show_tooltip(self.fade_duration_spinbox,
+                            "Fade duration must be between 0 and 10 seconds")
+            return False
+    
+    def _fade_duration_value(self) -> Optional[float]:
+        """
+        Parse the fade spinbox text directly.
+        
+        Avoids DoubleVar.get(), which raises TclError for anything that is
+        not a number, so valid input (the common case) never goes through
+        exception handling.
+        
+        Returns:
+            Optional[float]: Entered duration, or None if it is not a number
+        """
+        try:
+            return float(self.fade_duration_spinbox.get())
+        except ValueError:
+            return None
     
-    def validate_output_file(self, event: Optional[tk.Event] = None) -> bool:
+    def validate_output_file(self, event: Optional[tk.Event] = None,
+                             context: Optional[_OutputContext] = None) -> bool:
         """
         Validate output file path and directory permissions.
         
@@ -996,6 +1803,7 @@ class PowerHourGUI(tk.Tk):
         
         Args:
             event: Optional Tkinter event (for event binding)
+            context: Precomputed _output_context(); built here if omitted
             
         Returns:
             bool: True if path is valid/writable, False otherwise
@@ -1003,20 +1811,29 @@ class PowerHourGUI(tk.Tk):
         Complexity: O(1)
         Flow: Called on focus out or path change
         """
-        path = self.output_file_var.get()
+        if context is None:
+            context = self._output_context()
+        path = context.path
         if path:
             # Check if directory is writable
-            output_dir = os.path.dirname(path) or '.'
+            output_dir = context.directory
             
-            # Check file extension
-            if not path.endswith('.mp4'):
+            # Check file extension (case-insensitive, so OUT.MP4 is fine)
+            if os.path.splitext(path)[1].lower() != '.mp4':
                 self.output_file_combo.configure(style="Warning.TCombobox")
                 self.show_tooltip(self.output_file_combo,
                                 "Warning: Output should be .mp4 format")
                 return True  # Warning, not error
             
-            # Check if directory exists or can be created
-            if os.path.exists(output_dir):
+            # Check if directory exists or can be created (one stat; the
+            # access() check only runs once the directory is known to exist)
+            mode = context.dir_mode
+            if mode is not None:
+                if not stat.S_ISDIR(mode):
+                    self.output_file_combo.configure(style="Invalid.TCombobox")
+                    self.show_tooltip(self.output_file_combo,
+                                    "Output directory is not a folder")
+                    return False
                 if os.access(output_dir, os.W_OK):
                     self.output_file_combo.configure(style="Valid.TCombobox")
                     self.hide_tooltip()
@@ -1038,8 +1855,8 @@ class PowerHourGUI(tk.Tk):
         """
         Real-time validation for output file with debouncing.
         
-        Implements a 500ms debounce to avoid excessive validation during typing.
-        Cancels previous validation timer if still pending.
+        Implements a 250ms debounce to avoid excessive validation during typing.
+        Validation runs once no keystroke has arrived for that long.
         
         Args:
             event: Optional Tkinter event (for event binding)
@@ -1050,12 +1867,7 @@ class PowerHourGUI(tk.Tk):
         Complexity: O(1)
         Flow: Called on each keystroke in output file field
         """
-        # Cancel previous validation timer if exists
-        if hasattr(self, '_output_file_timer'):
-            self.after_cancel(self._output_file_timer)
-        
-        # Schedule validation after 500ms of no typing
-        self._output_file_timer = self.after(500, self.validate_output_file)
+        self._schedule_validation("output_file")
         return True
     
     def validate_url(self, url: str) -> bool:
@@ -1073,24 +1885,19 @@ class PowerHourGUI(tk.Tk):
         Returns:
             bool: True if URL format is valid, False otherwise
             
-        Complexity: O(1) - regex matching
+        Complexity: O(1) - regex matching against the module-level _URL_PATTERN
         Flow: Called by validate_video_source when URL detected
         """
-        # Basic URL pattern
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:www\.)?'  # optional www.
-            r'(?:youtube\.com|youtu\.be|'  # YouTube domains
-            r'vimeo\.com|dailymotion\.com)'  # Other supported sites
-        )
-        return bool(url_pattern.match(url))
+        return _URL_PATTERN.match(url) is not None
     
     def show_tooltip(self, widget: tk.Widget, message: str) -> None:
         """
         Show a tooltip near the specified widget.
         
-        Creates a temporary window with the message positioned near the widget.
-        Auto-hides after 5 seconds.
+        Shows the validation tooltip window with the message positioned
+        near the widget. The window is created once on first use and then
+        reused (withdrawn/deiconified) rather than rebuilt for every
+        message. Auto-hides after 5 seconds.
         
         Args:
             widget: The widget to show tooltip near
@@ -1102,32 +1909,38 @@ class PowerHourGUI(tk.Tk):
         Complexity: O(1)
         Flow: Called when validation fails or help needed
         """
-        if hasattr(self, '_tooltip'):
-            self.hide_tooltip()
+        if self._tooltip is None:
+            self._tooltip = tk.Toplevel(self)
+            self._tooltip.wm_overrideredirect(True)
+            self._tooltip.withdraw()
+            self._tooltip_label = ttk.Label(self._tooltip,
+                                            background="lightyellow",
+                                            relief="solid",
+                                            borderwidth=1,
+                                            font=("Arial", 9))
+            self._tooltip_label.pack()
         
-        self._tooltip = tk.Toplevel(self)
-        self._tooltip.wm_overrideredirect(True)
+        # Restart the auto-hide timer for the new message
+        if self._tooltip_after_id is not None:
+            self.after_cancel(self._tooltip_after_id)
         
         # Position tooltip near the widget
         x = widget.winfo_rootx() + widget.winfo_width() + 5
         y = widget.winfo_rooty() + widget.winfo_height() // 2
+        self._tooltip_label.config(text=message)
         self._tooltip.wm_geometry(f"+{x}+{y}")
-        
-        label = ttk.Label(self._tooltip, text=message,
-                         background="lightyellow",
-                         relief="solid",
-                         borderwidth=1,
-                         font=("Arial", 9))
-        label.pack()
+        self._tooltip.deiconify()
+        self._tooltip_visible = True
         
         # Auto-hide after 5 seconds
-        self._tooltip.after(5000, self.hide_tooltip)
+        self._tooltip_after_id = self.after(5000, self.hide_tooltip)
     
     def hide_tooltip(self) -> None:
         """
-        Hide the current tooltip if one exists.
+        Hide the current tooltip if one is showing.
         
-        Destroys the tooltip window and removes the reference.
+        Withdraws the tooltip window (kept for reuse) and cancels any
+        pending auto-hide.
         
         Returns:
             None
@@ -1135,42 +1948,165 @@ class PowerHourGUI(tk.Tk):
         Complexity: O(1)
         Flow: Called after timeout or when tooltip no longer needed
         """
-        if hasattr(self, '_tooltip'):
-            self._tooltip.destroy()
-            delattr(self, '_tooltip')
+        if self._tooltip_after_id is not None:
+            self.after_cancel(self._tooltip_after_id)
+            self._tooltip_after_id = None
+        if self._tooltip_visible:
+            self._tooltip.withdraw()
+            self._tooltip_visible = False
+    
+    def _output_context(self, path: Optional[str] = None) -> _OutputContext:
+        """
+        Read the output path once and stat its directory once.
+        
+        Lets validate_all_inputs share one Tk variable read and one stat
+        between its own checks, validate_output_file and check_disk_space.
+        
+        Args:
+            path: Already-read output path; read from the Tk variable if omitted
+            
+        Returns:
+            _OutputContext: Output path, its directory ('.' if none) and
+            the directory's st_mode (None if it doesn't exist)
+            
+        Complexity: O(1)
+        Flow: Called by validate_all_inputs, validate_output_file, check_disk_space
+        """
+        if path is None:
+            path = self.output_file_var.get()
+        directory = os.path.dirname(path) or '.'
+        return _OutputContext(path, directory, self._stat_mode_cached(directory))
     
-    def check_disk_space(self) -> bool:
+    def _disk_free_bytes(self, directory: str) -> int:
+        """
+        Free bytes on the filesystem holding a directory, cached briefly.
+        
+        Results younger than _DISK_CACHE_TTL seconds are reused, so the
+        validate-then-confirm sequence around a Start click only queries
+        the filesystem once per directory.
+        
+        Args:
+            directory: Existing directory to query
+            
+        Returns:
+            int: Free bytes available
+            
+        Complexity: O(1)
+        Flow: Called by check_disk_space
+        """
+        now = time.monotonic()
+        cached = self._disk_cache.get(directory)
+        if cached is not None and now - cached[0] < self._DISK_CACHE_TTL:
+            return cached[1]
+        free = shutil.disk_usage(directory).free
+        self._disk_cache[directory] = (now, free)
+        return free
+    
+    def check_disk_space(self, context: Optional[_OutputContext] = None) -> bool:
         """
         Check available disk space for output file.
         
         Warns user if less than 5GB free space available, as PowerHour
         videos can be 1-3GB in size.
         
+        Args:
+            context: Precomputed _output_context(); built here if omitted
+        
+        Returns:
+            bool: True if sufficient space or user chooses to continue, False otherwise
+            
+        Complexity: O(1)
+        Flow: Called during input validation before processing
+        """
+        if context is None:
+            context = self._output_context()
+        if context.path:
+            output_dir = context.directory
+            if context.dir_mode is not None:
+                free_gb = self._disk_free_bytes(output_dir) / (1024 ** 3)
+                
+                # Warn if less than 5GB free
+                if free_gb < 5:
+                    self.log_warning(f"Low disk space: {free_gb:.1f} GB free")
+                    return messagebox.askyesno(
+                        "Low Disk Space",
+                        f"Only {free_gb:.1f} GB free space available.\n"
+                        "PowerHour videos can be 1-3 GB. Continue anyway?"
+                    )
+        return True
+    
+    def _read_inputs(self) -> Dict[str, Any]:
+        """
+        Read every processing input from its Tk variable exactly once.
+        
+        Returns:
+            Dict[str, Any]: ProcessorThread parameters. fade_duration is
+            None if the spinbox text is not a number.
+            
+        Complexity: O(1)
+        Flow: Called by start_processing (and validate_all_inputs if not given params)
+        """
+        return {
+            'video_source': self.video_source_var.get(),
+            'common_clip': self.common_clip_var.get(),
+            'fade_duration': self._fade_duration_value(),
+            'output_file': self.output_file_var.get(),
+            'video_quality': self.video_quality_var.get(),
+            'audio_normalization': self.audio_normalization_var.get(),
+            'audio_normalization_mode': (
+                'single_pass'
+                if self.expert_mode_var.get() and self.fast_normalization_var.get()
+                else 'two_pass'
+            ),
+            'output_format': self.output_format_var.get()
+        }
+    
+    def _full_validate(self, params: Dict[str, Any]) -> Tuple[List[str], _OutputContext]:
+        """
+        Run every field check once against an input snapshot.
+        
+        Each field is validated exactly once (one stat per path, shared with
+        the realtime validators through _stat_mode_cached), and every field's
+        style is updated even when an earlier one fails.
+        
+        Args:
+            params: Snapshot from _read_inputs()
+            
         Returns:
-            bool: True if sufficient space or user chooses to continue, False otherwise
+            Tuple[List[str], _OutputContext]: Error messages in field order
+            (empty if all fields are valid) and the output path context
             
         Complexity: O(1)
-        Flow: Called during input validation before processing
+        Flow: Called by validate_all_inputs
         """
-        output_path = self.output_file_var.get()
-        if output_path:
-            output_dir = os.path.dirname(output_path) or '.'
-            if os.path.exists(output_dir):
-                import shutil
-                stats = shutil.disk_usage(output_dir)
-                free_gb = stats.free / (1024 ** 3)
-                
-                # Warn if less than 5GB free
-                if free_gb < 5:
-                    self.log_warning(f"Low disk space: {free_gb:.1f} GB free")
-                    return messagebox.askyesno(
-                        "Low Disk Space",
-                        f"Only {free_gb:.1f} GB free space available.\n"
-                        "PowerHour videos can be 1-3 GB. Continue anyway?"
-                    )
-        return True
+        errors = []
+        
+        # Video source (URLs are accepted by scheme; anything else must be a folder)
+        source = params['video_source']
+        if not source:
+            errors.append("Please select a video source")
+        elif not self.validate_video_source(source=source):
+            errors.append("Invalid video source path")
+        
+        # Common clip
+        clip = params['common_clip']
+        if not clip:
+            errors.append("Please select a common clip")
+        elif not self.validate_common_clip(path=clip):
+            errors.append("Common clip file not found")
+        
+        # Output file (one stat shared with the directory and disk space checks)
+        output = self._output_context(params['output_file'])
+        if not output.path:
+            errors.append("Please specify an output file")
+        
+        # Fade duration
+        if not self.validate_fade_duration(value=params['fade_duration']):
+            errors.append("Fade duration must be between 0 and 10 seconds")
+        
+        return errors, output
     
-    def validate_all_inputs(self) -> bool:
+    def validate_all_inputs(self, params: Optional[Dict[str, Any]] = None) -> bool:
         """
         Validate all inputs before starting video processing.
         
@@ -1181,60 +2117,51 @@ class PowerHourGUI(tk.Tk):
         - Output directory writable
         - Sufficient disk space
         
-        Shows error dialogs for any validation failures.
+        Field checks run once through _full_validate; the first failure
+        is shown in an error dialog.
         
+        Args:
+            params: Snapshot from _read_inputs(); taken here if omitted
+            
         Returns:
             bool: True if all inputs valid, False otherwise
             
         Complexity: O(1)
         Flow: Called by start_processing before beginning work
         """
-        # Check video source
-        if not self.video_source_var.get():
-            messagebox.showerror("Input Error", "Please select a video source")
-            return False
-        
-        if not self.validate_video_source():
-            if self.video_source_var.get().startswith('http'):
-                if not self.validate_url(self.video_source_var.get()):
-                    messagebox.showerror("Input Error",
-                                       "Invalid URL format. Supported: YouTube, Vimeo, Dailymotion")
-                    return False
-            else:
-                messagebox.showerror("Input Error", "Invalid video source path")
-                return False
-        
-        # Check common clip
-        if not self.common_clip_var.get():
-            messagebox.showerror("Input Error", "Please select a common clip")
-            return False
-        
-        if not self.validate_common_clip():
-            messagebox.showerror("Input Error", "Common clip file not found")
-            return False
+        if params is None:
+            params = self._read_inputs()
         
-        # Check output file
-        if not self.output_file_var.get():
-            messagebox.showerror("Input Error", "Please specify an output file")
+        errors, output = self._full_validate(params)
+        if errors:
+            messagebox.showerror("Input Error", errors[0])
             return False
         
-        # Validate fade duration
-        if not self.validate_fade_duration():
-            messagebox.showerror("Input Error",
-                               "Fade duration must be between 0 and 10 seconds")
-            return False
+        # List a local source folder once; ProcessorThread reuses the listing
+        source = params['video_source']
+        if list_video_files is not None and not source.startswith(URL_PREFIXES):
+            try:
+                video_files = list_video_files(source)
+            except OSError as e:
+                messagebox.showerror("Input Error", f"Cannot read video source folder: {e}")
+                return False
+            if not video_files:
+                messagebox.showerror("Input Error", "No video files found in the specified directory")
+                return False
+            params['preloaded_files'] = video_files
         
         # Check output directory is writable
-        output_dir = os.path.dirname(self.output_file_var.get())
-        if output_dir and not os.path.exists(output_dir):
+        if output.dir_mode is None:
             try:
-                os.makedirs(output_dir, exist_ok=True)
+                os.makedirs(output.directory, exist_ok=True)
             except Exception as e:
                 messagebox.showerror("Output Error", f"Cannot create output directory: {e}")
                 return False
+            self._stat_cache.pop(output.directory, None)
+            output = self._output_context(output.path)
         
         # Check disk space
-        if not self.check_disk_space():
+        if not self.check_disk_space(output):
             return False
         
         return True
@@ -1253,25 +2180,29 @@ class PowerHourGUI(tk.Tk):
         Flow: Called when user clicks Start Processing button
         Dependencies: Requires ProcessorThread from powerhour_processor module
         """
+        if ProcessorThread is None:
+            self.show_error_dialog(
+                "Processor Unavailable",
+                "The video processor could not be loaded, so processing cannot start. "
+                "Please ensure powerhour_processor.py and ytdlp_updater.py are present.",
+                details=_WORKER_IMPORT_ERROR
+            )
+            return
+        
         try:
-            # Validate inputs first
-            if not self.validate_all_inputs():
+            # Snapshot every input once; validation and the worker share it
+            params = self._read_inputs()
+            if not self.validate_all_inputs(params):
                 return
+            params['temp_root'] = self._temp_root()
             
             self.log_info("Starting video processing...")
             self.status_var.set("Processing...")
-            self.start_button.config(state="disabled")
-            self.cancel_button.config(state="normal")
-
-            # Disable input fields during processing
-            self.video_source_combo.config(state="disabled")
-            self.common_clip_combo.config(state="disabled")
-            self.fade_duration_spinbox.config(state="disabled")
-            self.output_file_combo.config(state="disabled")
-
-            # Disable the yt-dlp action button for the duration of processing.
+            # Swap Start/Cancel and disable the inputs and the yt-dlp action
+            # button for the duration of processing in one pass.
             self._processing_active = True
-            self.ytdlp_action_button.config(state="disabled")
+            self._set_states(self._control_states(processing=True)
+                             + [(self.ytdlp_action_button, "disabled")])
             
             # Reset progress bars
             self.current_progress_var.set(0)
@@ -1280,24 +2211,13 @@ class PowerHourGUI(tk.Tk):
             self.overall_progress_label.config(text="0/60 videos")
             self.eta_var.set("")
             
-            # Prepare parameters
-            params = {
-                'video_source': self.video_source_var.get(),
-                'common_clip': self.common_clip_var.get(),
-                'fade_duration': self.fade_duration_var.get(),
-                'output_file': self.output_file_var.get(),
-                'video_quality': self.video_quality_var.get(),
-                'audio_normalization': self.audio_normalization_var.get(),
-                'output_format': self.output_format_var.get()
-            }
-            
             # Create and start processor thread
             self.processing_thread = ProcessorThread(self.message_queue, params)
             self.processing_thread.start()
             
-            # Start time tracking for ETA
-            self.processing_start_time = time.time()
-            self.videos_processed = 0
+            # Start time tracking for ETA with fresh per-run state
+            self._progress_state = _ProgressState()
+            self._progress_state.start_time = time.time()
             
         except Exception as e:
             self.handle_error(e, "Failed to start processing")
@@ -1373,8 +2293,8 @@ class PowerHourGUI(tk.Tk):
         self.add_to_recent('common_clips', self.common_clip_var.get())
         self.add_to_recent('outputs', self.output_file_var.get())
         
-        # Save configuration
-        self.save_config()
+        # Save configuration (coalesced with any other change this second)
+        self.mark_config_dirty()
         
         # Reset UI state
         self.reset_ui_state()
@@ -1396,12 +2316,7 @@ class PowerHourGUI(tk.Tk):
         Complexity: O(1)
         Flow: Called after processing completes, cancels, or errors
         """
-        self.start_button.config(state="normal")
-        self.cancel_button.config(state="disabled")
-        self.video_source_combo.config(state="normal")
-        self.common_clip_combo.config(state="normal")
-        self.fade_duration_spinbox.config(state="normal")
-        self.output_file_combo.config(state="normal")
+        self._set_states(self._control_states(processing=False))
         self._processing_active = False
         # Re-enable the yt-dlp action button only when no updater is in flight.
         # If an updater is still running, _handle_ytdlp_update_complete will
@@ -1409,6 +2324,30 @@ class PowerHourGUI(tk.Tk):
         if not self._ytdlp_update_in_progress:
             self._set_ytdlp_button_enabled_for_status()
 
+    def _control_states(self, processing: bool) -> List[Tuple[Any, str]]:
+        """Return (widget, state) pairs for the run controls and input fields."""
+        inputs = "disabled" if processing else "normal"
+        cancel = "normal" if processing else "disabled"
+        return [
+            (self.start_button, inputs),
+            (self.cancel_button, cancel),
+            (self.video_source_combo, inputs),
+            (self.common_clip_combo, inputs),
+            (self.fade_duration_spinbox, inputs),
+            (self.output_file_combo, inputs),
+            (self.fast_normalization_check, inputs),
+        ]
+
+    def _set_states(self, widget_states: Iterable[Tuple[Any, str]]) -> None:
+        """
+        Apply a batch of widget state changes without yielding to the event loop.
+
+        Every change is issued back to back, so Tk repaints the affected widgets
+        once on the next idle pass instead of once per widget.
+        """
+        for widget, state in widget_states:
+            widget.configure(state=state)
+
     def _set_ytdlp_button_enabled_for_status(self) -> None:
         """Enable the yt-dlp action button based on the most recent status."""
         if self._processing_active or self._ytdlp_update_in_progress:
@@ -1504,16 +2443,40 @@ class PowerHourGUI(tk.Tk):
             return
         method = self._ytdlp_status.get('install_method')
         if method == 'missing':
+            import webbrowser  # rarely needed; kept out of GUI startup
             try:
                 webbrowser.open(YTDLP_INSTALL_DOCS_URL)
             except Exception as e:
                 self.log_error(f"Could not open install docs: {e}")
             return
+        if YtDlpUpdaterThread is None:
+            return
         self._ytdlp_update_in_progress = True
         self.ytdlp_action_button.config(state="disabled")
         YtDlpUpdaterThread(self.message_queue, mode='check_and_upgrade').start()
     
     def process_queue(self) -> None:
+        """
+        Poll the thread communication queue and reschedule.
+        
+        Drains pending messages via _drain_queue, then reschedules itself:
+        every _QUEUE_POLL_ACTIVE_MS while work is in flight (processing,
+        a yt-dlp upgrade, or messages arrived this tick), and every
+        _QUEUE_POLL_IDLE_MS otherwise so an idle window wakes the Tk
+        interpreter only twice a second. Worker threads never touch Tk, so
+        polling (rather than generating Tk events from workers) stays.
+        
+        Returns:
+            None
+            
+        Complexity: O(m) where m is number of messages drained (≤ 256)
+        Flow: Called every 100ms (500ms when idle) via after() scheduling
+        """
+        handled = self._drain_queue()
+        busy = handled or self._processing_active or self._ytdlp_update_in_progress
+        self.after(self._QUEUE_POLL_ACTIVE_MS if busy else self._QUEUE_POLL_IDLE_MS, self.process_queue)
+    
+    def _drain_queue(self) -> int:
         """
         Process messages from the thread communication queue.
         
@@ -1521,6 +2484,13 @@ class PowerHourGUI(tk.Tk):
         updates the UI accordingly. Handles progress updates, status messages,
         logs, errors, and completion notifications.
         
+        Each tick drains at most _QUEUE_DRAIN_LIMIT messages so a chatty
+        worker cannot starve the event loop. Consecutive log messages are
+        buffered and written to the log widget in one insert, and for
+        'progress', 'status' and 'video_progress' only the newest message
+        of each type is applied. Buffers are flushed before any other
+        message type so ordering is preserved.
+        
         Message types handled:
         - 'progress': Update overall progress
         - 'status': Update status message
@@ -1530,63 +2500,45 @@ class PowerHourGUI(tk.Tk):
         - 'error': Processing error occurred
         
         Returns:
-            None
+            int: Number of messages handled
             
-        Complexity: O(m) where m is number of messages in queue
-        Flow: Called every 100ms via after() scheduling
+        Complexity: O(m) where m is number of messages drained (≤ 256)
+        Flow: Called by process_queue, and via after_idle when the GUI
+            itself logs from the main thread (see log_message)
         """
+        self._drain_scheduled = False
+        pending_logs = []
+        latest = {}
+        handled = 0
         try:
-            while True:
+            for _ in range(self._QUEUE_DRAIN_LIMIT):
                 message = self.message_queue.get_nowait()
+                handled += 1
                 
-                if message['type'] == 'progress':
-                    # Update progress bars
-                    current = message.get('current', 0)
-                    total = message.get('total', 60)
-                    # Track the actual total — Progressbar's `maximum` was
-                    # hardcoded to 60 at construction, but the real total
-                    # depends on how many videos the processor selected
-                    # (e.g., a small folder yields fewer than 60).
-                    self.overall_progress_bar.config(maximum=max(total, 1))
-                    self.overall_progress_var.set(current)
-                    self.overall_progress_label.config(text=f"{current}/{total} videos")
-                    self.videos_processed = current
-                    
-                    # Update ETA and speed
-                    self.update_eta(current, total)
-                    self.update_processing_speed(current)
-                    
-                elif message['type'] == 'status':
-                    # Update status
-                    status = message['message']
-                    self.status_var.set(status)
-                    self.operation_label.config(text=status)
-                    self.update_processing_stage(status)
-                    
-                elif message['type'] == 'log':
-                    # Add to log
+                if message['type'] == 'log':
+                    # Buffer log lines; written in one insert below
                     level = message.get('level', 'info')
                     msg = message['message']
-                    if level == 'warning':
-                        self.log_warning(msg)
-                    elif level == 'error':
-                        self.log_error(msg)
-                    else:
-                        self.log_info(msg)
+                    pending_logs.append((msg, level if level in ('warning', 'error') else 'info'))
                     
                     # Update current file if mentioned
                     if 'Processing:' in msg or 'Analyzing:' in msg:
-                        filename = msg.split(':')[-1].strip() if ':' in msg else ""
+                        # The marker guarantees a colon; keep only the text after the last one
+                        filename = msg.rpartition(':')[2].strip()
                         if filename:
+                            self._progress_state.current_file = filename
                             self.current_file_label.config(text=filename[:50])
-                        
-                elif message['type'] == 'video_progress':
-                    # Update current video progress
-                    percent = message.get('percent', 0)
-                    self.current_progress_var.set(percent)
-                    self.current_progress_label.config(text=f"{percent:.0f}%")
-                    
-                elif message['type'] == 'complete':
+                    continue
+                
+                if message['type'] in self._COALESCED_MESSAGE_TYPES:
+                    # Superseded by any newer message of the same type
+                    latest[message['type']] = message
+                    continue
+                
+                # Keep buffered output ordered relative to everything else
+                self._flush_queue_batch(pending_logs, latest)
+                
+                if message['type'] == 'complete':
                     # Processing complete
                     self.on_processing_complete()
 
@@ -1599,7 +2551,7 @@ class PowerHourGUI(tk.Tk):
                 elif message['type'] == 'error':
                     # Show error
                     error_msg = message['message']
-                    self.log_error(error_msg)
+                    self._append_log_lines([(error_msg, 'error')])
                     self.log_to_file("error", f"Processing error: {error_msg}")
                     
                     # Get user-friendly message
@@ -1613,8 +2565,74 @@ class PowerHourGUI(tk.Tk):
         except queue.Empty:
             pass
         
-        # Schedule next check
-        self.after(100, self.process_queue)
+        self._flush_queue_batch(pending_logs, latest)
+        return handled
+    
+    def _flush_queue_batch(self, pending_logs: list, latest: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Write buffered log lines and apply coalesced progress/status updates.
+        
+        Both buffers are cleared in place so _drain_queue can keep using
+        them for the rest of the drain.
+        
+        Args:
+            pending_logs: (message, tag) tuples awaiting display
+            latest: Newest message per coalesced message type
+            
+        Returns:
+            None
+            
+        Complexity: O(n) where n is number of buffered log lines
+        Flow: Called by _drain_queue before non-coalesced messages and after each drain
+        """
+        self._append_log_lines(pending_logs)
+        pending_logs.clear()
+        for message in latest.values():
+            self._apply_progress_message(message)
+        latest.clear()
+    
+    def _apply_progress_message(self, message: Dict[str, Any]) -> None:
+        """
+        Apply a 'progress', 'status' or 'video_progress' message to the UI.
+        
+        Args:
+            message: Queue message of one of the coalesced types
+            
+        Returns:
+            None
+            
+        Complexity: O(1)
+        Flow: Called by _flush_queue_batch at most once per type per tick
+        """
+        if message['type'] == 'progress':
+            # Update progress bars
+            current = message.get('current', 0)
+            total = message.get('total', 60)
+            # Track the actual total — Progressbar's `maximum` was
+            # hardcoded to 60 at construction, but the real total
+            # depends on how many videos the processor selected
+            # (e.g., a small folder yields fewer than 60).
+            self.overall_progress_bar.config(maximum=max(total, 1))
+            self.overall_progress_var.set(current)
+            self.overall_progress_label.config(text=f"{current}/{total} videos")
+            self._progress_state.videos_processed = current
+            
+            # Update ETA and speed
+            self.update_eta(current, total)
+            self.update_processing_speed(current)
+            
+        elif message['type'] == 'status':
+            # Update status
+            status = message['message']
+            self.status_var.set(status)
+            self.operation_label.config(text=status)
+            self.update_processing_stage(status)
+            
+        elif message['type'] == 'video_progress':
+            # Update current video progress
+            percent = message.get('percent', 0)
+            self.current_progress_var.set(percent)
+            self.current_progress_label.config(text=f"{percent:.0f}%")
     
     def update_processing_speed(self, current: int) -> None:
         """
@@ -1632,16 +2650,19 @@ class PowerHourGUI(tk.Tk):
         Complexity: O(1)
         Flow: Called when overall progress updates
         """
-        if current > 0 and self.processing_start_time:
-            elapsed = time.time() - self.processing_start_time
+        state = self._progress_state
+        if current > 0 and state.start_time:
+            elapsed = time.time() - state.start_time
             videos_per_minute = (current / elapsed) * 60
-            self.processing_speed.append(videos_per_minute)
-            
-            # Keep only last 10 measurements for average
-            if len(self.processing_speed) > 10:
-                self.processing_speed.pop(0)
-            
-            avg_speed = sum(self.processing_speed) / len(self.processing_speed)
+            # Bounded deque keeps only the last 10 measurements for average;
+            # the running sum makes the average O(1)
+            window = state.speed_window
+            if len(window) == window.maxlen:
+                state.speed_sum -= window[0]
+            window.append(videos_per_minute)
+            state.speed_sum += videos_per_minute
+            
+            avg_speed = state.speed_sum / len(window)
             self.speed_label.config(text=f"{avg_speed:.1f} videos/minute")
     
     def update_processing_stage(self, status: str) -> None:
@@ -1662,29 +2683,26 @@ class PowerHourGUI(tk.Tk):
         Returns:
             None
             
-        Complexity: O(1)
+        Complexity: O(n) in status length - one precompiled regex search
         Flow: Called when status messages are received
         """
-        stage_map = {
-            "Initializing": ("Initializing", "lightblue"),
-            "Downloading": ("Downloading", "yellow"),
-            "Analyzing": ("Analyzing", "orange"),
-            "Processing": ("Encoding", "green"),
-            "Concatenating": ("Finalizing", "blue"),
-            "Complete": ("Complete", "darkgreen")
-        }
-        
-        for key, (stage, color) in stage_map.items():
-            if key in status:
-                self.processing_stage_label.config(text=stage)
-                # Could add color if using a Canvas widget
-                break
+        match = _STAGE_RE.search(status)
+        if match:
+            stage, color = _STAGE_MAP[match.group()]
+            self._progress_state.stage = stage
+            self.processing_stage_label.config(text=stage)
+            # Could add color if using a Canvas widget
     
     def update_eta(self, current: int, total: int) -> None:
         """
         Update ETA (Estimated Time to Arrival) based on processing speed.
         
-        Calculates remaining time based on average time per video so far.
+        Calculates remaining time from the average duration of the last 16
+        videos, kept as a rolling window with a running sum so each update
+        is O(1). A tick covering several videos (parallel encodes, coalesced
+        progress) adds its per-video time once per video. The window
+        restarts when the processor's counter does (each pass opens with a
+        0/N tick, so the first durations are measured from the pass start).
         Formats as "~X minutes Y seconds remaining".
         
         Args:
@@ -1697,9 +2715,32 @@ class PowerHourGUI(tk.Tk):
         Complexity: O(1)
         Flow: Called when progress updates
         """
-        if current > 0 and hasattr(self, 'processing_start_time'):
-            elapsed = time.time() - self.processing_start_time
-            avg_time_per_video = elapsed / current
+        state = self._progress_state
+        now = time.time()
+        if current < state.last_tick_current:
+            # Counter restarted (analysis pass → encoding pass): new window
+            state.eta_window.clear()
+            state.eta_sum = 0.0
+            state.last_tick_time = None
+            self.eta_var.set("")
+        
+        if state.last_tick_time is not None and current > state.last_tick_current:
+            # Spread the time since the last tick over the videos it covered,
+            # one sample per video
+            covered = current - state.last_tick_current
+            per_video = (now - state.last_tick_time) / covered
+            window = state.eta_window
+            for _ in range(min(covered, window.maxlen)):
+                if len(window) == window.maxlen:
+                    state.eta_sum -= window[0]
+                window.append(per_video)
+                state.eta_sum += per_video
+        if state.last_tick_time is None or current != state.last_tick_current:
+            state.last_tick_time = now
+            state.last_tick_current = current
+        
+        if state.eta_window:
+            avg_time_per_video = state.eta_sum / len(state.eta_window)
             remaining_videos = total - current
             eta_seconds = remaining_videos * avg_time_per_video
             
@@ -1716,58 +2757,34 @@ class PowerHourGUI(tk.Tk):
         """
         Setup custom TTK styles for validation indicators.
         
-        Creates custom styles for Entry, Spinbox, and Combobox widgets:
+        Creates custom styles for the Spinbox and Combobox inputs from
+        _VALIDATION_STYLES / _VALIDATION_COLORS:
         - Valid (green): Input is valid
         - Invalid (red): Input has errors
         - Warning (orange): Input has warnings but may proceed
         
+        Also defines the Start.TButton and Cancel.TButton styles used by
+        the control section, so build_* methods only reference style names.
+        
         Returns:
             None
             
         Complexity: O(1)
-        Flow: Called during application startup
+        Flow: Called once by __init__ before any build_* method
         """
-        style = ttk.Style()
-        
-        # Valid entry style (green border)
-        style.map("Valid.TEntry",
-                 fieldbackground=[("focus", "lightgreen"), ("!focus", "white")],
-                 bordercolor=[("focus", "green"), ("!focus", "green")])
-        
-        # Invalid entry style (red border)
-        style.map("Invalid.TEntry",
-                 fieldbackground=[("focus", "lightpink"), ("!focus", "white")],
-                 bordercolor=[("focus", "red"), ("!focus", "red")])
-        
-        # Warning entry style (orange border)
-        style.map("Warning.TEntry",
-                 fieldbackground=[("focus", "lightyellow"), ("!focus", "white")],
-                 bordercolor=[("focus", "orange"), ("!focus", "orange")])
-        
-        # Valid spinbox style
-        style.map("Valid.TSpinbox",
-                 fieldbackground=[("focus", "lightgreen"), ("!focus", "white")],
-                 bordercolor=[("focus", "green"), ("!focus", "green")])
-        
-        # Invalid spinbox style
-        style.map("Invalid.TSpinbox",
-                 fieldbackground=[("focus", "lightpink"), ("!focus", "white")],
-                 bordercolor=[("focus", "red"), ("!focus", "red")])
-        
-        # Combobox styles
-        style.map("Valid.TCombobox",
-                 fieldbackground=[("focus", "lightgreen"), ("!focus", "white")],
-                 bordercolor=[("focus", "green"), ("!focus", "green")])
+        style = ttk.Style(self)
         
-        style.map("Invalid.TCombobox",
-                 fieldbackground=[("focus", "lightpink"), ("!focus", "white")],
-                 bordercolor=[("focus", "red"), ("!focus", "red")])
+        # Control buttons
+        style.configure("Start.TButton", foreground="green")
+        style.configure("Cancel.TButton", foreground="red")
         
-        style.map("Warning.TCombobox",
-                 fieldbackground=[("focus", "lightyellow"), ("!focus", "white")],
-                 bordercolor=[("focus", "orange"), ("!focus", "orange")])
-
-
+        # Validation styles, one style.map per style the inputs actually use
+        for style_name in _VALIDATION_STYLES:
+            border, focus_bg = _VALIDATION_COLORS[style_name.partition('.')[0]]
+            style.map(style_name,
+                     fieldbackground=[("focus", focus_bg), ("!focus", "white")],
+                     bordercolor=[("focus", border), ("!focus", border)])
+    
     def get_config_path(self) -> str:
         """
         Get the configuration file path based on the operating system.
@@ -1777,7 +2794,8 @@ class PowerHourGUI(tk.Tk):
         - macOS: ~/Library/Application Support/PowerHour/config.json
         - Linux: ~/.config/PowerHour/config.json
         
-        Creates directory if it doesn't exist.
+        Creates directory if it doesn't exist. The path is resolved once
+        per process and memoized.
         
         Returns:
             str: Full path to configuration file
@@ -1785,26 +2803,15 @@ class PowerHourGUI(tk.Tk):
         Complexity: O(1)
         Flow: Called during initialization
         """
-        system = platform.system()
-        
-        if system == "Windows":
-            config_dir = os.path.join(os.environ.get('APPDATA', ''), 'PowerHour')
-        elif system == "Darwin":  # macOS
-            config_dir = os.path.expanduser('~/Library/Application Support/PowerHour')
-        else:  # Linux and others
-            config_dir = os.path.expanduser('~/.config/PowerHour')
-        
-        # Create directory if it doesn't exist
-        os.makedirs(config_dir, exist_ok=True)
-        
-        return os.path.join(config_dir, 'config.json')
+        return _config_path()
     
     def get_default_config(self) -> Dict[str, Any]:
         """
         Get default configuration dictionary.
         
         Provides sensible defaults for all configuration options including
-        recent items lists, default values, and window geometry.
+        recent items lists, default values, and window geometry. Returns a
+        fresh mutable copy of the memoized defaults on every call.
         
         Returns:
             Dict[str, Any]: Default configuration dictionary
@@ -1813,15 +2820,8 @@ class PowerHourGUI(tk.Tk):
         Flow: Called during initialization if no config exists
         """
         return {
-            "recent_sources": [],
-            "recent_outputs": [],
-            "recent_common_clips": [],
-            "default_fade_duration": 3.0,
-            "last_video_source": "",
-            "last_common_clip": "",
-            "last_output_dir": "",
-            "window_geometry": "800x600",
-            "max_recent_items": 10
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in _default_config().items()
         }
     
     def load_config(self) -> None:
@@ -1838,12 +2838,14 @@ class PowerHourGUI(tk.Tk):
         Flow: Called during initialization
         """
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
-                    # Merge with defaults to ensure all keys exist
-                    self.app_config.update(loaded_config)
-                    # Don't log during init - log_text widget doesn't exist yet
+            loaded_config = _json_loads(Path(self.config_file).read_bytes())
+            # Merge with defaults to ensure all keys exist
+            self.app_config.update(loaded_config)
+            self._config_digest = hash(_json_dumps(self.app_config))
+            # Don't log during init - log_text widget doesn't exist yet
+        except FileNotFoundError:
+            # First run - keep defaults
+            pass
         except json.JSONDecodeError as e:
             # Don't log to UI during init - log_text widget doesn't exist yet
             self.log_to_file("error", f"Config load error: {e}")
@@ -1865,30 +2867,121 @@ class PowerHourGUI(tk.Tk):
         Flow: Called on window close and after processing completes
         """
         try:
-            # Update current values
-            self.app_config['last_video_source'] = self.video_source_var.get()
-            self.app_config['last_common_clip'] = self.common_clip_var.get()
-            
-            output_path = self.output_file_var.get()
-            if output_path:
-                self.app_config['last_output_dir'] = os.path.dirname(output_path)
-            
-            self.app_config['default_fade_duration'] = self.fade_duration_var.get()
-            
-            # Save window geometry
-            self.app_config['window_geometry'] = self.geometry()
-            
-            # Write to file
-            with open(self.config_file, 'w') as f:
-                json.dump(self.app_config, f, indent=4)
+            if not self._write_config_blob(self._snapshot_config()):
+                return
             
-            if hasattr(self, 'log_text'):
+            if self.log_text is not None:
                 self.log_info("Configuration saved")
         except Exception as e:
-            if hasattr(self, 'log_text'):
+            if self.log_text is not None:
                 self.log_warning(f"Could not save configuration: {e}")
             self.log_to_file("error", f"Config save error: {e}")
     
+    def mark_config_dirty(self) -> None:
+        """
+        Schedule a config save, coalescing changes made in quick succession.
+        
+        The first change arms a _CONFIG_SAVE_DELAY_MS timer; further
+        changes before it fires only set the dirty flag, so a burst of
+        updates (e.g. three recent lists after a run) costs one write.
+        on_closing still writes synchronously and cancels the timer.
+        
+        Returns:
+            None
+            
+        Complexity: O(1)
+        Flow: Called wherever app_config changes outside of shutdown
+        """
+        self._config_dirty = True
+        if self._config_save_after_id is None:
+            self._config_save_after_id = self.after(self._CONFIG_SAVE_DELAY_MS, self._flush_config)
+    
+    def _flush_config(self) -> None:
+        """
+        Write the config if it changed since the last save.
+        
+        Returns:
+            None
+            
+        Complexity: O(n) where n is size of configuration
+        Flow: Called by the after() timer armed in mark_config_dirty
+        """
+        self._config_save_after_id = None
+        if self._config_dirty:
+            self._config_dirty = False
+            self.save_config()
+    
+    def _snapshot_config(self) -> Dict[str, Any]:
+        """
+        Copy current widget values into the config and return a snapshot.
+        
+        Reads Tk variables and window geometry, so it must run on the Tk
+        main thread. The returned shallow copy can be handed to
+        _write_config_blob from any thread.
+        
+        Returns:
+            Dict[str, Any]: Snapshot of app_config
+            
+        Complexity: O(n) where n is number of top-level config keys
+        Flow: Called by save_config and on_closing
+        """
+        # Update current values
+        self.app_config['last_video_source'] = self.video_source_var.get()
+        self.app_config['last_common_clip'] = self.common_clip_var.get()
+        
+        output_path = self.output_file_var.get()
+        if output_path:
+            self.app_config['last_output_dir'] = os.path.dirname(output_path)
+        
+        self.app_config['default_fade_duration'] = self.fade_duration_var.get()
+        
+        # Save window geometry
+        self.app_config['window_geometry'] = self.geometry()
+        
+        return dict(self.app_config)
+    
+    def _write_config_blob(self, config: Dict[str, Any]) -> bool:
+        """
+        Serialize a config snapshot and atomically replace the config file.
+        
+        Writes to a temporary file next to the config and renames it into
+        place, so a crash mid-write never leaves a truncated config.json.
+        Skips the write entirely when the serialized snapshot matches what
+        was last loaded or written (_config_digest). Touches no Tk state
+        and is safe to call from a worker thread.
+        
+        Args:
+            config: Snapshot from _snapshot_config
+            
+        Returns:
+            bool: True if the file was written, False if it was unchanged
+            
+        Raises:
+            OSError: If the file cannot be written
+            
+        Complexity: O(n) where n is size of configuration
+        Flow: Called by save_config, and from a writer thread by on_closing
+        """
+        data = _json_dumps(config)
+        digest = hash(data)
+        if digest == self._config_digest:
+            return False
+        
+        tmp_path = self.config_file + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.config_file)
+        except BaseException:
+            # Don't leave a partial .tmp behind for the next save to trip over
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._config_digest = digest
+        return True
+    
     def add_to_recent(self, list_name: str, item: str) -> None:
         """
         Add an item to a recent items list.
@@ -1904,43 +2997,68 @@ class PowerHourGUI(tk.Tk):
         Returns:
             None
             
-        Complexity: O(n) where n is length of recent list
+        Complexity: O(1) to promote/evict, O(n) to refresh the dropdown snapshot
         Flow: Called after successful processing
         """
         if not item:
             return
         
         key = f'recent_{list_name}'
-        recent_list = self.app_config.get(key, [])
-        
-        # Remove if already exists (to move to front)
-        if item in recent_list:
-            recent_list.remove(item)
+        order = self._recent_order[key]
         
-        # Add to front
-        recent_list.insert(0, item)
-        
-        # Limit list size
+        # Move (or add) to front, then drop the oldest entries over the cap
+        order[item] = None
+        order.move_to_end(item, last=False)
         max_items = self.app_config.get('max_recent_items', 10)
-        recent_list = recent_list[:max_items]
+        while len(order) > max_items:
+            order.popitem()
         
-        # Update config
-        self.app_config[key] = recent_list
+        # Update the dropdown snapshot and the serialized list in config
+        self._recent[key] = tuple(order)
+        self.app_config[key] = list(self._recent[key])
         
         # Update combo box values
         if list_name == 'sources':
-            self.video_source_combo['values'] = recent_list
+            self._set_combo_values(self.video_source_combo, self._recent[key])
         elif list_name == 'common_clips':
-            self.common_clip_combo['values'] = recent_list
+            self._set_combo_values(self.common_clip_combo, self._recent[key])
         elif list_name == 'outputs':
-            self.output_file_combo['values'] = recent_list
+            self._set_combo_values(self.output_file_combo, self._recent[key])
+    
+    def _set_combo_values(self, combo: ttk.Combobox, values: tuple) -> None:
+        """
+        Set a Combobox's dropdown values only if they actually changed.
+        
+        Reconfiguring values makes Tk re-parse the whole list, so the last
+        tuple pushed to each combobox is remembered and identical updates
+        (e.g. re-adding the item already at the top) are skipped.
+        
+        Args:
+            combo: Combobox to update
+            values: New dropdown values
+            
+        Returns:
+            None
+            
+        Complexity: O(n) where n is number of values (tuple comparison)
+        Flow: Called by add_to_recent
+        """
+        widget_key = str(combo)
+        if self._combo_values_cache.get(widget_key) == values:
+            return
+        combo.configure(values=values)
+        self._combo_values_cache[widget_key] = values
     
     def on_closing(self) -> None:
         """
         Handle window closing event.
         
         Saves configuration including current settings, performs cleanup
-        of temporary files, logs shutdown, and destroys window.
+        of temporary files, logs shutdown, and destroys window. The config
+        is snapshotted here but serialized and written by a short-lived
+        non-daemon thread, and temp files are deleted by another, so the
+        window closes without waiting on disk and the interpreter still
+        waits for both before exiting (and before atexit cleanup runs).
         
         Returns:
             None
@@ -1949,18 +3067,42 @@ class PowerHourGUI(tk.Tk):
         Flow: Called when user closes window or application exits
         """
         try:
+            # The final write below supersedes any pending coalesced save
+            if self._config_save_after_id is not None:
+                self.after_cancel(self._config_save_after_id)
+                self._config_save_after_id = None
+            self._config_dirty = False
+            
+            # Stop the resource readout before its widgets go away
+            if self._resource_job is not None:
+                self.after_cancel(self._resource_job)
+                self._resource_job = None
+            
             # Save additional settings
             self.app_config['video_quality'] = self.video_quality_var.get()
             self.app_config['audio_normalization'] = self.audio_normalization_var.get()
             self.app_config['output_format'] = self.output_format_var.get()
             self.app_config['expert_mode'] = self.expert_mode_var.get()
             
-            self.save_config()
-            self.cleanup_temp_files()
+            config_snapshot = self._snapshot_config()
+            
+            def write_config() -> None:
+                try:
+                    self._write_config_blob(config_snapshot)
+                except Exception as e:
+                    self.log_to_file("error", f"Config save error: {e}")
+            
+            threading.Thread(target=write_config, name="ConfigWriter", daemon=False).start()
+            # Temp trees can be large; delete them after the window is gone
+            threading.Thread(target=self.cleanup_temp_files, name="TempCleanup", daemon=False).start()
             self.log_to_file("info", "Application closed normally")
         except Exception as e:
             self.log_to_file("error", f"Error during shutdown: {e}")
         finally:
+            try:
+                self._flush_log_file()
+            except OSError:
+                pass
             self.destroy()
     
     # Enhanced Features Methods (Phase 6)
@@ -1989,6 +3131,28 @@ class PowerHourGUI(tk.Tk):
             self.expert_frame.grid_forget()
             self.log_info("Expert mode disabled")
             self.hint_label.config(text="Ready to create PowerHour videos")
+        self.app_config['expert_mode'] = self.expert_mode_var.get()
+        self.mark_config_dirty()
+    
+    def toggle_fast_normalization(self) -> None:
+        """
+        Switch between two-pass and single-pass audio normalization.
+        
+        Single pass skips the loudness measurement run and normalizes with
+        dynamic loudnorm during the encode; two pass (the default) measures
+        each video first for linear normalization. Only used while expert
+        mode is on (see _read_inputs).
+        
+        Returns:
+            None
+            
+        Complexity: O(1)
+        Flow: Called when the Expert Details checkbox is toggled
+        """
+        mode = 'single_pass' if self.fast_normalization_var.get() else 'two_pass'
+        self.app_config['audio_normalization_mode'] = mode
+        self.log_info(f"Audio normalization: {mode.replace('_', '-')}")
+        self.mark_config_dirty()
     
     def save_preset(self) -> None:
         """
@@ -2019,7 +3183,7 @@ class PowerHourGUI(tk.Tk):
             if 'presets' not in self.app_config:
                 self.app_config['presets'] = {}
             self.app_config['presets'][preset_name] = preset
-            self.save_config()
+            self.mark_config_dirty()
             
             self.log_info(f"Preset '{preset_name}' saved")
             messagebox.showinfo("Preset Saved", f"Preset '{preset_name}' saved successfully")
@@ -2081,29 +3245,8 @@ class PowerHourGUI(tk.Tk):
         Complexity: O(1)
         Flow: Called from Presets menu
         """
-        presets = {
-            'party': {
-                'fade_duration': 2.0,
-                'video_quality': 'medium',
-                'audio_normalization': True,
-                'output_format': 'mp4'
-            },
-            'archive': {
-                'fade_duration': 3.0,
-                'video_quality': 'high',
-                'audio_normalization': True,
-                'output_format': 'mkv'
-            },
-            'fast': {
-                'fade_duration': 1.0,
-                'video_quality': 'low',
-                'audio_normalization': False,
-                'output_format': 'mp4'
-            }
-        }
-        
-        if preset_type in presets:
-            preset = presets[preset_type]
+        preset = _BUILTIN_PRESETS.get(preset_type)
+        if preset is not None:
             self.fade_duration_var.set(preset['fade_duration'])
             self.video_quality_var.set(preset['video_quality'])
             self.audio_normalization_var.set(preset['audio_normalization'])
@@ -2230,11 +3373,10 @@ TIPS:
         Complexity: O(1)
         Flow: Called from Help menu
         """
-        import subprocess
-        import platform
-        
+        # Buffered entries must be on disk before the editor reads the file
+        self._flush_log_file()
         if os.path.exists(self.error_log_file):
-            system = platform.system()
+            system = _SYSTEM
             if system == "Windows":
                 os.startfile(self.error_log_file)
             elif system == "Darwin":  # macOS
@@ -2249,38 +3391,99 @@ TIPS:
         Update CPU and RAM usage display in status bar.
         
         Uses psutil library if available to show current system
-        resource usage. Updates every 2 seconds.
+        resource usage. psutil is imported on the first call rather than
+        at module import. CPU is sampled without blocking (usage since the
+        previous tick), so the first tick only primes the counter. The
+        label is only reconfigured when the displayed text changes.
+        Updates every second while processing, every 2 seconds otherwise.
         
         Returns:
             None
             
         Complexity: O(1)
-        Flow: Called every 2 seconds via after() scheduling
+        Flow: Called by _maybe_update_resources once its throttle interval has passed
         """
-        # Check if psutil is available (it's imported as optional at the top)
+        self._last_resource_ts = time.monotonic()
+
+        # Check if psutil is available (optional, imported lazily on first tick)
+        psutil = _psutil_module()
         if psutil is not None:
             try:
-                # Get CPU and memory usage
-                cpu_percent = psutil.cpu_percent(interval=0.1)
-                memory = psutil.virtual_memory()
-                mem_percent = memory.percent
-                
-                self.resource_label.config(
-                    text=f"CPU: {cpu_percent:.0f}% | RAM: {mem_percent:.0f}%"
-                )
+                # Non-blocking CPU sample: usage since the previous call.
+                # The very first call only primes the counter (returns 0.0).
+                cpu_percent = psutil.cpu_percent(interval=None)
+                if not self._cpu_percent_primed:
+                    self._cpu_percent_primed = True
+                else:
+                    memory = psutil.virtual_memory()
+                    mem_percent = memory.percent
+                    
+                    # Skip the redraw when the rounded figures are unchanged
+                    text = f"CPU: {cpu_percent:.0f}% | RAM: {mem_percent:.0f}%"
+                    if text != self._resource_text:
+                        self._resource_text = text
+                        self.resource_label.config(text=text)
             except Exception:
                 # Error getting resource usage
                 pass
         
-        # Schedule next update
-        self.after(2000, self.update_resource_usage)
+        # Schedule next update while the status bar is still alive
+        if self.resource_label.winfo_exists():
+            self._schedule_resource_update()
+    
+    def _schedule_resource_update(self) -> None:
+        """
+        Queue the next resource-usage check for the next idle point.
+        
+        Waits _RESOURCE_POLL_MS, then defers to after_idle so the check
+        runs after pending redraws instead of competing with them.
+        
+        Returns:
+            None
+            
+        Complexity: O(1)
+        Flow: Called by update_resource_usage and _maybe_update_resources
+        """
+        self._resource_job = self.after(self._RESOURCE_POLL_MS, self.after_idle, self._maybe_update_resources)
+    
+    def _maybe_update_resources(self) -> None:
+        """
+        Refresh the resource display if its throttle interval has passed.
+        
+        The interval is 1 second while processing, 2 seconds when idle
+        and 5 seconds while the window is minimized; otherwise the check
+        is simply rescheduled.
+        
+        Returns:
+            None
+            
+        Complexity: O(1)
+        Flow: Called from after_idle via _schedule_resource_update
+        """
+        if self._window_iconified:
+            interval = self._RESOURCE_INTERVAL_ICONIFIED
+        elif self._processing_active:
+            interval = self._RESOURCE_INTERVAL_ACTIVE
+        else:
+            interval = self._RESOURCE_INTERVAL_IDLE
+        if time.monotonic() - self._last_resource_ts < interval:
+            self._schedule_resource_update()
+            return
+        self.update_resource_usage()
+    
+    def _set_iconified(self, event: tk.Event, iconified: bool) -> None:
+        """Track <Unmap>/<Map> of the main window (child widget events are ignored)."""
+        if event.widget is self:
+            self._window_iconified = iconified
     
     def add_tooltip(self, widget: tk.Widget, text: str) -> None:
         """
         Add a hover tooltip to a widget.
         
-        Creates tooltip that appears on mouse hover and disappears
-        on mouse leave. Used for providing contextual help.
+        Shows tooltip on mouse hover and hides it on mouse leave. All
+        widgets share one hover window, created on the first hover and
+        then only retexted, moved and withdrawn. Used for providing
+        contextual help.
         
         Args:
             widget: Widget to attach tooltip to
@@ -2293,19 +3496,21 @@ TIPS:
         Flow: Called during UI construction for help text
         """
         def on_enter(event):
-            self.tooltip = tk.Toplevel()
-            self.tooltip.wm_overrideredirect(True)
-            self.tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            label = tk.Label(self.tooltip, text=text,
-                           background="lightyellow",
-                           relief="solid", borderwidth=1,
-                           font=("Arial", 9))
-            label.pack()
+            if self._hover_tooltip is None:
+                self._hover_tooltip = tk.Toplevel(self)
+                self._hover_tooltip.wm_overrideredirect(True)
+                self._hover_tooltip_label = tk.Label(self._hover_tooltip,
+                                                     background="lightyellow",
+                                                     relief="solid", borderwidth=1,
+                                                     font=("Arial", 9))
+                self._hover_tooltip_label.pack()
+            self._hover_tooltip_label.config(text=text)
+            self._hover_tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+            self._hover_tooltip.deiconify()
         
         def on_leave(event):
-            if hasattr(self, 'tooltip'):
-                self.tooltip.destroy()
-                del self.tooltip
+            if self._hover_tooltip is not None:
+                self._hover_tooltip.withdraw()
         
         widget.bind("<Enter>", on_enter)
         widget.bind("<Leave>", on_leave)
@@ -2318,7 +3523,9 @@ TIPS:
         
         Installs a custom sys.excepthook that logs exceptions to file
         and shows user-friendly error dialogs. Allows KeyboardInterrupt
-        to pass through for debugging.
+        to pass through for debugging. The hook holds only a weak
+        reference to the window, so it does not keep a destroyed GUI
+        alive; once the window is gone it defers to the default hook.
         
         Returns:
             None
@@ -2326,8 +3533,11 @@ TIPS:
         Complexity: O(1)
         Flow: Called once during initialization
         """
+        gui_ref = weakref.ref(self)
+        
         def handle_exception(exc_type, exc_value, exc_traceback):
-            if issubclass(exc_type, KeyboardInterrupt):
+            gui = gui_ref()
+            if gui is None or issubclass(exc_type, KeyboardInterrupt):
                 sys.__excepthook__(exc_type, exc_value, exc_traceback)
                 return
             
@@ -2335,7 +3545,7 @@ TIPS:
                 exc_type, exc_value, exc_traceback
             ))
             
-            self.log_to_file("critical", f"Uncaught exception:\n{error_msg}")
+            gui.log_to_file("critical", f"Uncaught exception:\n{error_msg}")
             
             # Show error dialog
             messagebox.showerror(
@@ -2350,8 +3560,10 @@ TIPS:
         """
         Handle an error with logging and user notification.
         
-        Logs full error details to file, maps to user-friendly message,
-        and displays in GUI log. Returns the user-friendly message.
+        Maps to a user-friendly message, logs error details to file and
+        displays in GUI log. Expected errors (_EXPECTED_ERRORS) are logged
+        as one line; others include the full traceback. Returns the
+        user-friendly message.
         
         Args:
             error: The exception that occurred
@@ -2364,14 +3576,15 @@ TIPS:
         Flow: Called when exceptions occur during operation
         """
         error_msg = str(error)
-        error_type = type(error).__name__
-        
-        # Log full error details
-        full_error = traceback.format_exc()
-        self.log_to_file("error", f"{context}\n{full_error}")
         
         # Map to user-friendly message
-        user_msg = self.get_user_friendly_error(error_type, error_msg, context)
+        user_msg = self.get_user_friendly_error(error, error_msg, context)
+        
+        # Log details; only unexpected errors pay for formatting the traceback
+        if isinstance(error, _EXPECTED_ERRORS):
+            self.log_to_file("error", f"{context}: {type(error).__name__}: {error_msg}")
+        else:
+            self.log_to_file("error", f"{context}\n{traceback.format_exc()}")
         
         # Show in GUI log
         self.log_error(f"{context}: {user_msg}")
@@ -2379,7 +3592,7 @@ TIPS:
         # Return the user message
         return user_msg
     
-    def get_user_friendly_error(self, error_type: str, error_msg: str, context: str) -> str:
+    def get_user_friendly_error(self, error: Union[BaseException, str], error_msg: str, context: str) -> str:
         """
         Map technical error messages to user-friendly explanations.
         
@@ -2387,7 +3600,7 @@ TIPS:
         like missing dependencies, permission errors, disk space, etc.
         
         Args:
-            error_type: Type/class name of the error
+            error: The exception, or a type label when there is no exception object
             error_msg: The error message string
             context: Context where error occurred
             
@@ -2397,32 +3610,22 @@ TIPS:
         Complexity: O(1)
         Flow: Called by handle_error for message mapping
         """
-        error_map = {
-            "FileNotFoundError": "The specified file or folder could not be found.",
-            "PermissionError": "Permission denied. Please check file permissions.",
-            "OSError": "System error occurred. Please check disk space and permissions.",
-            "JSONDecodeError": "Configuration file is corrupted. Using defaults.",
-            "subprocess.CalledProcessError": "Video processing failed. Check FFmpeg installation.",
-            "MemoryError": "Out of memory. Try processing fewer videos.",
-            "KeyboardInterrupt": "Operation cancelled by user.",
-            "ValueError": "Invalid input value provided.",
-            "IOError": "Input/output error. Check disk space and file access.",
-        }
+        # Check for specific error patterns (one regex pass, highest-priority hit wins)
+        found = _ERROR_KEYWORD_RE.findall(error_msg)
+        if found:
+            keyword = min((match.lower() for match in found), key=_ERROR_KEYWORD_RANK.__getitem__)
+            return _ERROR_KEYWORD_HINTS[keyword]
         
-        # Check for specific error patterns
-        if "ffmpeg" in error_msg.lower():
-            return "FFmpeg error. Please ensure FFmpeg is installed correctly."
-        elif "ffprobe" in error_msg.lower():
-            return "FFprobe error. Please ensure FFprobe is installed correctly."
-        elif "yt-dlp" in error_msg.lower():
-            return "YouTube download error. Please check the URL and internet connection."
-        elif "disk" in error_msg.lower() or "space" in error_msg.lower():
-            return "Insufficient disk space. Please free up space and try again."
-        elif "network" in error_msg.lower() or "connection" in error_msg.lower():
-            return "Network error. Please check your internet connection."
-        
-        # Return mapped message or generic
-        return error_map.get(error_type, f"{error_type}: {error_msg}")
+        if isinstance(error, str):
+            return f"{error}: {error_msg}"
+        
+        # Most specific mapped class wins (FileNotFoundError before OSError, etc.)
+        error_cls = type(error)
+        for cls in error_cls.__mro__:
+            hint = _ERROR_CLASS_MAP.get(cls)
+            if hint is not None:
+                return hint
+        return f"{error_cls.__name__}: {error_msg}"
     
     def show_error_dialog(self, title: str, message: str, details: Optional[str] = None) -> None:
         """
@@ -2451,7 +3654,7 @@ TIPS:
         Get the path to the error log file.
         
         Places error log in same directory as config file for
-        centralized application data storage.
+        centralized application data storage. Memoized like the config path.
         
         Returns:
             str: Full path to error.log file
@@ -2459,15 +3662,19 @@ TIPS:
         Complexity: O(1)
         Flow: Called during initialization
         """
-        config_dir = os.path.dirname(self.get_config_path())
-        return os.path.join(config_dir, 'error.log')
+        return _error_log_path()
     
     def log_to_file(self, level: str, message: str) -> None:
         """
         Log message to error log file with timestamp.
         
-        Appends timestamped log entries to error.log file.
-        Automatically rotates log when it exceeds 10MB.
+        Appends timestamped log entries to error.log file through a
+        persistent buffered binary handle, so each entry is encoded once
+        and costs one buffered write() rather than open/write/close/stat.
+        Error and critical entries are flushed immediately; the rest reach disk when
+        the buffer fills or the app closes. The timestamp string is reused
+        for entries within the same second. Thread-safe; automatically
+        rotates the log when it exceeds _LOG_FILE_MAX_BYTES (10MB).
         
         Args:
             level: Log level (info, warning, error, critical)
@@ -2480,30 +3687,65 @@ TIPS:
         Flow: Called throughout application for persistent logging
         """
         try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            log_entry = f"[{timestamp}] [{level.upper()}] {message}\n"
-            
-            # Create log file if needed
-            os.makedirs(os.path.dirname(self.error_log_file), exist_ok=True)
-            
-            # Append to log file
-            with open(self.error_log_file, 'a') as f:
-                f.write(log_entry)
+            now = int(time.time())
+            last_sec, timestamp = self._log_stamp
+            if now != last_sec:
+                timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+                self._log_stamp = (now, timestamp)
+            payload = f"[{timestamp}] [{level.upper()}] {message}\n".encode('utf-8')
+            
+            with self._log_lock:
+                if self._log_fp is None:
+                    self._open_log_file()
+                self._log_fp.write(payload)
+                self._log_bytes += len(payload)
+                if level in ("error", "critical"):
+                    self._log_fp.flush()
                 
-            # Rotate log if too large (>10MB)
-            if os.path.getsize(self.error_log_file) > 10 * 1024 * 1024:
-                self.rotate_log_file()
+                # Rotate log if too large; the next entry reopens a fresh file
+                if self._log_bytes > self._LOG_FILE_MAX_BYTES:
+                    self._close_log_file()
+                    self.rotate_log_file()
                 
         except Exception:
             # Silent fail - don't want logging to cause errors
             pass
     
+    def _open_log_file(self) -> None:
+        """
+        Open error.log for appending and seed the in-memory size counter.
+        
+        Called with _log_lock held. The one fstat here replaces the
+        per-entry getsize() the log used to do.
+        
+        Raises:
+            OSError: If the log directory or file cannot be created
+        """
+        os.makedirs(os.path.dirname(self.error_log_file), exist_ok=True)
+        self._log_fp = open(self.error_log_file, 'ab', buffering=self._LOG_BUFFER_SIZE)
+        self._log_bytes = os.fstat(self._log_fp.fileno()).st_size
+    
+    def _flush_log_file(self) -> None:
+        """Flush buffered error.log entries to disk, if the log is open."""
+        with self._log_lock:
+            if self._log_fp is not None:
+                self._log_fp.flush()
+    
+    def _close_log_file(self) -> None:
+        """Close the persistent error.log handle, if open."""
+        with self._log_lock:
+            if self._log_fp is not None:
+                try:
+                    self._log_fp.close()
+                finally:
+                    self._log_fp = None
+    
     def rotate_log_file(self) -> None:
         """
         Rotate log file when it exceeds size limit (10MB).
         
-        Renames current log to .old, removing previous .old if exists.
-        Prevents unbounded log growth.
+        Renames current log to .old, replacing any previous .old in the
+        same atomic rename. Prevents unbounded log growth.
         
         Returns:
             None
@@ -2512,24 +3754,21 @@ TIPS:
         Flow: Called by log_to_file when size exceeds limit
         """
         try:
-            # Rename current log to .old
-            old_log = self.error_log_file + '.old'
-            if os.path.exists(old_log):
-                os.remove(old_log)
-            os.rename(self.error_log_file, old_log)
-        except Exception:
+            # Move current log over .old (os.replace overwrites on every platform)
+            os.replace(self.error_log_file, self.error_log_file + '.old')
+        except OSError:
             pass
     
     def cleanup_temp_files(self) -> None:
         """
         Clean up temporary files and directories.
         
-        Removes:
-        - Tracked temporary files from processing
-        - PowerHour temporary directories in system temp
+        Removes tracked temporary files, including the session temp root
+        that processing runs create their working directories in.
         
-        Handles errors silently to avoid cleanup failures affecting
-        application shutdown.
+        Paths are collected first and, when there are more than two,
+        deleted in parallel on a small thread pool. Handles errors
+        silently to avoid cleanup failures affecting application shutdown.
         
         Returns:
             None
@@ -2538,31 +3777,21 @@ TIPS:
         Flow: Called on exit and after processing errors
         """
         try:
-            # Clean tracked temp files
-            for temp_file in self.temp_files:
-                try:
-                    if os.path.exists(temp_file):
-                        if os.path.isdir(temp_file):
-                            import shutil
-                            shutil.rmtree(temp_file)
-                        else:
-                            os.remove(temp_file)
-                except Exception:
-                    pass
-            
+            # Tracked temp files, including the session temp root (so the
+            # system temp dir itself never needs scanning)
+            paths = set(self.temp_files)
             self.temp_files.clear()
-            
-            # Clean system temp PowerHour directories
-            temp_dir = tempfile.gettempdir()
-            for item in os.listdir(temp_dir):
-                if item.startswith('powerhour_') or item.startswith('tmp_powerhour_'):
-                    try:
-                        full_path = os.path.join(temp_dir, item)
-                        if os.path.isdir(full_path):
-                            import shutil
-                            shutil.rmtree(full_path)
-                    except Exception:
-                        pass
+            self._ph_root = None
+            
+            # Deletes are syscall-bound and release the GIL, so separate
+            # trees are removed concurrently; a pool isn't worth it for 1-2
+            if len(paths) > 2:
+                workers = min(8, (os.cpu_count() or 1) * 2)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    list(pool.map(_delete_temp_path, paths))
+            else:
+                for path in paths:
+                    _delete_temp_path(path)
                         
         except Exception as e:
             self.log_to_file("error", f"Cleanup error: {e}")
@@ -2572,7 +3801,11 @@ TIPS:
         Perform cleanup operations on application exit.
         
         Registered with atexit to ensure cleanup happens even on
-        unexpected termination. Calls cleanup_temp_files silently.
+        unexpected termination. Deletes any temp files still tracked
+        (normally on_closing's cleanup thread has already done so;
+        cleanup_temp_files handles its own errors) and closes the error
+        log handle (after any non-daemon config writer thread has
+        finished logging).
         
         Returns:
             None
@@ -2580,11 +3813,32 @@ TIPS:
         Complexity: O(n) where n is number of temp files
         Flow: Called automatically on application exit
         """
-        try:
+        if self.temp_files:
             self.cleanup_temp_files()
+        try:
+            self._close_log_file()
         except Exception:
             pass
     
+    def _temp_root(self) -> str:
+        """
+        Return the session temp root, creating and tracking it on first use.
+        
+        Processing runs create their working directories inside it, so
+        cleanup removes one tracked tree instead of scanning the system
+        temp dir for PowerHour leftovers.
+        
+        Returns:
+            str: Path of the powerhour_* directory in the system temp dir
+        
+        Raises:
+            OSError: If the directory cannot be created
+        """
+        if self._ph_root is None or not os.path.isdir(self._ph_root):
+            self._ph_root = tempfile.mkdtemp(prefix='powerhour_', dir=self._system_tmp)
+            self.add_temp_file(self._ph_root)
+        return self._ph_root
+    
     def add_temp_file(self, path: str) -> None:
         """
         Add a file or directory path to cleanup list.
@@ -2601,16 +3855,15 @@ TIPS:
         Complexity: O(1)
         Flow: Called when temporary files are created
         """
-        if path not in self.temp_files:
-            self.temp_files.append(path)
+        self.temp_files.add(path)
 
 
 def main() -> None:
     """
     Main entry point for the GUI application.
     
-    Creates the PowerHourGUI instance, sets up styles, displays
-    initial messages, and starts the Tkinter event loop.
+    Creates the PowerHourGUI instance (which sets up its own styles),
+    displays initial messages, and starts the Tkinter event loop.
     
     Returns:
         None
@@ -2619,7 +3872,6 @@ def main() -> None:
     Flow: Called when script is run directly
     """
     app = PowerHourGUI()
-    app.setup_styles()
     
     # Initial log message
     app.log_info("PowerHour Video Generator GUI initialized")
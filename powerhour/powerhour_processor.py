@@ -28,13 +28,175 @@ import shutil
 import random
 import subprocess
 import json
-from glob import glob
+import re
 from tempfile import TemporaryDirectory
 from datetime import datetime
 import threading
 import queue
 import time
-from typing import Optional, Dict, List, Tuple, Any, Union
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, List, Tuple, Any, Union, Callable, Iterator, Sequence
+
+# Prefixes that mark a video source as a URL to download rather than a folder
+URL_PREFIXES = ('http://', 'https://')
+
+# Extensions skipped when scanning a folder for videos
+EXCLUDED_EXTENSIONS = frozenset(('.log', '.py', '.txt', '.json'))
+
+
+def list_video_files(folder: str) -> List[str]:
+    """
+    List candidate video files in a folder with a single directory scan.
+    
+    Uses os.scandir so the is-a-file check comes from the cached DirEntry
+    type instead of a stat per entry. Hidden files, subdirectories and
+    EXCLUDED_EXTENSIONS are skipped.
+    
+    Args:
+        folder: Directory path to scan
+        
+    Returns:
+        List[str]: Paths of candidate video files, in directory order
+        
+    Raises:
+        OSError: If the folder cannot be read
+        
+    Complexity: O(n) where n is entries in the directory
+    Flow: Called by the GUI before starting and by ProcessorThread._get_video_files
+    """
+    with os.scandir(folder) as entries:
+        return [
+            entry.path for entry in entries
+            if not entry.name.startswith('.')
+            and os.path.splitext(entry.name)[1].lower() not in EXCLUDED_EXTENSIONS
+            and entry.is_file()
+        ]
+
+
+# Video encoder settings: NVENC when an NVIDIA encoder is usable, else libx264
+LIBX264_ARGS = ('-c:v', 'libx264', '-preset', 'medium', '-crf', '23')
+NVENC_ARGS = ('-c:v', 'h264_nvenc', '-preset', 'p4', '-tune', 'hq',
+              '-rc', 'vbr', '-cq', '23', '-b:v', '0')
+
+# Source codecs decoded on the GPU (NVDEC) when encoding with NVENC
+NVDEC_CODECS = frozenset(('h264', 'hevc', 'vp9'))
+
+# Audio filter for params['audio_normalization_mode'] == 'single_pass':
+# loudnorm in dynamic mode needs no prior measurement pass
+SINGLE_PASS_LOUDNORM = 'loudnorm=I=-23:LRA=7:TP=-1.5:print_format=summary'
+
+# Output frame rate of every clip
+OUTPUT_FPS = 30
+
+# Most files measured by one batched loudnorm ffmpeg run
+LOUDNESS_BATCH_SIZE = 8
+
+# One loudnorm JSON block as printed to stderr, tagged with the filter
+# instance ([Parsed_loudnorm_<n> @ 0x...]) so batched results can be told apart
+_LOUDNORM_JSON_RE = re.compile(r'\[Parsed_loudnorm_(\d+) @ [^\]]*\]\s*(\{[^{}]*\})')
+
+# yt-dlp throughput options: fragments fetched in parallel per video, and
+# aria2c connections per file when aria2c is installed
+YTDLP_CONCURRENT_FRAGMENTS = 8
+ARIA2C_ARGS = 'aria2c:-x 16 -s 16'
+
+# Minimum seconds between intermediate video_progress messages
+VIDEO_PROGRESS_INTERVAL = 0.1
+
+# Concurrent ffmpeg jobs. Consumer NVIDIA cards cap concurrent NVENC
+# sessions, so GPU encodes run two at a time; libx264 jobs share the CPU
+# (see ProcessorThread._encode_workers). Loudness analysis is mostly
+# single-threaded decode, so it gets up to one job per core.
+NVENC_WORKERS = 2
+MAX_ENCODE_WORKERS = 4
+MAX_ANALYSIS_WORKERS = 8
+
+
+@functools.lru_cache(maxsize=4)
+def nvenc_available(ffmpeg: str = 'ffmpeg') -> bool:
+    """
+    Report whether ffmpeg can encode H.264 on an NVIDIA GPU.
+    
+    Checks that ffmpeg lists h264_nvenc and then encodes a few frames with
+    NVENC_ARGS, since builds ship the encoder even on machines without a
+    usable GPU or driver, and older builds or drivers lack the presets and
+    tuning NVENC_ARGS asks for. Cached per ffmpeg path for the life of the process.
+    
+    Args:
+        ffmpeg: ffmpeg executable (name or resolved path)
+    
+    Returns:
+        bool: True if h264_nvenc works, False otherwise (including no ffmpeg)
+        
+    Complexity: O(1) - two short ffmpeg runs, first call only
+    Flow: Called by ProcessorThread.run after the dependency check
+    """
+    try:
+        encoders = subprocess.run(
+            [ffmpeg, '-hide_banner', '-encoders'],
+            capture_output=True, text=True, timeout=10
+        ).stdout
+        if 'h264_nvenc' not in encoders:
+            return False
+        # Same encoder options as the real encodes, so builds or drivers
+        # without the p1-p7 presets or -tune hq fail here, not per clip
+        probe = subprocess.run(
+            [ffmpeg, '-hide_banner', '-v', 'error', '-f', 'lavfi',
+             '-i', 'color=size=256x256:duration=0.1', *NVENC_ARGS,
+             '-pix_fmt', 'yuv420p', '-f', 'null', '-'],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=20
+        )
+        return probe.returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def _parse_rate(rate: Optional[str]) -> Optional[float]:
+    """
+    Convert an ffprobe frame rate such as "30000/1001" to a float.
+    
+    Args:
+        rate: ffprobe rational string, or None
+        
+    Returns:
+        Optional[float]: Frames per second, or None for missing/0/0 rates
+    """
+    try:
+        num, _, den = rate.partition('/')
+        fps = float(num) / float(den or 1)
+    except (AttributeError, ValueError, ZeroDivisionError):
+        return None
+    return fps or None
+
+
+def _is_output_fps(fps: Optional[float]) -> bool:
+    """
+    Check whether a source frame rate already equals OUTPUT_FPS.
+    
+    Args:
+        fps: _parse_rate result, or None when unknown
+        
+    Returns:
+        bool: True if no frame rate conversion is needed
+    """
+    return fps is not None and abs(fps - OUTPUT_FPS) < 0.01
+
+
+def _concat_entry(path: str) -> str:
+    """
+    Format one line of an ffmpeg concat-demuxer list.
+    
+    Quotes the path and escapes single quotes the way the demuxer expects
+    ('\\'' closes the quote, adds a literal quote and reopens it).
+    
+    Args:
+        path: Clip path
+        
+    Returns:
+        str: "file '<path>'" line, newline included
+    """
+    return "file '" + path.replace("'", "'\\''") + "'\n"
 
 
 class ProcessorThread(threading.Thread):
@@ -77,6 +239,13 @@ class ProcessorThread(threading.Thread):
                 - video_quality (str): Quality preset (low/medium/high)
                 - audio_normalization (bool): Whether to normalize audio
                 - output_format (str): Output container format
+                - preloaded_files (List[str], optional): list_video_files()
+                  result for a local video_source, reused instead of rescanning
+                - temp_root (str, optional): Directory to create the working
+                  temp dir in (the GUI's per-session temp root)
+                - audio_normalization_mode (str, optional): 'two_pass'
+                  (default; measure, then apply linear loudnorm) or
+                  'single_pass' (dynamic loudnorm, no measurement pass)
                 
         Returns:
             None
@@ -89,6 +258,17 @@ class ProcessorThread(threading.Thread):
         self.params = params
         self.stop_event = threading.Event()
         self.daemon = True
+        # Tool executables; _check_dependencies swaps in the paths it
+        # resolved so each later call skips the PATH search
+        self.ffmpeg = 'ffmpeg'
+        self.ffprobe = 'ffprobe'
+        self.ytdlp = 'yt-dlp'
+        # Encoder arguments for _reencode_video; switched to NVENC in run()
+        self.video_codec_args = LIBX264_ARGS
+        # Per-job libx264 thread count when encoding in parallel (0 = ffmpeg default)
+        self.encode_threads = 0
+        # monotonic() time of the last video_progress message sent
+        self._last_progress_ts = 0.0
         
     def run(self) -> None:
         """
@@ -123,6 +303,11 @@ class ProcessorThread(threading.Thread):
             if not self._check_dependencies():
                 return
             
+            # Prefer GPU encoding when available
+            if nvenc_available(self.ffmpeg):
+                self.video_codec_args = NVENC_ARGS
+                self.send_log("info", "Using NVIDIA GPU encoder (h264_nvenc)")
+            
             # Start processing
             self._process_videos()
             
@@ -167,7 +352,7 @@ class ProcessorThread(threading.Thread):
             self.send_error("No video source specified")
             return False
             
-        if not video_source.startswith('http') and not os.path.exists(video_source):
+        if not video_source.startswith(URL_PREFIXES) and not os.path.exists(video_source):
             self.send_error(f"Video source not found: {video_source}")
             return False
         
@@ -185,7 +370,8 @@ class ProcessorThread(threading.Thread):
         Check for required external dependencies.
         
         Verifies that ffmpeg, ffprobe, and optionally yt-dlp are
-        installed and accessible in the system PATH.
+        installed and accessible in the system PATH, and keeps the
+        resolved paths for every later subprocess call.
         
         Returns:
             bool: True if all dependencies found, False otherwise
@@ -196,20 +382,26 @@ class ProcessorThread(threading.Thread):
         self.send_status("Checking dependencies...")
         
         # Check for ffmpeg
-        if shutil.which('ffmpeg') is None:
+        ffmpeg = shutil.which('ffmpeg')
+        if ffmpeg is None:
             self.send_error("FFmpeg is not installed. Please install FFmpeg to continue.")
             return False
+        self.ffmpeg = ffmpeg
         
         # Check for ffprobe
-        if shutil.which('ffprobe') is None:
+        ffprobe = shutil.which('ffprobe')
+        if ffprobe is None:
             self.send_error("FFprobe is not installed. Please install FFprobe to continue.")
             return False
+        self.ffprobe = ffprobe
         
         # Check for yt-dlp if URL provided
-        if self.params.get('video_source', '').startswith('http'):
-            if shutil.which('yt-dlp') is None:
+        if self.params.get('video_source', '').startswith(URL_PREFIXES):
+            ytdlp = shutil.which('yt-dlp')
+            if ytdlp is None:
                 self.send_error("yt-dlp is not installed. Please install yt-dlp for URL support.")
                 return False
+            self.ytdlp = ytdlp
         
         self.send_log("info", "All dependencies found")
         return True
@@ -235,9 +427,9 @@ class ProcessorThread(threading.Thread):
         fade_duration = self.params.get('fade_duration', 3.0)
         output_file = self.params.get('output_file')
         
-        with TemporaryDirectory() as temp_dir:
+        with TemporaryDirectory(dir=self.params.get('temp_root')) as temp_dir:
             # Handle URL download if needed
-            if video_folder.startswith('http'):
+            if video_folder.startswith(URL_PREFIXES):
                 self.send_status("Downloading playlist...")
                 self.send_log("info", f"Downloading from: {video_folder}")
                 
@@ -246,9 +438,10 @@ class ProcessorThread(threading.Thread):
                     
                 video_folder = temp_dir
             
-            # Get video files
+            # Get video files (reusing the GUI's folder listing when it sent one)
             self.send_status("Scanning video files...")
-            video_files = self._get_video_files(video_folder)
+            preloaded = None if video_folder == temp_dir else self.params.get('preloaded_files')
+            video_files = self._get_video_files(video_folder, preloaded)
             
             if not video_files:
                 self.send_error("No video files found in the specified directory")
@@ -266,7 +459,9 @@ class ProcessorThread(threading.Thread):
         
         Downloads videos from supported platforms (YouTube, Vimeo, etc.)
         to a temporary directory for processing. Monitors download progress
-        and can be cancelled via stop_event.
+        and can be cancelled via stop_event. Fragmented streams download
+        YTDLP_CONCURRENT_FRAGMENTS pieces at a time, and aria2c is used
+        for multi-connection downloads when it is on PATH.
         
         Args:
             url: Playlist or video URL to download
@@ -279,9 +474,13 @@ class ProcessorThread(threading.Thread):
         Flow: Called when video_source is a URL
         """
         command = [
-            "yt-dlp", "-o", f"{temp_dir}/%(title)s.%(ext)s",
-            "--yes-playlist", url
+            self.ytdlp, "-o", f"{temp_dir}/%(title)s.%(ext)s",
+            "--yes-playlist", "--concurrent-fragments", str(YTDLP_CONCURRENT_FRAGMENTS),
+            "--throttled-rate", "100K"
         ]
+        if shutil.which("aria2c"):
+            command += ["--downloader", "aria2c", "--downloader-args", ARIA2C_ARGS]
+        command.append(url)
         
         try:
             log_file = os.path.join(temp_dir, 'yt-dlp.log')
@@ -315,7 +514,7 @@ class ProcessorThread(threading.Thread):
         
         return True
     
-    def _get_video_files(self, folder: str) -> List[str]:
+    def _get_video_files(self, folder: str, preloaded: Optional[List[str]] = None) -> List[str]:
         """
         Get list of video files from folder.
         
@@ -324,6 +523,8 @@ class ProcessorThread(threading.Thread):
         
         Args:
             folder: Directory path to scan for videos
+            preloaded: Existing list_video_files(folder) result; the folder
+                is only scanned if this is None
             
         Returns:
             List[str]: List of video file paths (max 60)
@@ -331,12 +532,7 @@ class ProcessorThread(threading.Thread):
         Complexity: O(n) where n is files in directory
         Flow: Called after download or with local folder
         """
-        excluded_extensions = ['.log', '.py', '.txt', '.json']
-        video_files = []
-        
-        for file in glob(os.path.join(folder, '*')):
-            if os.path.splitext(file)[1].lower() not in excluded_extensions:
-                video_files.append(file)
+        video_files = list(preloaded) if preloaded is not None else list_video_files(folder)
         
         # Randomly select up to 60 videos
         max_videos = 60
@@ -376,36 +572,57 @@ class ProcessorThread(threading.Thread):
         os.makedirs(ffmpeg_logs_dir, exist_ok=True)
         os.makedirs(loudness_json_dir, exist_ok=True)
         
+        two_pass = self.params.get('audio_normalization_mode', 'two_pass') != 'single_pass'
+        
         # Analyze common clip loudness
-        self.send_status("Analyzing common clip...")
-        common_clip_log = os.path.join(ffmpeg_logs_dir, 'common_clip.log')
-        self._analyze_loudness(common_clip, common_clip_log, loudness_json_dir)
+        if two_pass:
+            self.send_status("Analyzing common clip...")
+            common_clip_log = os.path.join(ffmpeg_logs_dir, 'common_clip.log')
+            self._analyze_loudness(common_clip, common_clip_log, loudness_json_dir)
         
-        # Check video durations and analyze loudness
+        # Check video durations (several files at once)
         self.send_status("Analyzing video files...")
-        valid_videos = []
         total_videos = len(video_files)
+        # A 0/N tick marks each pass's start, so the GUI's ETA measures
+        # the first (possibly simultaneous) completions from here
+        self.send_progress(0, total_videos)
+        analysis_workers = max(1, min(MAX_ANALYSIS_WORKERS, os.cpu_count() or 1))
+        probes: Dict[int, Optional[Dict[str, Any]]] = {}
+        
+        jobs = [(video_file,) for video_file in video_files]
+        for done, (n, probe) in enumerate(self._run_parallel(self._probe_video, jobs, analysis_workers), 1):
+            probes[n] = probe
+            self.send_progress(done, total_videos)
+            self.send_status(f"Analyzing video {done}/{total_videos}")
+        
+        if self.stop_event.is_set():
+            return
         
-        for i, video_file in enumerate(video_files, 1):
-            if self.stop_event.is_set():
-                return
-            
-            # Update progress
-            self.send_progress(i, total_videos)
-            self.send_status(f"Analyzing video {i}/{total_videos}")
-            
-            duration = self._get_video_duration(video_file)
-            if duration and duration >= 80:
-                log_file = os.path.join(ffmpeg_logs_dir, f'loudness_{i:04d}.log')
-                self._analyze_loudness(video_file, log_file, loudness_json_dir)
-                valid_videos.append((video_file, duration))
-            
-            self.send_video_progress((i / total_videos) * 100)
+        # Keep the original (shuffled) order for the final video
+        valid_videos = [(video_file, probes[n]) for n, video_file in enumerate(video_files)
+                        if probes.get(n) and probes[n]['duration'] >= 80]
         
         if not valid_videos:
             self.send_error("No valid videos found (need duration >= 80 seconds)")
             return
         
+        # Analyze loudness, several files per ffmpeg run; batches are sized
+        # so every analysis worker still gets one
+        valid_files = [video_file for video_file, _ in valid_videos]
+        batch_size = max(1, min(LOUDNESS_BATCH_SIZE, -(-len(valid_files) // analysis_workers)))
+        batches = [
+            (valid_files[k:k + batch_size],
+             os.path.join(ffmpeg_logs_dir, f'loudness_{k // batch_size + 1:04d}.log'),
+             loudness_json_dir)
+            for k in range(0, len(valid_files), batch_size)
+        ] if two_pass else []
+        for done, _ in enumerate(self._run_parallel(self._analyze_loudness_files, batches, analysis_workers), 1):
+            self.send_status(f"Analyzing loudness {done}/{len(batches)}")
+            self.send_video_progress((done / len(batches)) * 100)
+        
+        if self.stop_event.is_set():
+            return
+        
         self.send_log("info", f"Processing {len(valid_videos)} valid videos")
         
         # Re-encode common clip
@@ -424,39 +641,54 @@ class ProcessorThread(threading.Thread):
             self.send_error("Failed to process common clip")
             return
         
-        # Process each video
+        # Process each video, several encodes at a time. The current-video
+        # bar shows seconds encoded across all running clips
         self.send_status("Processing videos...")
-        clip_list = []
-        failed = 0
+        clip_seconds = [0.0] * len(valid_videos)
+        total_seconds = 60.0 * len(valid_videos)
         
-        for i, (video_file, duration) in enumerate(valid_videos, 1):
-            if self.stop_event.is_set():
-                return
-            
-            self.send_progress(i, len(valid_videos))
-            self.send_status(f"Processing video {i}/{len(valid_videos)}")
-            
+        def clip_progress(n: int, seconds: float) -> None:
+            clip_seconds[n] = min(seconds, 60.0)
+            self.send_video_progress(sum(clip_seconds) / total_seconds * 100)
+        
+        encode_jobs = []
+        for i, (video_file, probe) in enumerate(valid_videos, 1):
             # Random start time
-            start_time = random.randint(10, int(duration) - 70)
-            temp_clip_name = f'temp_clip_{i:04d}.mp4'
-            temp_clip_path = os.path.join(temp_dir, temp_clip_name)
+            start_time = random.randint(10, int(probe['duration']) - 70)
+            temp_clip_path = os.path.join(temp_dir, f'temp_clip_{i:04d}.mp4')
             json_loudness_file = os.path.join(
                 loudness_json_dir,
                 os.path.basename(video_file) + '_loudness.json'
             )
-            
-            if self._reencode_video(
+            encode_jobs.append((
                 video_file, start_time, 60, temp_clip_path,
                 os.path.join(ffmpeg_logs_dir, f'video_{i:04d}.log'),
-                fade_duration, json_loudness_file
-            ):
-                clip_list.append(temp_clip_path)
-                self.send_log("info", f"Processed: {os.path.basename(video_file)}")
+                fade_duration, json_loudness_file, probe['codec_name'],
+                functools.partial(clip_progress, i - 1), probe['fps']
+            ))
+        
+        total_clips = len(encode_jobs)
+        self.send_progress(0, total_clips)
+        encoded: Dict[int, bool] = {}
+        failed = 0
+        for done, (n, ok) in enumerate(
+                self._run_parallel(self._reencode_video, encode_jobs, self._encode_workers()), 1):
+            encoded[n] = ok
+            video_name = os.path.basename(encode_jobs[n][0])
+            if ok:
+                self.send_log("info", f"Processed: {video_name}")
             else:
-                self.send_log("warning", f"Failed: {os.path.basename(video_file)}")
+                self.send_log("warning", f"Failed: {video_name}")
                 failed += 1
-            
-            self.send_video_progress((i / len(valid_videos)) * 100)
+            self.send_progress(done, total_clips)
+            self.send_status(f"Processing video {done}/{total_clips}")
+            clip_progress(n, 60.0)
+        
+        if self.stop_event.is_set():
+            return
+        
+        # Concat order follows valid_videos, not completion order
+        clip_list = [job[3] for n, job in enumerate(encode_jobs) if encoded.get(n)]
         
         if failed > 0:
             self.send_log("warning", f"{failed} files failed to process")
@@ -465,17 +697,23 @@ class ProcessorThread(threading.Thread):
         self.send_status("Creating final video...")
         self.send_log("info", "Concatenating clips...")
         
+        # Common clip before each video except the first. The list is
+        # written as UTF-8 bytes so ffmpeg reads non-ASCII paths the same on
+        # every platform, whatever the locale encoding
         concat_list_path = os.path.join(temp_dir, 'concat_list.txt')
-        with open(concat_list_path, 'w') as concat_file:
-            for i, clip_path in enumerate(clip_list):
-                if i > 0:  # Add common clip before each video except the first
-                    concat_file.write(f"file '{common_clip_temp}'\n")
-                concat_file.write(f"file '{clip_path}'\n")
-        
-        # Final concatenation
+        entries = []
+        for i, clip_path in enumerate(clip_list):
+            if i > 0:
+                entries.append(_concat_entry(common_clip_temp))
+            entries.append(_concat_entry(clip_path))
+        with open(concat_list_path, 'wb') as concat_file:
+            concat_file.write(''.join(entries).encode('utf-8'))
+        
+        # Final concatenation. Only the output gets +faststart: on the temp
+        # clips it just cost a second rewrite of each file
         concat_command = [
-            'ffmpeg', '-y', '-f', 'concat', '-safe', '0',
-            '-i', concat_list_path, '-c', 'copy', output_file
+            self.ffmpeg, '-y', '-f', 'concat', '-safe', '0',
+            '-i', concat_list_path, '-c', 'copy', '-movflags', '+faststart', output_file
         ]
         
         if self._run_command(
@@ -487,34 +725,100 @@ class ProcessorThread(threading.Thread):
         else:
             self.send_error("Failed to concatenate videos")
     
-    def _get_video_duration(self, video_file: str) -> Optional[float]:
+    def _encode_workers(self) -> int:
         """
-        Get duration of a video file using ffprobe.
+        Decide how many clips to encode at once and set encode_threads.
         
-        Extracts video duration in seconds for validation and
-        random start time calculation.
+        NVENC runs NVENC_WORKERS sessions. libx264 runs up to
+        MAX_ENCODE_WORKERS jobs (one per four cores) and splits the cores
+        between them via -threads so parallel jobs don't oversubscribe.
+        
+        Returns:
+            int: Number of concurrent encode jobs
+            
+        Complexity: O(1)
+        Flow: Called by _process_video_files before encoding clips
+        """
+        if self.video_codec_args is NVENC_ARGS:
+            self.encode_threads = 0
+            return NVENC_WORKERS
+        cpu_count = os.cpu_count() or 1
+        workers = max(1, min(MAX_ENCODE_WORKERS, cpu_count // 4))
+        self.encode_threads = max(1, cpu_count // workers) if workers > 1 else 0
+        return workers
+    
+    def _run_parallel(self, func: Callable[..., Any], jobs: Sequence[Tuple[Any, ...]],
+                      workers: int) -> Iterator[Tuple[int, Any]]:
+        """
+        Run func(*job) for each job on a thread pool.
+        
+        The work happens in ffmpeg/ffprobe subprocesses, so threads are
+        enough to keep several running. Results are yielded in completion
+        order as (job index, result). Once stop_event is set, iteration
+        stops and jobs that have not started are cancelled; running jobs
+        finish first.
+        
+        Args:
+            func: Callable to run for each job
+            jobs: Argument tuples, one per job
+            workers: Maximum number of concurrent jobs
+            
+        Yields:
+            Tuple[int, Any]: Index into jobs and func's return value
+            
+        Complexity: O(n) where n is number of jobs
+        Flow: Called by _process_video_files for analysis and encoding
+        """
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = {pool.submit(func, *job): n for n, job in enumerate(jobs)}
+            try:
+                for future in as_completed(futures):
+                    if self.stop_event.is_set():
+                        return
+                    yield futures[future], future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+    
+    def _probe_video(self, video_file: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a video's duration and first video stream with one ffprobe call.
+        
+        The duration validates the file and picks the random start time;
+        the stream details (codec, size) travel with the file so later
+        stages never re-probe it.
         
         Args:
             video_file: Path to video file
             
         Returns:
-            Optional[float]: Duration in seconds, None if error
+            Optional[Dict[str, Any]]: {'duration': float, 'codec_name',
+            'width', 'height', 'fps' (None when there is no
+            video stream or it has no frame rate)}, or None if the file
+            can't be probed or has no duration
             
         Complexity: O(1) - ffprobe metadata read
         Flow: Called during video analysis phase
         """
         try:
-            duration = subprocess.check_output([
-                'ffprobe', '-v', 'error', '-show_entries',
-                'format=duration', '-of',
-                'default=noprint_wrappers=1:nokey=1', video_file
-            ], text=True).strip()
-            
-            if duration == 'N/A':
-                return None
-            return float(duration)
-        except subprocess.CalledProcessError:
+            output = subprocess.check_output([
+                self.ffprobe, '-v', 'error', '-select_streams', 'v:0',
+                '-show_entries', 'stream=codec_name,width,height,avg_frame_rate:format=duration',
+                '-of', 'json', video_file
+            ])
+            info = json.loads(output)
+            duration = float(info['format']['duration'])
+        except (subprocess.CalledProcessError, ValueError, KeyError, TypeError):
             return None
+        
+        stream = (info.get('streams') or [{}])[0]
+        return {
+            'duration': duration,
+            'codec_name': stream.get('codec_name'),
+            'width': stream.get('width'),
+            'height': stream.get('height'),
+            'fps': _parse_rate(stream.get('avg_frame_rate')),
+        }
     
     def _analyze_loudness(self, video_file: str, log_file: str,
                          json_output_dir: str) -> None:
@@ -536,51 +840,103 @@ class ProcessorThread(threading.Thread):
         Complexity: O(n) where n is video duration
         Flow: Called before re-encoding each video
         """
+        # -nostats/-hide_banner keep stderr down to the input summary and the
+        # loudnorm block, which one regex search then picks out
         ffmpeg_command = [
-            'ffmpeg', '-i', video_file, '-af',
+            self.ffmpeg, '-hide_banner', '-nostats', '-i', video_file, '-af',
             'loudnorm=I=-23:LRA=7:print_format=json',
             '-f', 'null', '-'
         ]
         
         try:
-            output = subprocess.check_output(
-                ffmpeg_command, 
-                stderr=subprocess.STDOUT, 
-                text=True
+            result = subprocess.run(
+                ffmpeg_command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=True
             )
             
-            # Parse JSON from output
-            loudness_info = None
-            json_data = ""
-            capturing = False
-            
-            for line in output.splitlines():
-                if '{' in line:
-                    capturing = True
-                    json_data = line[line.find('{'):]
-                elif capturing:
-                    json_data += line
-                    if '}' in line:
-                        try:
-                            loudness_info = json.loads(json_data)
-                            break
-                        except json.JSONDecodeError:
-                            pass
-            
-            if loudness_info:
-                # Save loudness info
-                json_file_name = os.path.basename(video_file) + '_loudness.json'
-                json_file_path = os.path.join(json_output_dir, json_file_name)
-                with open(json_file_path, 'w') as json_file:
-                    json.dump(loudness_info, json_file, indent=4)
+            match = _LOUDNORM_JSON_RE.search(result.stderr)
+            if match:
+                try:
+                    self._save_loudness(video_file, json.loads(match.group(2)), json_output_dir)
+                except json.JSONDecodeError:
+                    pass
                     
         except subprocess.CalledProcessError as e:
             with open(log_file, 'w') as log:
-                log.write(str(e.output))
+                log.write(str(e.stderr))
+    
+    def _analyze_loudness_files(self, video_files: List[str], log_file: str,
+                                json_output_dir: str) -> None:
+        """
+        Measure loudness for several files in a single ffmpeg run.
+        
+        Builds one filter graph with a loudnorm measurement per input
+        ([i:a]loudnorm=...) and splits the JSON blocks printed to stderr
+        back out per file by filter index. This saves an ffmpeg start-up,
+        probe and library init per file. If the batched run fails (for
+        example one input has no audio stream) or a result is missing,
+        the files fall back to one _analyze_loudness run each.
+        
+        Args:
+            video_files: Paths of the files to analyze
+            log_file: Path to save the processing log on failure
+            json_output_dir: Directory to save loudness JSON
+            
+        Returns:
+            None
+            
+        Complexity: O(n) where n is total duration of the files
+        Flow: Called by _process_video_files for each batch of valid videos
+        """
+        if len(video_files) > 1:
+            command = [self.ffmpeg, '-hide_banner', '-nostats']
+            for video_file in video_files:
+                command += ['-i', video_file]
+            command += ['-filter_complex', ';'.join(
+                f'[{i}:a]loudnorm=I=-23:LRA=7:print_format=json[a{i}]'
+                for i in range(len(video_files))
+            )]
+            for i in range(len(video_files)):
+                command += ['-map', f'[a{i}]']
+            command += ['-f', 'null', '-']
+            
+            try:
+                output = subprocess.check_output(command, stderr=subprocess.STDOUT, text=True)
+            except subprocess.CalledProcessError as e:
+                with open(log_file, 'w') as log:
+                    log.write(str(e.output))
+            else:
+                measured = {int(m.group(1)): m.group(2) for m in _LOUDNORM_JSON_RE.finditer(output)}
+                remaining = []
+                for i, video_file in enumerate(video_files):
+                    try:
+                        self._save_loudness(video_file, json.loads(measured[i]), json_output_dir)
+                    except (KeyError, json.JSONDecodeError):
+                        remaining.append(video_file)
+                video_files = remaining
+        
+        base, ext = os.path.splitext(log_file)
+        for i, video_file in enumerate(video_files):
+            if self.stop_event.is_set():
+                return
+            self._analyze_loudness(video_file, f'{base}_{i}{ext}', json_output_dir)
+    
+    def _save_loudness(self, video_file: str, loudness_info: Dict[str, Any],
+                       json_output_dir: str) -> None:
+        """Write a file's loudnorm measurement to <basename>_loudness.json."""
+        json_file_path = os.path.join(json_output_dir, os.path.basename(video_file) + '_loudness.json')
+        with open(json_file_path, 'w') as json_file:
+            json_file.write(json.dumps(loudness_info, indent=4))
     
     def _reencode_video(self, video_file: str, start_time: float,
                        duration: float, output_path: str, log_file: str,
-                       fade_duration: float, json_loudness_file: str) -> bool:
+                       fade_duration: float, json_loudness_file: str,
+                       codec_name: Optional[str] = None,
+                       progress_callback: Optional[Callable[[float], None]] = None,
+                       fps: Optional[float] = None) -> bool:
         """
         Re-encode video with audio normalization and fade effects.
         
@@ -588,8 +944,9 @@ class ProcessorThread(threading.Thread):
         - Audio loudness normalization for consistent volume
         - Fade in/out effects for smooth transitions
         - Resolution scaling to 1280x720
-        - Frame rate normalization to 30fps
-        - H.264 encoding with AAC audio
+        - Frame rate normalization to OUTPUT_FPS (skipped when the source
+          already runs at it)
+        - H.264 encoding (h264_nvenc when available, else libx264) with AAC audio
         
         Args:
             video_file: Source video file path
@@ -599,6 +956,13 @@ class ProcessorThread(threading.Thread):
             log_file: Path for ffmpeg log
             fade_duration: Duration of fade effects in seconds
             json_loudness_file: Path to loudness analysis JSON
+            codec_name: Source video codec from _probe_video; with NVENC,
+                codecs in NVDEC_CODECS are also decoded on the GPU
+            progress_callback: Optional callable taking the seconds of the
+                clip encoded so far (see _run_command)
+            fps: Source frame rate from _probe_video. At OUTPUT_FPS no fps
+                filter is added; above it the fps filter runs first so scale
+                and fades see fewer frames, below it last
             
         Returns:
             bool: True if encoding successful, False otherwise
@@ -609,37 +973,65 @@ class ProcessorThread(threading.Thread):
         fade_in_start = 0
         fade_out_start = max(duration - fade_duration, 0)
         
-        # Load loudness info if available
-        try:
-            with open(json_loudness_file, 'r') as f:
-                audio_loudness = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            audio_loudness = {}
-        
-        audio_filters = (
-            f"loudnorm=I=-23:LRA=7:TP=-1.5:"
-            f"measured_I={audio_loudness.get('input_i', '-23.0')}:"
-            f"measured_LRA={audio_loudness.get('input_lra', '7.0')}:"
-            f"measured_TP={audio_loudness.get('input_tp', '-1.5')}:"
-            f"measured_thresh={audio_loudness.get('input_thresh', '-50.0')}:"
-            f"offset={audio_loudness.get('target_offset', '0.0')}:"
-            f"linear=true:print_format=summary"
-        )
+        if self.params.get('audio_normalization_mode', 'two_pass') == 'single_pass':
+            audio_filters = SINGLE_PASS_LOUDNORM
+        else:
+            # Load loudness info if available
+            try:
+                with open(json_loudness_file, 'r') as f:
+                    audio_loudness = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                audio_loudness = {}
+            
+            audio_filters = (
+                f"loudnorm=I=-23:LRA=7:TP=-1.5:"
+                f"measured_I={audio_loudness.get('input_i', '-23.0')}:"
+                f"measured_LRA={audio_loudness.get('input_lra', '7.0')}:"
+                f"measured_TP={audio_loudness.get('input_tp', '-1.5')}:"
+                f"measured_thresh={audio_loudness.get('input_thresh', '-50.0')}:"
+                f"offset={audio_loudness.get('target_offset', '0.0')}:"
+                f"linear=true:print_format=summary"
+            )
         
+        # GPU decode feeding the GPU encoder; frames come back to system
+        # memory for the software scale/fade filters
+        if self.video_codec_args is NVENC_ARGS and codec_name in NVDEC_CODECS:
+            decode_args: Tuple[str, ...] = ('-hwaccel', 'cuda')
+        else:
+            decode_args = ()
+        
+        # enable= limits each fade to its own window; the rest of the clip
+        # bypasses the fade filters entirely
+        video_filters = [
+            "scale=1280:720:flags=bicubic",
+            f"fade=t=in:st={fade_in_start}:d={fade_duration}"
+            f":enable='between(t,{fade_in_start},{fade_in_start + fade_duration})'",
+            f"fade=t=out:st={fade_out_start}:d={fade_duration}"
+            f":enable='between(t,{fade_out_start},{fade_out_start + fade_duration})'",
+        ]
+        if fps is None or fps > OUTPUT_FPS + 0.01:
+            video_filters.insert(0, f"fps={OUTPUT_FPS}")
+        elif not _is_output_fps(fps):
+            video_filters.append(f"fps={OUTPUT_FPS}")
+        
+        # A clip that fails under NVENC is dropped, not retried with
+        # libx264: the final -c copy concat keeps one SPS/PPS for the whole
+        # stream, so every clip has to come from the same encoder
         ffmpeg_command = [
-            'ffmpeg', '-y', '-ss', str(start_time), '-t', str(duration),
+            self.ffmpeg, '-y', *decode_args, '-ss', str(start_time), '-t', str(duration),
             '-i', video_file,
-            '-vf', f"scale=1280:720, fade=t=in:st={fade_in_start}:d={fade_duration}, "
-                   f"fade=t=out:st={fade_out_start}:d={fade_duration}",
+            '-vf', ", ".join(video_filters),
             '-af', audio_filters,
-            '-r', '30', '-c:v', 'libx264', '-preset', 'medium', '-crf', '23',
+            *self.video_codec_args,
+            *(('-threads', str(self.encode_threads)) if self.encode_threads else ()),
             '-c:a', 'aac', '-b:a', '192k', '-ar', '48000', '-ac', '2',
-            '-pix_fmt', 'yuv420p', '-movflags', '+faststart', output_path
+            '-pix_fmt', 'yuv420p', output_path
         ]
         
-        return self._run_command(ffmpeg_command, log_file)
+        return self._run_command(ffmpeg_command, log_file, progress_callback)
     
-    def _run_command(self, command: List[str], log_file: str) -> bool:
+    def _run_command(self, command: List[str], log_file: str,
+                     progress_callback: Optional[Callable[[float], None]] = None) -> bool:
         """
         Run a shell command and log output.
         
@@ -647,9 +1039,14 @@ class ProcessorThread(threading.Thread):
         handling and logging. Suppresses stdout but logs stderr
         for debugging.
         
+        With progress_callback, the command must be ffmpeg: it is run with
+        "-progress pipe:1 -nostats" and the callback gets the seconds of
+        output written so far each time ffmpeg reports it.
+        
         Args:
             command: Command and arguments as list
             log_file: Path to save command output
+            progress_callback: Optional callable taking output seconds
             
         Returns:
             bool: True if command succeeded (exit code 0), False otherwise
@@ -659,12 +1056,28 @@ class ProcessorThread(threading.Thread):
         """
         try:
             with open(log_file, 'w') as log:
-                result = subprocess.run(
-                    command, 
-                    stdout=subprocess.DEVNULL,
-                    stderr=log
+                if progress_callback is None:
+                    result = subprocess.run(
+                        command, 
+                        stdout=subprocess.DEVNULL,
+                        stderr=log
+                    )
+                    return result.returncode == 0
+                
+                # -progress is a global option, so it goes before the inputs
+                process = subprocess.Popen(
+                    [command[0], '-progress', 'pipe:1', '-nostats', *command[1:]],
+                    stdout=subprocess.PIPE,
+                    stderr=log,
+                    text=True
                 )
-            return result.returncode == 0
+                for line in process.stdout:
+                    # out_time_ms is in microseconds as well (ffmpeg quirk);
+                    # newer builds also print out_time_us
+                    key, _, value = line.partition('=')
+                    if key == 'out_time_ms' and value.strip().isdigit():
+                        progress_callback(int(value) / 1e6)
+                return process.wait() == 0
         except Exception as e:
             with open(log_file, 'a') as log:
                 log.write(f"\nError: {str(e)}")
@@ -762,7 +1175,9 @@ class ProcessorThread(threading.Thread):
         """
         Send current video progress percentage.
         
-        Updates the current video progress bar (0-100%).
+        Updates the current video progress bar (0-100%). Intermediate
+        values are sent at most every VIDEO_PROGRESS_INTERVAL seconds (the
+        GUI can't show more); 0% and 100% always go through.
         
         Args:
             percent: Progress percentage (0.0 to 100.0)
@@ -773,6 +1188,10 @@ class ProcessorThread(threading.Thread):
         Complexity: O(1)
         Flow: Called during individual video processing
         """
+        now = time.monotonic()
+        if 0.0 < percent < 100.0 and now - self._last_progress_ts < VIDEO_PROGRESS_INTERVAL:
+            return
+        self._last_progress_ts = now
         self.message_queue.put({
             'type': 'video_progress',
             'percent': percent
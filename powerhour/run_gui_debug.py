@@ -30,16 +30,12 @@ def run_with_debug():
         app = powerhour_gui.PowerHourGUI()
         print("✓ GUI instance created successfully")
         
-        print("\nStep 3: Setting up styles...")
-        app.setup_styles()
-        print("✓ Styles configured successfully")
-        
-        print("\nStep 4: Adding initial log messages...")
+        print("\nStep 3: Adding initial log messages...")
         app.log_info("PowerHour Video Generator GUI initialized")
         app.log_info("Select your video source, common clip, and output settings to begin")
         print("✓ Initial messages logged")
         
-        print("\nStep 5: Starting main event loop...")
+        print("\nStep 4: Starting main event loop...")
         print("GUI window should now be visible.\n")
         print("=" * 60)
         app.mainloop()
@@ -0,0 +1,1251 @@
+"""
+Tests for the display-independent helpers in powerhour/powerhour_gui.py.
+
+Anything that needs a live Tk root belongs in a class guarded by the
+`_can_create_tk()` skip (see tests/test_ytdlp_updater.py).
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import queue
+import subprocess
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from powerhour import powerhour_gui
+
+
+# ---------------------------------------------------------------------------
+# Config (de)serialization
+# ---------------------------------------------------------------------------
+
+class TestConfigJson:
+    SAMPLE = {
+        "recent_sources": ["/videos/Motörhead", "https://youtube.com/playlist?list=x"],
+        "default_fade_duration": 3.0,
+        "expert_mode": False,
+        "presets": {"mine": {"fade_duration": 2.5}},
+    }
+
+    def test_round_trip(self):
+        data = powerhour_gui._json_dumps(self.SAMPLE)
+        assert isinstance(data, bytes)
+        assert powerhour_gui._json_loads(data) == self.SAMPLE
+
+    def test_stdlib_fallback_round_trip(self):
+        with patch.object(powerhour_gui, "orjson", None):
+            data = powerhour_gui._json_dumps(self.SAMPLE)
+            assert powerhour_gui._json_loads(data) == self.SAMPLE
+
+    def test_stdlib_fallback_keeps_non_ascii_readable(self):
+        with patch.object(powerhour_gui, "orjson", None):
+            data = powerhour_gui._json_dumps(self.SAMPLE)
+        assert "Motörhead".encode("utf-8") in data
+
+    def test_write_config_blob_replaces_file_atomically(self, tmp_path):
+        gui = MagicMock()
+        gui.config_file = str(tmp_path / "config.json")
+        (tmp_path / "config.json").write_bytes(b'{"old": true}')
+        powerhour_gui.PowerHourGUI._write_config_blob(gui, self.SAMPLE)
+        assert powerhour_gui._json_loads((tmp_path / "config.json").read_bytes()) == self.SAMPLE
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["config.json"]
+
+    def test_unchanged_config_is_not_rewritten(self, tmp_path):
+        config = tmp_path / "config.json"
+        config.write_bytes(powerhour_gui._json_dumps(self.SAMPLE))
+        gui = MagicMock()
+        gui.config_file = str(config)
+        gui.app_config = {}
+        gui._config_digest = None
+        powerhour_gui.PowerHourGUI.load_config(gui)
+        with patch.object(powerhour_gui.os, "replace") as replace:
+            assert powerhour_gui.PowerHourGUI._write_config_blob(gui, dict(self.SAMPLE)) is False
+            replace.assert_not_called()
+            changed = dict(self.SAMPLE, expert_mode=True)
+            assert powerhour_gui.PowerHourGUI._write_config_blob(gui, changed) is True
+            replace.assert_called_once()
+
+    def test_missing_config_keeps_defaults_silently(self, tmp_path):
+        gui = MagicMock()
+        gui.config_file = str(tmp_path / "config.json")
+        gui.app_config = {"expert_mode": False}
+        powerhour_gui.PowerHourGUI.load_config(gui)
+        assert gui.app_config == {"expert_mode": False}
+        gui.log_to_file.assert_not_called()
+
+    def test_failed_write_keeps_old_config_and_removes_tmp(self, tmp_path):
+        config = tmp_path / "config.json"
+        config.write_bytes(b'{"old": true}')
+        gui = MagicMock()
+        gui.config_file = str(config)
+        with patch.object(powerhour_gui, "_json_dumps", side_effect=TypeError("not serializable")):
+            with pytest.raises(TypeError):
+                powerhour_gui.PowerHourGUI._write_config_blob(gui, self.SAMPLE)
+        assert config.read_bytes() == b'{"old": true}'
+        assert not (tmp_path / "config.json.tmp").exists()
+
+    def test_loads_legacy_four_space_indented_file(self):
+        legacy = b'{\n    "max_recent_items": 10,\n    "recent_outputs": []\n}'
+        assert powerhour_gui._json_loads(legacy) == {"max_recent_items": 10, "recent_outputs": []}
+
+
+class TestErrorLog:
+    def test_rotate_log_file_replaces_previous_old_log(self, tmp_path):
+        log = tmp_path / "error.log"
+        log.write_text("new")
+        (tmp_path / "error.log.old").write_text("stale")
+        gui = MagicMock()
+        gui.error_log_file = str(log)
+        powerhour_gui.PowerHourGUI.rotate_log_file(gui)
+        assert not log.exists()
+        assert (tmp_path / "error.log.old").read_text() == "new"
+
+    def _log_gui(self, log_path, max_bytes=10 * 1024 * 1024):
+        gui = MagicMock()
+        gui.error_log_file = str(log_path)
+        gui._log_lock = threading.RLock()
+        gui._log_fp = None
+        gui._log_bytes = 0
+        gui._log_stamp = (-1, "")
+        gui._LOG_FILE_MAX_BYTES = max_bytes
+        gui._LOG_BUFFER_SIZE = 4096
+        for name in ("_open_log_file", "_close_log_file", "rotate_log_file"):
+            method = getattr(powerhour_gui.PowerHourGUI, name)
+            getattr(gui, name).side_effect = lambda _m=method: _m(gui)
+        return gui
+
+    def test_log_to_file_keeps_handle_open_and_counts_bytes(self, tmp_path):
+        log = tmp_path / "logs" / "error.log"
+        gui = self._log_gui(log)
+        powerhour_gui.PowerHourGUI.log_to_file(gui, "info", "first")
+        handle = gui._log_fp
+        powerhour_gui.PowerHourGUI.log_to_file(gui, "error", "second é")
+        assert gui._log_fp is handle
+        assert gui._open_log_file.call_count == 1
+        powerhour_gui.PowerHourGUI._close_log_file(gui)
+        assert gui._log_fp is None and handle.closed
+        assert gui._log_bytes == log.stat().st_size
+        assert log.read_text(encoding="utf-8").endswith("[ERROR] second é\n")
+
+    def test_only_error_entries_are_flushed_immediately(self, tmp_path):
+        log = tmp_path / "error.log"
+        gui = self._log_gui(log)
+        powerhour_gui.PowerHourGUI.log_to_file(gui, "info", "buffered")
+        assert log.read_bytes() == b""
+        powerhour_gui.PowerHourGUI.log_to_file(gui, "error", "failed")
+        assert log.read_bytes().endswith(b"[ERROR] failed\n")
+        powerhour_gui.PowerHourGUI.log_to_file(gui, "critical", "crash")
+        assert log.read_bytes().endswith(b"[CRITICAL] crash\n")
+        powerhour_gui.PowerHourGUI._close_log_file(gui)
+
+    def test_view_error_log_flushes_buffered_entries_first(self, tmp_path):
+        log = tmp_path / "error.log"
+        gui = self._log_gui(log)
+        gui._flush_log_file.side_effect = lambda: powerhour_gui.PowerHourGUI._flush_log_file(gui)
+        powerhour_gui.PowerHourGUI.log_to_file(gui, "warning", "pending")
+        with patch.object(powerhour_gui, "_SYSTEM", "Linux"), \
+                patch.object(powerhour_gui.subprocess, "call") as call:
+            powerhour_gui.PowerHourGUI.view_error_log(gui)
+        call.assert_called_once_with(["xdg-open", str(log)])
+        assert log.read_bytes().endswith(b"[WARNING] pending\n")
+        powerhour_gui.PowerHourGUI._close_log_file(gui)
+
+    def test_log_to_file_reuses_timestamp_within_a_second(self, tmp_path):
+        log = tmp_path / "error.log"
+        gui = self._log_gui(log)
+        with patch.object(powerhour_gui.time, "time", return_value=1_000_000.2), \
+                patch.object(powerhour_gui.time, "strftime", wraps=powerhour_gui.time.strftime) as strftime:
+            powerhour_gui.PowerHourGUI.log_to_file(gui, "info", "one")
+            powerhour_gui.PowerHourGUI.log_to_file(gui, "info", "two")
+        assert strftime.call_count == 1
+        powerhour_gui.PowerHourGUI._close_log_file(gui)
+        lines = log.read_text(encoding="utf-8").splitlines()
+        assert lines[0].split("]")[0] == lines[1].split("]")[0]
+
+    def test_log_to_file_rotates_when_over_limit(self, tmp_path):
+        log = tmp_path / "error.log"
+        log.write_text("x" * 90)
+        gui = self._log_gui(log, max_bytes=100)
+        powerhour_gui.PowerHourGUI.log_to_file(gui, "info", "pushes it over")
+        assert gui._log_fp is None
+        assert (tmp_path / "error.log.old").read_text().startswith("x" * 90)
+        powerhour_gui.PowerHourGUI.log_to_file(gui, "info", "fresh")
+        powerhour_gui.PowerHourGUI._close_log_file(gui)
+        assert log.read_text().endswith("[INFO] fresh\n")
+
+
+class TestExceptionHook:
+    def test_hook_does_not_keep_gui_alive(self, monkeypatch):
+        monkeypatch.setattr(powerhour_gui.sys, "excepthook", powerhour_gui.sys.excepthook)
+        gui = MagicMock()
+        powerhour_gui.PowerHourGUI.setup_exception_handler(gui)
+        hook = powerhour_gui.sys.excepthook
+        with patch.object(powerhour_gui.messagebox, "showerror") as showerror:
+            hook(RuntimeError, RuntimeError("boom"), None)
+        gui.log_to_file.assert_called_once()
+        showerror.assert_called_once()
+
+        gui_ref = powerhour_gui.weakref.ref(gui)
+        del gui
+        gc.collect()
+        assert gui_ref() is None
+        with patch.object(powerhour_gui.sys, "__excepthook__") as default_hook:
+            hook(RuntimeError, RuntimeError("late"), None)
+        default_hook.assert_called_once()
+
+
+class TestCoalescedConfigSave:
+    def _gui(self):
+        gui = MagicMock()
+        gui._config_dirty = False
+        gui._config_save_after_id = None
+        gui._CONFIG_SAVE_DELAY_MS = powerhour_gui.PowerHourGUI._CONFIG_SAVE_DELAY_MS
+        gui.after.return_value = "after#1"
+        return gui
+
+    def test_burst_of_changes_arms_one_timer_and_saves_once(self):
+        gui = self._gui()
+        for _ in range(3):
+            powerhour_gui.PowerHourGUI.mark_config_dirty(gui)
+        gui.after.assert_called_once_with(1000, gui._flush_config)
+        powerhour_gui.PowerHourGUI._flush_config(gui)
+        gui.save_config.assert_called_once_with()
+        assert gui._config_dirty is False and gui._config_save_after_id is None
+
+    def test_flush_without_changes_does_not_write(self):
+        gui = self._gui()
+        powerhour_gui.PowerHourGUI._flush_config(gui)
+        gui.save_config.assert_not_called()
+
+    def test_closing_cancels_pending_save(self):
+        gui = self._gui()
+        gui._resource_job = "after#2"
+        powerhour_gui.PowerHourGUI.mark_config_dirty(gui)
+        with patch.object(powerhour_gui.threading, "Thread") as thread:
+            powerhour_gui.PowerHourGUI.on_closing(gui)
+        thread.assert_any_call(target=gui.cleanup_temp_files, name="TempCleanup", daemon=False)
+        gui.cleanup_temp_files.assert_not_called()
+        gui.after_cancel.assert_any_call("after#1")
+        gui.after_cancel.assert_any_call("after#2")
+        assert gui._resource_job is None
+        assert gui._config_dirty is False
+        gui._flush_log_file.assert_called_once_with()
+        gui.destroy.assert_called_once_with()
+
+
+# ---------------------------------------------------------------------------
+# Temp file cleanup
+# ---------------------------------------------------------------------------
+
+class TestTempCleanup:
+    def test_fast_rmtree_removes_nested_tree_without_following_links(self, tmp_path):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+        tree = tmp_path / "powerhour_work"
+        (tree / "logs" / "deep").mkdir(parents=True)
+        (tree / "clip.mp4").write_bytes(b"x")
+        (tree / "logs" / "deep" / "ffmpeg.log").write_text("log")
+        (tree / "link").symlink_to(outside, target_is_directory=True)
+        powerhour_gui._fast_rmtree(str(tree))
+        assert not tree.exists()
+        assert (outside / "keep.txt").exists()
+
+    def test_fast_rmtree_treats_entries_deleted_concurrently_as_gone(self, tmp_path):
+        tree = tmp_path / "powerhour_root"
+        work = tree / "tmpwork"
+        (work / "logs").mkdir(parents=True)
+        (work / "logs" / "ffmpeg.log").write_text("log")
+        (work / "clip.mp4").write_bytes(b"x")
+        real_unlink = os.unlink
+
+        def racing_unlink(path):
+            # Another thread removes the whole working dir first
+            subprocess.run(["rm", "-rf", str(work)], check=True)
+            real_unlink(path)
+
+        with patch.object(powerhour_gui.os, "unlink", side_effect=racing_unlink):
+            powerhour_gui._fast_rmtree(str(tree))
+        assert not tree.exists()
+
+    def test_remove_tree_empties_mount_points_but_keeps_them(self, tmp_path):
+        mount = tmp_path / "mnt"
+        (mount / "sub").mkdir(parents=True)
+        (mount / "sub" / "clip.mp4").write_bytes(b"x")
+        with patch.object(powerhour_gui.os.path, "ismount", side_effect=lambda p: p == str(mount)):
+            powerhour_gui._remove_tree(str(mount))
+        assert mount.is_dir() and list(mount.iterdir()) == []
+
+    def test_remove_tree_walks_small_trees_in_python(self, tmp_path):
+        tree = tmp_path / "small"
+        tree.mkdir()
+        (tree / "a.txt").write_text("a")
+        with patch.object(powerhour_gui.subprocess, "run") as run:
+            powerhour_gui._remove_tree(str(tree))
+        run.assert_not_called()
+        assert not tree.exists()
+
+    def test_remove_tree_never_shells_out_on_windows(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(powerhour_gui, "_NATIVE_RMTREE_MIN_ENTRIES", 2)
+        monkeypatch.setattr(powerhour_gui, "_SYSTEM", "Windows")
+        tree = tmp_path / "A&B"
+        tree.mkdir()
+        for i in range(3):
+            (tree / f"{i}.png").write_bytes(b"x")
+        with patch.object(powerhour_gui.subprocess, "run") as run:
+            powerhour_gui._remove_tree(str(tree))
+        run.assert_not_called()
+        assert not tree.exists()
+
+    def test_remove_tree_uses_native_command_then_falls_back(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(powerhour_gui, "_NATIVE_RMTREE_MIN_ENTRIES", 2)
+        tree = tmp_path / "large"
+        tree.mkdir()
+        for i in range(3):
+            (tree / f"{i}.png").write_bytes(b"x")
+        with patch.object(powerhour_gui.subprocess, "run", side_effect=FileNotFoundError) as run:
+            powerhour_gui._remove_tree(str(tree))
+        assert run.call_args.args[0][-1] == str(tree)
+        assert not tree.exists()
+
+    def _cleanup_gui(self, tmp_path):
+        gui = MagicMock()
+        gui.temp_files = set()
+        gui._ph_root = None
+        gui._system_tmp = str(tmp_path)
+        return gui
+
+    def test_delete_temp_path_handles_files_dirs_and_missing_paths(self, tmp_path):
+        (tmp_path / "clip.mp4").write_bytes(b"x")
+        (tmp_path / "work" / "logs").mkdir(parents=True)
+        with patch.object(powerhour_gui.os.path, "exists") as exists:
+            for name in ("clip.mp4", "work", "missing"):
+                powerhour_gui._delete_temp_path(str(tmp_path / name))
+        exists.assert_not_called()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_tracked_paths_are_deduplicated_and_removed(self, tmp_path):
+        gui = self._cleanup_gui(tmp_path)
+        tracked = tmp_path / "clip.mp4"
+        tracked.write_bytes(b"x")
+        for _ in range(3):
+            powerhour_gui.PowerHourGUI.add_temp_file(gui, str(tracked))
+        assert gui.temp_files == {str(tracked)}
+        powerhour_gui.PowerHourGUI.cleanup_temp_files(gui)
+        assert not tracked.exists()
+        assert gui.temp_files == set()
+
+    def test_temp_root_is_tracked_and_removed_without_scanning(self, tmp_path):
+        gui = self._cleanup_gui(tmp_path)
+        gui.add_temp_file.side_effect = lambda path: powerhour_gui.PowerHourGUI.add_temp_file(gui, path)
+        (tmp_path / "powerhour_other_instance").mkdir()
+        root = powerhour_gui.PowerHourGUI._temp_root(gui)
+        assert powerhour_gui.PowerHourGUI._temp_root(gui) == root
+        assert gui.temp_files == {root}
+        (tmp_path / os.path.basename(root) / "tmpwork").mkdir()
+        with patch.object(powerhour_gui.os, "scandir", wraps=os.scandir) as scandir:
+            powerhour_gui.PowerHourGUI.cleanup_temp_files(gui)
+        assert str(tmp_path) not in [c.args[0] for c in scandir.call_args_list]
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["powerhour_other_instance"]
+        assert gui._ph_root is None
+
+    def test_many_paths_are_deleted_on_a_thread_pool(self, tmp_path):
+        gui = self._cleanup_gui(tmp_path)
+        for i in range(4):
+            (tmp_path / f"powerhour_{i}").mkdir()
+            (tmp_path / f"powerhour_{i}" / "clip.mp4").write_bytes(b"x")
+            gui.temp_files.add(str(tmp_path / f"powerhour_{i}"))
+        with patch.object(powerhour_gui, "ThreadPoolExecutor", wraps=powerhour_gui.ThreadPoolExecutor) as pool:
+            powerhour_gui.PowerHourGUI.cleanup_temp_files(gui)
+        pool.assert_called_once()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_exit_cleanup_only_runs_when_paths_remain(self, tmp_path):
+        gui = self._cleanup_gui(tmp_path)
+        powerhour_gui.PowerHourGUI.cleanup_on_exit(gui)
+        gui.cleanup_temp_files.assert_not_called()
+        gui._close_log_file.assert_called_once_with()
+        gui.temp_files.add(str(tmp_path / "clip.mp4"))
+        powerhour_gui.PowerHourGUI.cleanup_on_exit(gui)
+        gui.cleanup_temp_files.assert_called_once_with()
+
+
+# ---------------------------------------------------------------------------
+# Memoized defaults and paths
+# ---------------------------------------------------------------------------
+
+class TestDefaultConfig:
+    def test_cached_defaults_are_read_only(self):
+        defaults = powerhour_gui._default_config()
+        assert defaults is powerhour_gui._default_config()
+        with pytest.raises(TypeError):
+            defaults["max_recent_items"] = 99  # type: ignore[index]
+
+    def test_get_default_config_returns_independent_mutable_copies(self):
+        first = powerhour_gui.PowerHourGUI.get_default_config(None)
+        second = powerhour_gui.PowerHourGUI.get_default_config(None)
+        first["recent_sources"].append("/videos")
+        assert second["recent_sources"] == []
+        assert powerhour_gui._default_config()["recent_sources"] == ()
+
+    def test_error_log_lives_next_to_config(self, tmp_path):
+        powerhour_gui._config_path.cache_clear()
+        powerhour_gui._error_log_path.cache_clear()
+        try:
+            with patch.object(powerhour_gui, "_SYSTEM", "Linux"), \
+                    patch.dict(os.environ, {"HOME": str(tmp_path)}):
+                config_path = powerhour_gui._config_path()
+                assert os.path.isdir(os.path.dirname(config_path))
+                assert powerhour_gui._error_log_path() == os.path.join(
+                    os.path.dirname(config_path), "error.log"
+                )
+        finally:
+            powerhour_gui._config_path.cache_clear()
+            powerhour_gui._error_log_path.cache_clear()
+
+
+# ---------------------------------------------------------------------------
+# Queue draining
+# ---------------------------------------------------------------------------
+
+def _fake_gui():
+    """A MagicMock standing in for a PowerHourGUI with real queue/log plumbing."""
+    gui = MagicMock()
+    gui.message_queue = queue.Queue()
+    gui._QUEUE_DRAIN_LIMIT = powerhour_gui.PowerHourGUI._QUEUE_DRAIN_LIMIT
+    gui._LOG_MAX_LINES = powerhour_gui.PowerHourGUI._LOG_MAX_LINES
+    gui._LOG_TRIM_EVERY = powerhour_gui.PowerHourGUI._LOG_TRIM_EVERY
+    gui._log_insert_count = 0
+    gui._COALESCED_MESSAGE_TYPES = powerhour_gui.PowerHourGUI._COALESCED_MESSAGE_TYPES
+    gui._QUEUE_POLL_ACTIVE_MS = powerhour_gui.PowerHourGUI._QUEUE_POLL_ACTIVE_MS
+    gui._QUEUE_POLL_IDLE_MS = powerhour_gui.PowerHourGUI._QUEUE_POLL_IDLE_MS
+    gui._processing_active = False
+    gui._ytdlp_update_in_progress = False
+    gui._drain_scheduled = False
+    gui._drain_queue.side_effect = lambda: powerhour_gui.PowerHourGUI._drain_queue(gui)
+    gui._flush_queue_batch.side_effect = (
+        lambda logs, latest: powerhour_gui.PowerHourGUI._flush_queue_batch(gui, logs, latest)
+    )
+    gui._append_log_lines.side_effect = lambda entries: powerhour_gui.PowerHourGUI._append_log_lines(gui, entries)
+    return gui
+
+
+class TestProcessQueue:
+    def test_consecutive_logs_become_one_insert(self):
+        gui = _fake_gui()
+        for level in ("info", "warning", "error", "debug"):
+            gui.message_queue.put({"type": "log", "level": level, "message": level})
+        powerhour_gui.PowerHourGUI.process_queue(gui)
+        gui.log_text.insert.assert_called_once_with(
+            "end", "info\n", "info", "warning\n", "warning", "error\n", "error", "debug\n", "info"
+        )
+        gui.after.assert_called_once_with(100, gui.process_queue)
+
+    def test_logs_are_flushed_before_other_messages(self):
+        gui = _fake_gui()
+        gui.message_queue.put({"type": "log", "level": "info", "message": "before"})
+        gui.message_queue.put({"type": "complete"})
+        gui.message_queue.put({"type": "log", "level": "info", "message": "after"})
+        gui.on_processing_complete.side_effect = lambda: order.append("complete")
+        order = []
+        gui.log_text.insert.side_effect = lambda _index, text, _tag: order.append(text)
+        powerhour_gui.PowerHourGUI.process_queue(gui)
+        assert order == ["before\n", "complete", "after\n"]
+
+    def test_progress_updates_are_coalesced_per_tick(self):
+        gui = _fake_gui()
+        for i in range(1, 6):
+            gui.message_queue.put({"type": "progress", "current": i, "total": 60})
+            gui.message_queue.put({"type": "video_progress", "percent": i * 10})
+        powerhour_gui.PowerHourGUI.process_queue(gui)
+        assert gui._apply_progress_message.call_count == 2
+        applied = [c.args[0] for c in gui._apply_progress_message.call_args_list]
+        assert applied == [{"type": "progress", "current": 5, "total": 60}, {"type": "video_progress", "percent": 50}]
+
+    def test_pending_progress_is_applied_before_complete(self):
+        gui = _fake_gui()
+        order = []
+        gui._apply_progress_message.side_effect = lambda m: order.append(m["type"])
+        gui.on_processing_complete.side_effect = lambda: order.append("complete")
+        gui.message_queue.put({"type": "status", "message": "Concatenating"})
+        gui.message_queue.put({"type": "complete"})
+        powerhour_gui.PowerHourGUI.process_queue(gui)
+        assert order == ["status", "complete"]
+
+    def test_poll_slows_down_when_idle(self):
+        gui = _fake_gui()
+        powerhour_gui.PowerHourGUI.process_queue(gui)
+        gui.after.assert_called_once_with(500, gui.process_queue)
+
+    def test_poll_stays_fast_while_processing(self):
+        gui = _fake_gui()
+        gui._processing_active = True
+        powerhour_gui.PowerHourGUI.process_queue(gui)
+        gui.after.assert_called_once_with(100, gui.process_queue)
+
+    def test_main_thread_log_schedules_one_idle_drain(self):
+        gui = _fake_gui()
+        for _ in range(3):
+            powerhour_gui.PowerHourGUI.log_message(gui, "hello")
+        gui.after_idle.assert_called_once_with(gui._drain_queue)
+        assert powerhour_gui.PowerHourGUI._drain_queue(gui) == 3
+        assert gui._drain_scheduled is False
+
+    def test_log_methods_enqueue_instead_of_touching_widget(self):
+        gui = _fake_gui()
+        gui.log_message.side_effect = lambda msg, tag="info": powerhour_gui.PowerHourGUI.log_message(gui, msg, tag)
+        powerhour_gui.PowerHourGUI.log_warning(gui, "careful")
+        gui.log_text.insert.assert_not_called()
+        assert gui.message_queue.get_nowait() == {"type": "log", "level": "warning", "message": "careful"}
+
+    def test_log_is_trimmed_to_max_lines(self):
+        gui = _fake_gui()
+        gui.log_text.index.return_value = "2151.0"
+        for i in range(gui._LOG_TRIM_EVERY - 1):
+            powerhour_gui.PowerHourGUI._append_log_lines(gui, [(str(i), "info")])
+        gui.log_text.delete.assert_not_called()
+        powerhour_gui.PowerHourGUI._append_log_lines(gui, [("last", "info")])
+        gui.log_text.delete.assert_called_once_with("1.0", "151.0")
+        assert gui._log_insert_count == 0
+
+    def test_drain_is_bounded_per_tick(self):
+        gui = _fake_gui()
+        limit = gui._QUEUE_DRAIN_LIMIT
+        for i in range(limit + 5):
+            gui.message_queue.put({"type": "log", "message": str(i)})
+        powerhour_gui.PowerHourGUI.process_queue(gui)
+        assert gui.message_queue.qsize() == 5
+
+    def test_current_file_is_text_after_last_colon(self):
+        gui = _fake_gui()
+        gui._progress_state = powerhour_gui._ProgressState()
+        gui.message_queue.put({"type": "log", "message": "Processing: C:/videos/clip.mp4"})
+        powerhour_gui.PowerHourGUI.process_queue(gui)
+        assert gui._progress_state.current_file == "/videos/clip.mp4"
+
+
+# ---------------------------------------------------------------------------
+# Input validation
+# ---------------------------------------------------------------------------
+
+class TestValidateUrl:
+    @pytest.mark.parametrize("url", [
+        "https://www.youtube.com/playlist?list=abc",
+        "http://youtu.be/xyz",
+        "https://vimeo.com/123",
+        "https://dailymotion.com/video/x",
+        "HTTPS://WWW.YouTube.com/watch?v=AbC",
+    ])
+    def test_supported_platforms(self, url):
+        assert powerhour_gui.PowerHourGUI.validate_url(None, url)
+
+    @pytest.mark.parametrize("url", ["https://example.com/v", "ftp://youtube.com", "youtube.com/watch"])
+    def test_unsupported_urls(self, url):
+        assert not powerhour_gui.PowerHourGUI.validate_url(None, url)
+
+
+class TestUserFriendlyError:
+    @pytest.mark.parametrize("msg,expected", [
+        ("Disk quota exceeded while calling FFMPEG", "FFmpeg error"),
+        ("connection reset by yt-dlp", "YouTube download error"),
+        ("No space left on device", "Insufficient disk space"),
+        ("Network is unreachable", "Network error"),
+    ])
+    def test_keyword_priority_matches_original_order(self, msg, expected):
+        result = powerhour_gui.PowerHourGUI.get_user_friendly_error(None, "RuntimeError", msg, "ctx")
+        assert result.startswith(expected)
+
+    def test_falls_back_to_error_class_map(self):
+        result = powerhour_gui.PowerHourGUI.get_user_friendly_error(None, PermissionError("denied"), "denied", "ctx")
+        assert result == "Permission denied. Please check file permissions."
+        result = powerhour_gui.PowerHourGUI.get_user_friendly_error(None, RuntimeError("boom"), "boom", "ctx")
+        assert result == "RuntimeError: boom"
+        result = powerhour_gui.PowerHourGUI.get_user_friendly_error(None, "ProcessingError", "boom", "ctx")
+        assert result == "ProcessingError: boom"
+
+    def test_most_specific_class_wins(self):
+        lookup = powerhour_gui.PowerHourGUI.get_user_friendly_error
+        err = subprocess.CalledProcessError(1, ["ffprobe"])
+        assert lookup(None, err, "exit 1", "ctx").startswith("Video processing failed")
+        err = json.JSONDecodeError("bad", "{", 0)
+        assert lookup(None, err, "bad", "ctx").startswith("Configuration file is corrupted")
+        assert lookup(None, IsADirectoryError(), "x", "ctx").startswith("System error occurred")
+
+
+class TestHandleError:
+    def _gui(self):
+        gui = MagicMock()
+        gui.get_user_friendly_error.side_effect = (
+            lambda *a: powerhour_gui.PowerHourGUI.get_user_friendly_error(gui, *a))
+        return gui
+
+    def test_expected_error_is_logged_without_traceback(self):
+        gui = self._gui()
+        with patch.object(powerhour_gui.traceback, "format_exc") as format_exc:
+            msg = powerhour_gui.PowerHourGUI.handle_error(gui, ValueError("bad fade"), "Start")
+        format_exc.assert_not_called()
+        gui.log_to_file.assert_called_once_with("error", "Start: ValueError: bad fade")
+        gui.log_error.assert_called_once_with(f"Start: {msg}")
+
+    def test_unexpected_error_logs_traceback(self):
+        gui = self._gui()
+        with patch.object(powerhour_gui.traceback, "format_exc", return_value="TB") as format_exc:
+            powerhour_gui.PowerHourGUI.handle_error(gui, RuntimeError("boom"), "Start")
+        format_exc.assert_called_once()
+        gui.log_to_file.assert_called_once_with("error", "Start\nTB")
+
+
+class TestBuiltinPresets:
+    def test_apply_preset_sets_every_field(self):
+        gui = MagicMock()
+        powerhour_gui.PowerHourGUI.apply_preset(gui, "archive")
+        gui.fade_duration_var.set.assert_called_once_with(3.0)
+        gui.video_quality_var.set.assert_called_once_with("high")
+        gui.audio_normalization_var.set.assert_called_once_with(True)
+        gui.output_format_var.set.assert_called_once_with("mkv")
+
+    def test_unknown_preset_is_ignored_and_table_is_read_only(self):
+        gui = MagicMock()
+        powerhour_gui.PowerHourGUI.apply_preset(gui, "nope")
+        gui.fade_duration_var.set.assert_not_called()
+        with pytest.raises(TypeError):
+            powerhour_gui._BUILTIN_PRESETS["party"]["fade_duration"] = 9
+
+
+class TestSetupStyles:
+    def test_registers_each_used_validation_style_once(self):
+        with patch.object(powerhour_gui.ttk, "Style") as style_cls:
+            powerhour_gui.PowerHourGUI.setup_styles(MagicMock())
+        calls = {c.args[0]: c.kwargs for c in style_cls.return_value.map.call_args_list}
+        assert set(calls) == set(powerhour_gui._VALIDATION_STYLES)
+        assert calls["Warning.TCombobox"] == {
+            "fieldbackground": [("focus", "lightyellow"), ("!focus", "white")],
+            "bordercolor": [("focus", "orange"), ("!focus", "orange")],
+        }
+        assert style_cls.return_value.map.call_count == len(powerhour_gui._VALIDATION_STYLES)
+
+
+class TestDebounceValidation:
+    def _gui(self):
+        gui = MagicMock()
+        gui._pending_validations = set()
+        gui._validation_after_id = None
+        gui._VALIDATION_DEBOUNCE_MS = powerhour_gui.PowerHourGUI._VALIDATION_DEBOUNCE_MS
+        tokens = iter(range(1, 100))
+        gui.after.side_effect = lambda _ms, _fn: f"after#{next(tokens)}"
+        return gui
+
+    def test_burst_across_fields_shares_one_timer(self):
+        gui = self._gui()
+        for field in ("video_source", "video_source", "output_file", "video_source"):
+            powerhour_gui.PowerHourGUI._schedule_validation(gui, field)
+        gui.after_cancel.assert_not_called()
+        gui.after.assert_called_once_with(250, gui._check_validation_deadline)
+        assert gui._validation_after_id == "after#1"
+        assert gui._pending_validations == {"video_source", "output_file"}
+
+    def test_deadline_rearms_for_remaining_window(self):
+        gui = self._gui()
+        gui._validation_after_id = "after#0"
+        gui._last_keystroke = 10.0
+        with patch.object(powerhour_gui.time, "monotonic", return_value=10.1):
+            powerhour_gui.PowerHourGUI._check_validation_deadline(gui)
+        gui.after.assert_called_once_with(150, gui._check_validation_deadline)
+        gui._flush_validations.assert_not_called()
+        with patch.object(powerhour_gui.time, "monotonic", return_value=10.25):
+            powerhour_gui.PowerHourGUI._check_validation_deadline(gui)
+        gui._flush_validations.assert_called_once_with()
+
+    def test_flush_runs_each_pending_validator_once(self):
+        gui = self._gui()
+        gui._pending_validations = {"video_source", "common_clip"}
+        gui._validation_after_id = "after#1"
+        powerhour_gui.PowerHourGUI._flush_validations(gui)
+        gui.validate_video_source.assert_called_once_with()
+        gui.validate_common_clip.assert_called_once_with()
+        gui.validate_output_file.assert_not_called()
+        assert gui._pending_validations == set() and gui._validation_after_id is None
+
+
+class TestLazyMenus:
+    def test_menus_are_populated_once(self):
+        gui = MagicMock()
+        gui._menus_populated = set()
+        for _ in range(3):
+            powerhour_gui.PowerHourGUI._populate_presets_menu(gui)
+            powerhour_gui.PowerHourGUI._populate_help_menu(gui)
+        assert gui._presets_menu.add_command.call_count == 4
+        gui._presets_menu.add_cascade.assert_called_once_with(label="Load Preset", menu=gui._load_presets_menu)
+        assert gui._help_menu.add_command.call_count == 3
+        assert gui._menus_populated == {"presets", "help"}
+
+    def _load_gui(self, names):
+        gui = MagicMock()
+        gui._PRESET_MENU_LIMIT = 8
+        gui._load_presets_names = None
+        gui.app_config = {"presets": {name: {} for name in names}}
+        return gui
+
+    def test_small_preset_set_is_listed_and_rebuilt_only_on_change(self):
+        gui = self._load_gui(["a", "b"])
+        for _ in range(2):
+            powerhour_gui.PowerHourGUI._populate_load_presets_menu(gui)
+        menu = gui._load_presets_menu
+        assert menu.delete.call_count == 1
+        assert [c.kwargs["label"] for c in menu.add_command.call_args_list] == ["a", "b"]
+        menu.add_command.call_args_list[1].kwargs["command"]()
+        gui.apply_saved_preset.assert_called_once_with("b")
+
+        gui.app_config["presets"]["c"] = {}
+        powerhour_gui.PowerHourGUI._populate_load_presets_menu(gui)
+        assert menu.delete.call_count == 2
+
+    def test_large_preset_set_falls_back_to_dialog(self):
+        gui = self._load_gui([str(i) for i in range(9)])
+        powerhour_gui.PowerHourGUI._populate_load_presets_menu(gui)
+        gui._load_presets_menu.add_command.assert_called_once_with(
+            label="Browse Presets...", command=gui.load_preset)
+
+
+class TestRecentItems:
+    def test_add_to_recent_moves_item_to_front_and_caps(self):
+        gui = MagicMock()
+        gui.app_config = {"recent_sources": ["b", "a", "c"], "max_recent_items": 3}
+        gui._recent = {"recent_sources": ("b", "a", "c")}
+        gui._recent_order = {"recent_sources": powerhour_gui.OrderedDict.fromkeys(("b", "a", "c"))}
+        powerhour_gui.PowerHourGUI.add_to_recent(gui, "sources", "c")
+        powerhour_gui.PowerHourGUI.add_to_recent(gui, "sources", "d")
+        assert gui.app_config["recent_sources"] == ["d", "c", "b"]
+        assert gui._recent["recent_sources"] == ("d", "c", "b")
+        gui._set_combo_values.assert_called_with(gui.video_source_combo, ("d", "c", "b"))
+
+    def test_recent_lists_from_config_are_deduplicated_and_capped(self):
+        gui = MagicMock()
+        gui.app_config = {"recent_sources": ["a", "b", "a", "c", "d"], "max_recent_items": 2}
+        with patch.object(powerhour_gui, "ttk"), patch.object(powerhour_gui, "tk"):
+            powerhour_gui.PowerHourGUI.build_input_section(gui)
+        assert gui._recent["recent_sources"] == ("a", "b")
+        assert gui.app_config["recent_sources"] == ["a", "b"]
+        assert list(gui._recent_order["recent_sources"]) == ["a", "b"]
+
+    def test_set_combo_values_skips_unchanged_lists(self):
+        gui = MagicMock()
+        gui._combo_values_cache = {}
+        combo = MagicMock(__str__=lambda _self: ".input.source")
+        powerhour_gui.PowerHourGUI._set_combo_values(gui, combo, ("a", "b"))
+        powerhour_gui.PowerHourGUI._set_combo_values(gui, combo, ("a", "b"))
+        powerhour_gui.PowerHourGUI._set_combo_values(gui, combo, ("b", "a"))
+        assert [c.kwargs for c in combo.configure.call_args_list] == [{"values": ("a", "b")}, {"values": ("b", "a")}]
+
+
+class TestInputBindtag:
+    def _gui(self):
+        gui = MagicMock(spec_set=["_widget_kind", "validate_video_source", "validate_video_source_realtime",
+                                  "validate_fade_duration"])
+        gui._widget_kind = {".input.source": "video_source", ".input.fade": "fade_duration"}
+        return gui
+
+    def test_keyrelease_prefers_realtime_validator(self):
+        gui = self._gui()
+        event = MagicMock(widget=".input.source")
+        powerhour_gui.PowerHourGUI._on_input_keyrelease(gui, event)
+        gui.validate_video_source_realtime.assert_called_once_with(event)
+        gui.validate_video_source.assert_not_called()
+
+    def test_keyrelease_falls_back_to_full_validator(self):
+        gui = self._gui()
+        event = MagicMock(widget=".input.fade")
+        powerhour_gui.PowerHourGUI._on_input_keyrelease(gui, event)
+        gui.validate_fade_duration.assert_called_once_with(event)
+
+    def test_commit_runs_full_validator_and_ignores_unknown_widgets(self):
+        gui = self._gui()
+        powerhour_gui.PowerHourGUI._on_input_commit(gui, MagicMock(widget=".input.source"))
+        powerhour_gui.PowerHourGUI._on_input_commit(gui, MagicMock(widget=".elsewhere"))
+        gui.validate_video_source.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Progress tracking
+# ---------------------------------------------------------------------------
+
+class TestProgressState:
+    def test_slots_reject_unknown_attributes(self):
+        state = powerhour_gui._ProgressState()
+        with pytest.raises(AttributeError):
+            state.typo = 1
+
+    def test_speed_window_keeps_last_ten_samples(self):
+        gui = MagicMock()
+        gui._progress_state = powerhour_gui._ProgressState()
+        gui._progress_state.start_time = 1000.0
+        with patch.object(powerhour_gui.time, "time", return_value=1060.0):
+            for current in range(1, 16):
+                powerhour_gui.PowerHourGUI.update_processing_speed(gui, current)
+        assert list(gui._progress_state.speed_window) == [float(c) for c in range(6, 16)]
+        assert gui._progress_state.speed_sum == pytest.approx(sum(range(6, 16)))
+        gui.speed_label.config.assert_called_with(text="10.5 videos/minute")
+
+    @pytest.mark.parametrize("status,stage", [
+        ("Initializing processing...", "Initializing"),
+        ("Analyzing video 3/60", "Analyzing"),
+        ("Processing video 12/60", "Encoding"),
+        ("Concatenating...", "Finalizing"),
+    ])
+    def test_stage_from_status(self, status, stage):
+        gui = MagicMock()
+        gui._progress_state = powerhour_gui._ProgressState()
+        powerhour_gui.PowerHourGUI.update_processing_stage(gui, status)
+        gui.processing_stage_label.config.assert_called_once_with(text=stage)
+        assert gui._progress_state.stage == stage
+
+    def test_unrelated_status_leaves_stage_alone(self):
+        gui = MagicMock()
+        powerhour_gui.PowerHourGUI.update_processing_stage(gui, "Checking dependencies...")
+        gui.processing_stage_label.config.assert_not_called()
+
+    def _eta_gui(self):
+        gui = MagicMock()
+        gui._progress_state = powerhour_gui._ProgressState()
+        return gui
+
+    def _tick(self, gui, now, current, total=60):
+        with patch.object(powerhour_gui.time, "time", return_value=now):
+            powerhour_gui.PowerHourGUI.update_eta(gui, current, total)
+
+    def test_eta_uses_recent_per_video_durations(self):
+        gui = self._eta_gui()
+        self._tick(gui, 0.0, 0)
+        self._tick(gui, 10.0, 1)
+        self._tick(gui, 40.0, 4)  # coalesced tick covering three videos
+        state = gui._progress_state
+        assert list(state.eta_window) == [10.0, 10.0, 10.0, 10.0]
+        assert state.eta_sum == 40.0
+        gui.eta_var.set.assert_called_with("~9 minutes 20 seconds remaining")
+
+    def test_eta_weights_burst_completions_by_video_count(self):
+        # Four 40 s encodes in parallel; one finish lands in one drain, three in the next
+        gui = self._eta_gui()
+        for now, current in ((0.0, 0), (40.0, 1), (40.1, 4)):
+            self._tick(gui, now, current)
+        assert len(gui._progress_state.eta_window) == 4
+        gui.eta_var.set.assert_called_with("~9 minutes 21 seconds remaining")
+
+    def test_eta_window_is_bounded_with_running_sum(self):
+        gui = self._eta_gui()
+        for i in range(1, 31):
+            self._tick(gui, float(i * i), i)
+        state = gui._progress_state
+        assert len(state.eta_window) == 16
+        assert state.eta_sum == pytest.approx(sum(state.eta_window))
+
+    def test_eta_window_restarts_with_new_pass(self):
+        gui = self._eta_gui()
+        for i in range(1, 6):
+            self._tick(gui, float(i), i)
+        self._tick(gui, 100.0, 1)
+        state = gui._progress_state
+        assert len(state.eta_window) == 0 and state.eta_sum == 0.0
+        gui.eta_var.set.assert_called_with("")
+        self._tick(gui, 130.0, 2)
+        assert list(state.eta_window) == [30.0]
+
+
+class TestResourceUsage:
+    def _gui(self):
+        gui = MagicMock()
+        gui._cpu_percent_primed = False
+        gui._resource_text = None
+        gui._last_resource_ts = 0.0
+        gui._RESOURCE_INTERVAL_ACTIVE = powerhour_gui.PowerHourGUI._RESOURCE_INTERVAL_ACTIVE
+        gui._RESOURCE_INTERVAL_IDLE = powerhour_gui.PowerHourGUI._RESOURCE_INTERVAL_IDLE
+        gui._RESOURCE_INTERVAL_ICONIFIED = powerhour_gui.PowerHourGUI._RESOURCE_INTERVAL_ICONIFIED
+        gui._window_iconified = False
+        return gui
+
+    def test_samples_without_blocking_and_skips_unchanged_redraws(self):
+        gui = self._gui()
+        fake_psutil = MagicMock()
+        fake_psutil.cpu_percent.return_value = 12.2
+        fake_psutil.virtual_memory.return_value.percent = 40.4
+        with patch.object(powerhour_gui, "_psutil_module", return_value=fake_psutil):
+            for _ in range(3):
+                powerhour_gui.PowerHourGUI.update_resource_usage(gui)
+        fake_psutil.cpu_percent.assert_called_with(interval=None)
+        gui.resource_label.config.assert_called_once_with(text="CPU: 12% | RAM: 40%")
+        assert gui._schedule_resource_update.call_count == 3
+
+    def test_without_psutil_only_reschedules(self):
+        gui = self._gui()
+        with patch.object(powerhour_gui, "_psutil_module", return_value=None):
+            powerhour_gui.PowerHourGUI.update_resource_usage(gui)
+        gui.resource_label.config.assert_not_called()
+        gui._schedule_resource_update.assert_called_once_with()
+
+    @pytest.mark.parametrize("processing,elapsed,refreshed", [
+        (True, 1.2, True), (False, 1.2, False), (False, 2.1, True), (True, 0.4, False),
+    ])
+    def test_refresh_is_throttled_by_processing_state(self, processing, elapsed, refreshed):
+        gui = self._gui()
+        gui._processing_active = processing
+        gui._last_resource_ts = 100.0
+        with patch.object(powerhour_gui.time, "monotonic", return_value=100.0 + elapsed):
+            powerhour_gui.PowerHourGUI._maybe_update_resources(gui)
+        assert gui.update_resource_usage.called is refreshed
+        assert gui._schedule_resource_update.called is not refreshed
+
+    @pytest.mark.parametrize("elapsed,refreshed", [(4.0, False), (5.1, True)])
+    def test_refresh_slows_down_while_minimized(self, elapsed, refreshed):
+        gui = self._gui()
+        gui._processing_active = True
+        gui._window_iconified = True
+        gui._last_resource_ts = 100.0
+        with patch.object(powerhour_gui.time, "monotonic", return_value=100.0 + elapsed):
+            powerhour_gui.PowerHourGUI._maybe_update_resources(gui)
+        assert gui.update_resource_usage.called is refreshed
+
+    def test_only_main_window_map_events_toggle_iconified(self):
+        gui = self._gui()
+        powerhour_gui.PowerHourGUI._set_iconified(gui, MagicMock(widget=MagicMock()), True)
+        assert gui._window_iconified is False
+        powerhour_gui.PowerHourGUI._set_iconified(gui, MagicMock(widget=gui), True)
+        assert gui._window_iconified is True
+
+    def test_schedule_defers_to_idle(self):
+        gui = self._gui()
+        gui._RESOURCE_POLL_MS = 500
+        gui.after.return_value = "after#7"
+        powerhour_gui.PowerHourGUI._schedule_resource_update(gui)
+        gui.after.assert_called_once_with(500, gui.after_idle, gui._maybe_update_resources)
+        assert gui._resource_job == "after#7"
+
+
+class TestLazyFileDialog:
+    def test_module_import_does_not_load_rarely_used_modules(self):
+        import subprocess
+        import sys
+        code = ("import sys; import powerhour.powerhour_gui; "
+                "print('tkinter.filedialog' in sys.modules, 'webbrowser' in sys.modules)")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False False"
+
+    def test_browse_output_file_uses_lazy_dialog(self):
+        gui = MagicMock()
+        gui.output_file_var.get.return_value = ""
+        with patch.object(powerhour_gui, "_filedialog_module") as dialog_module:
+            dialog_module.return_value.asksaveasfilename.return_value = "out.mp4"
+            powerhour_gui.PowerHourGUI.browse_output_file(gui)
+        gui.output_file_var.set.assert_called_once_with("out.mp4")
+
+
+class TestMissingWorkers:
+    def test_start_processing_reports_missing_processor(self):
+        gui = MagicMock()
+        with patch.object(powerhour_gui, "ProcessorThread", None), \
+                patch.object(powerhour_gui, "_WORKER_IMPORT_ERROR", "No module named 'powerhour_processor'"):
+            powerhour_gui.PowerHourGUI.start_processing(gui)
+        gui.show_error_dialog.assert_called_once()
+        assert gui.show_error_dialog.call_args.kwargs["details"] == "No module named 'powerhour_processor'"
+        gui.validate_all_inputs.assert_not_called()
+
+
+class TestPathValidation:
+    def test_stat_mode_distinguishes_files_dirs_and_missing(self, tmp_path):
+        clip = tmp_path / "clip.mp4"
+        clip.write_bytes(b"")
+        assert powerhour_gui.stat.S_ISDIR(powerhour_gui._stat_mode(str(tmp_path)))
+        assert powerhour_gui.stat.S_ISREG(powerhour_gui._stat_mode(str(clip)))
+        assert powerhour_gui._stat_mode(str(tmp_path / "missing")) is None
+        assert powerhour_gui._stat_mode("bad\0path") is None
+
+    def _gui(self):
+        gui = MagicMock()
+        gui._stat_mode_cached.side_effect = powerhour_gui._stat_mode
+        gui._output_context.side_effect = lambda path=None: powerhour_gui.PowerHourGUI._output_context(gui, path)
+        gui._last_validated = {}
+        gui._STAT_CACHE_TTL = powerhour_gui.PowerHourGUI._STAT_CACHE_TTL
+        gui._recent_validation.side_effect = (
+            lambda field, value: powerhour_gui.PowerHourGUI._recent_validation(gui, field, value)
+        )
+        gui._remember_validation.side_effect = (
+            lambda field, value, result: powerhour_gui.PowerHourGUI._remember_validation(gui, field, value, result)
+        )
+        return gui
+
+    @pytest.mark.parametrize("source,valid", [
+        ("https://www.youtube.com/playlist?list=abc", True),
+        ("http_videos_that_do_not_exist", False),
+    ])
+    def test_video_source_url_prefix_needs_scheme(self, source, valid):
+        gui = self._gui()
+        assert powerhour_gui.PowerHourGUI.validate_video_source(gui, source=source) is valid
+        gui.video_source_var.get.assert_not_called()
+
+    def test_common_clip_must_be_a_regular_file(self, tmp_path):
+        gui = self._gui()
+        gui.common_clip_var.get.return_value = str(tmp_path)
+        assert powerhour_gui.PowerHourGUI.validate_common_clip(gui) is False
+        gui.common_clip_combo.configure.assert_called_with(style="Invalid.TCombobox")
+
+    def test_unchanged_value_is_not_revalidated_within_ttl(self, tmp_path):
+        gui = self._gui()
+        with patch.object(powerhour_gui.time, "monotonic", return_value=100.0):
+            assert powerhour_gui.PowerHourGUI.validate_video_source(gui, source=str(tmp_path)) is True
+            assert powerhour_gui.PowerHourGUI.validate_video_source(gui, source=str(tmp_path)) is True
+        assert gui._stat_mode_cached.call_count == 1
+        gui.video_source_combo.configure.assert_called_once_with(style="Valid.TCombobox")
+        with patch.object(powerhour_gui.time, "monotonic", return_value=100.0 + gui._STAT_CACHE_TTL):
+            powerhour_gui.PowerHourGUI.validate_video_source(gui, source=str(tmp_path))
+        assert gui._stat_mode_cached.call_count == 2
+
+    def test_empty_value_fails_without_touching_widget(self):
+        gui = self._gui()
+        gui.common_clip_var.get.return_value = ""
+        assert powerhour_gui.PowerHourGUI.validate_common_clip(gui) is False
+        gui._stat_mode_cached.assert_not_called()
+        gui.common_clip_combo.configure.assert_not_called()
+
+    def test_output_file_in_missing_directory_warns(self, tmp_path):
+        gui = self._gui()
+        gui.output_file_var.get.return_value = str(tmp_path / "new" / "out.mp4")
+        assert powerhour_gui.PowerHourGUI.validate_output_file(gui) is True
+        gui.output_file_combo.configure.assert_called_with(style="Warning.TCombobox")
+
+    @pytest.mark.parametrize("name,style", [
+        ("OUT.MP4", "Valid.TCombobox"),
+        ("out.Mp4", "Valid.TCombobox"),
+        ("out.mp4.mkv", "Warning.TCombobox"),
+    ])
+    def test_output_extension_check_ignores_case(self, tmp_path, name, style):
+        gui = self._gui()
+        gui.output_file_var.get.return_value = str(tmp_path / name)
+        assert powerhour_gui.PowerHourGUI.validate_output_file(gui) is True
+        gui.output_file_combo.configure.assert_called_with(style=style)
+
+    def test_full_validate_reports_every_failing_field_in_order(self, tmp_path):
+        gui = self._gui()
+        gui.validate_common_clip.return_value = False
+        gui.validate_fade_duration.return_value = True
+        params = {"video_source": "", "common_clip": str(tmp_path / "missing.mp4"), "fade_duration": 3.0,
+                  "output_file": ""}
+        errors, output = powerhour_gui.PowerHourGUI._full_validate(gui, params)
+        assert errors == ["Please select a video source", "Common clip file not found",
+                          "Please specify an output file"]
+        assert output.path == ""
+        gui.validate_video_source.assert_not_called()
+        gui.validate_common_clip.assert_called_once_with(path=params["common_clip"])
+
+    def test_validate_all_inputs_shows_only_first_error(self):
+        gui = self._gui()
+        gui._full_validate.return_value = (["first", "second"], None)
+        with patch.object(powerhour_gui.messagebox, "showerror") as showerror:
+            assert powerhour_gui.PowerHourGUI.validate_all_inputs(gui, {}) is False
+        showerror.assert_called_once_with("Input Error", "first")
+        gui.check_disk_space.assert_not_called()
+
+    @pytest.mark.parametrize("text,valid,message", [
+        ("2.5", True, None),
+        ("12", False, "Fade duration must be between 0 and 10 seconds"),
+        ("abc", False, "Invalid number format"),
+        ("", False, "Invalid number format"),
+    ])
+    def test_fade_duration_parses_spinbox_text(self, text, valid, message):
+        gui = self._gui()
+        gui._fade_duration_value.side_effect = lambda: powerhour_gui.PowerHourGUI._fade_duration_value(gui)
+        gui.fade_duration_spinbox.get.return_value = text
+        assert powerhour_gui.PowerHourGUI.validate_fade_duration(gui) is valid
+        gui.fade_duration_var.get.assert_not_called()
+        if message is None:
+            gui.show_tooltip.assert_not_called()
+        else:
+            gui.show_tooltip.assert_called_once_with(gui.fade_duration_spinbox, message)
+
+    def test_output_context_reads_var_and_stats_once(self, tmp_path):
+        gui = self._gui()
+        gui.output_file_var.get.return_value = "out.mp4"
+        context = powerhour_gui.PowerHourGUI._output_context(gui)
+        assert context.path == "out.mp4" and context.directory == "."
+        assert powerhour_gui.stat.S_ISDIR(context.dir_mode)
+        gui.output_file_var.get.assert_called_once_with()
+        gui._stat_mode_cached.assert_called_once_with(".")
+
+    def test_output_file_under_a_file_is_invalid(self, tmp_path):
+        (tmp_path / "notadir").write_bytes(b"")
+        gui = self._gui()
+        gui.output_file_var.get.return_value = str(tmp_path / "notadir" / "out.mp4")
+        assert powerhour_gui.PowerHourGUI.validate_output_file(gui) is False
+
+    def test_validate_all_inputs_uses_snapshot_without_rereading_vars(self, tmp_path):
+        clip = tmp_path / "clip.mp4"
+        clip.write_bytes(b"")
+        gui = self._gui()
+        gui.validate_video_source.return_value = True
+        gui.validate_common_clip.side_effect = (
+            lambda path: powerhour_gui.PowerHourGUI.validate_common_clip(gui, path=path)
+        )
+        gui.validate_fade_duration.side_effect = (
+            lambda value: powerhour_gui.PowerHourGUI.validate_fade_duration(gui, value=value)
+        )
+        gui.check_disk_space.return_value = True
+        gui._full_validate.side_effect = lambda p: powerhour_gui.PowerHourGUI._full_validate(gui, p)
+        params = {"video_source": str(tmp_path), "common_clip": str(clip), "fade_duration": 3.0,
+                  "output_file": str(tmp_path / "out.mp4")}
+        assert powerhour_gui.PowerHourGUI.validate_all_inputs(gui, params) is True
+        for var in (gui.video_source_var, gui.common_clip_var, gui.fade_duration_var, gui.output_file_var):
+            var.get.assert_not_called()
+        assert params["preloaded_files"] == [str(clip)]
+
+    def test_validate_all_inputs_rejects_folder_without_videos(self, tmp_path):
+        (tmp_path / "notes.txt").write_text("")
+        gui = self._gui()
+        gui._full_validate.return_value = ([], None)
+        params = {"video_source": str(tmp_path)}
+        with patch.object(powerhour_gui.messagebox, "showerror") as showerror:
+            assert powerhour_gui.PowerHourGUI.validate_all_inputs(gui, params) is False
+        showerror.assert_called_once_with("Input Error", "No video files found in the specified directory")
+        assert "preloaded_files" not in params
+
+
+class TestStatCache:
+    def _gui(self):
+        gui = MagicMock()
+        gui._stat_cache = {}
+        gui._STAT_CACHE_TTL = powerhour_gui.PowerHourGUI._STAT_CACHE_TTL
+        gui._STAT_CACHE_SIZE = 3
+        return gui
+
+    def _stat(self, gui, path, now):
+        with patch.object(powerhour_gui.time, "monotonic", return_value=now), \
+                patch.object(powerhour_gui, "_stat_mode", side_effect=lambda p: len(p)) as stat_mode:
+            return powerhour_gui.PowerHourGUI._stat_mode_cached(gui, path), stat_mode.call_count
+
+    def test_reuses_fresh_results_and_refreshes_stale_ones(self):
+        gui = self._gui()
+        assert self._stat(gui, "/a", 10.0) == (2, 1)
+        assert self._stat(gui, "/a", 11.5) == (2, 0)
+        assert self._stat(gui, "/a", 12.5) == (2, 1)
+
+    def test_evicts_oldest_entry_when_full(self):
+        gui = self._gui()
+        for i, path in enumerate(["/a", "/b", "/c", "/d"]):
+            self._stat(gui, path, float(i))
+        assert list(gui._stat_cache) == ["/b", "/c", "/d"]
+
+
+class TestDiskSpace:
+    def test_free_space_is_reused_within_ttl(self):
+        gui = MagicMock()
+        gui._disk_cache = {}
+        gui._DISK_CACHE_TTL = powerhour_gui.PowerHourGUI._DISK_CACHE_TTL
+        usage = MagicMock(free=7 * 1024 ** 3)
+        with patch.object(powerhour_gui.shutil, "disk_usage", return_value=usage) as disk_usage:
+            for now in (10.0, 12.0, 16.0):
+                with patch.object(powerhour_gui.time, "monotonic", return_value=now):
+                    assert powerhour_gui.PowerHourGUI._disk_free_bytes(gui, "/out") == usage.free
+        assert disk_usage.call_count == 2
+
+
+class TestValidationTooltip:
+    def _gui(self):
+        gui = MagicMock()
+        gui._tooltip = None
+        gui._tooltip_label = None
+        gui._tooltip_after_id = None
+        gui._tooltip_visible = False
+        tokens = iter(range(1, 100))
+        gui.after.side_effect = lambda _ms, _fn: f"after#{next(tokens)}"
+        return gui
+
+    def test_window_is_created_once_and_reused(self):
+        gui = self._gui()
+        widget = MagicMock()
+        widget.winfo_rootx.return_value = widget.winfo_rooty.return_value = 0
+        widget.winfo_width.return_value = widget.winfo_height.return_value = 10
+        with patch.object(powerhour_gui.tk, "Toplevel") as toplevel, patch.object(powerhour_gui.ttk, "Label"):
+            powerhour_gui.PowerHourGUI.show_tooltip(gui, widget, "first")
+            powerhour_gui.PowerHourGUI.hide_tooltip(gui)
+            powerhour_gui.PowerHourGUI.show_tooltip(gui, widget, "second")
+            powerhour_gui.PowerHourGUI.show_tooltip(gui, widget, "third")
+        toplevel.assert_called_once()
+        gui._tooltip.destroy.assert_not_called()
+        gui._tooltip_label.config.assert_called_with(text="third")
+        # Re-showing cancels the previous auto-hide timer instead of stacking them
+        assert [c.args[0] for c in gui.after_cancel.call_args_list] == ["after#1", "after#2"]
+        assert gui._tooltip_after_id == "after#3"
+
+    def test_hide_without_tooltip_is_a_no_op(self):
+        gui = self._gui()
+        powerhour_gui.PowerHourGUI.hide_tooltip(gui)
+        gui.after_cancel.assert_not_called()
+
+
+class TestHoverTooltip:
+    def test_hover_window_is_built_once_and_reused(self):
+        gui = MagicMock()
+        gui._hover_tooltip = None
+        first_widget, second_widget = MagicMock(), MagicMock()
+        powerhour_gui.PowerHourGUI.add_tooltip(gui, first_widget, "one")
+        powerhour_gui.PowerHourGUI.add_tooltip(gui, second_widget, "two")
+        enter_1 = dict(c.args for c in first_widget.bind.call_args_list)["<Enter>"]
+        handlers_2 = dict(c.args for c in second_widget.bind.call_args_list)
+        event = MagicMock(x_root=0, y_root=0)
+        with patch.object(powerhour_gui.tk, "Toplevel") as toplevel, patch.object(powerhour_gui.tk, "Label"):
+            enter_1(event)
+            handlers_2["<Leave>"](event)
+            handlers_2["<Enter>"](event)
+        toplevel.assert_called_once_with(gui)
+        gui._hover_tooltip.withdraw.assert_called_once_with()
+        gui._hover_tooltip.destroy.assert_not_called()
+        gui._hover_tooltip_label.config.assert_called_with(text="two")
+        assert gui._hover_tooltip.deiconify.call_count == 2
+
+
+class TestWidgetStates:
+    def test_control_states_toggle_between_run_and_idle(self):
+        gui = MagicMock()
+        running = dict(powerhour_gui.PowerHourGUI._control_states(gui, processing=True))
+        idle = dict(powerhour_gui.PowerHourGUI._control_states(gui, processing=False))
+        assert running[gui.start_button] == "disabled" and running[gui.cancel_button] == "normal"
+        assert idle[gui.start_button] == "normal" and idle[gui.cancel_button] == "disabled"
+        assert running[gui.output_file_combo] == "disabled" and idle[gui.output_file_combo] == "normal"
+
+    def test_reset_ui_state_applies_one_batch(self):
+        gui = MagicMock()
+        gui._ytdlp_update_in_progress = True
+        powerhour_gui.PowerHourGUI.reset_ui_state(gui)
+        gui._set_states.assert_called_once_with(gui._control_states.return_value)
+        gui._control_states.assert_called_once_with(processing=False)
+        assert gui._processing_active is False
+
+
+class TestNormalizationMode:
+    def _gui(self, expert, fast):
+        gui = MagicMock()
+        gui.expert_mode_var.get.return_value = expert
+        gui.fast_normalization_var.get.return_value = fast
+        gui._fade_duration_value.return_value = 3.0
+        return gui
+
+    @pytest.mark.parametrize("expert, fast, mode", [
+        (True, True, "single_pass"),
+        (True, False, "two_pass"),
+        (False, True, "two_pass"),
+    ])
+    def test_read_inputs_sends_single_pass_only_in_expert_mode(self, expert, fast, mode):
+        params = powerhour_gui.PowerHourGUI._read_inputs(self._gui(expert, fast))
+        assert params["audio_normalization_mode"] == mode
+
+    def test_toggle_saves_mode_to_config(self):
+        gui = self._gui(True, True)
+        gui.app_config = {}
+        powerhour_gui.PowerHourGUI.toggle_fast_normalization(gui)
+        assert gui.app_config["audio_normalization_mode"] == "single_pass"
+        gui.mark_config_dirty.assert_called_once_with()
+
+    def test_default_config_uses_two_pass(self):
+        assert powerhour_gui._default_config()["audio_normalization_mode"] == "two_pass"
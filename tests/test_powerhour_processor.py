@@ -0,0 +1,284 @@
+"""
+Tests for the display-independent helpers in powerhour/powerhour_processor.py.
+
+ProcessorThread itself shells out to ffmpeg/ffprobe; only the pure-Python
+pieces around it are covered here.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+from unittest.mock import MagicMock, patch
+
+from powerhour import powerhour_processor
+
+
+class TestListVideoFiles:
+    def test_skips_hidden_excluded_and_directories(self, tmp_path):
+        for name in ("a.mp4", "B.MKV", "notes.txt", "run.LOG", ".hidden.mp4"):
+            (tmp_path / name).write_bytes(b"")
+        (tmp_path / "sub.mp4").mkdir()
+        found = sorted(powerhour_processor.list_video_files(str(tmp_path)))
+        assert found == [str(tmp_path / "B.MKV"), str(tmp_path / "a.mp4")]
+
+    def test_get_video_files_reuses_preloaded_listing(self, tmp_path):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        with patch.object(powerhour_processor, "list_video_files") as scan:
+            assert thread._get_video_files(str(tmp_path), ["x.mp4"]) == ["x.mp4"]
+        scan.assert_not_called()
+
+    def test_get_video_files_samples_at_most_sixty(self, tmp_path):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        files = [f"{i}.mp4" for i in range(75)]
+        picked = thread._get_video_files(str(tmp_path), files)
+        assert len(picked) == 60 and set(picked) <= set(files)
+
+
+class TestConcatList:
+    def test_single_quotes_are_escaped(self):
+        assert powerhour_processor._concat_entry("/tmp/it's.mp4") == "file '/tmp/it'\\''s.mp4'\n"
+        assert powerhour_processor._concat_entry("/tmp/a.mp4") == "file '/tmp/a.mp4'\n"
+
+
+class TestEncoderSelection:
+    def _reencode_command(self, thread, tmp_path):
+        with patch.object(thread, "_run_command", return_value=True) as run:
+            thread._reencode_video("in.mp4", 10, 60, str(tmp_path / "out.mp4"),
+                                   str(tmp_path / "log"), 3.0, str(tmp_path / "missing.json"))
+        return run.call_args.args[0]
+
+    def test_defaults_to_libx264(self, tmp_path):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        command = self._reencode_command(thread, tmp_path)
+        assert command[command.index("-c:v") + 1] == "libx264"
+
+    def test_temp_clips_skip_faststart_rewrite(self, tmp_path):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        assert "-movflags" not in self._reencode_command(thread, tmp_path)
+
+    def test_uses_nvenc_args_when_selected(self, tmp_path):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        thread.video_codec_args = powerhour_processor.NVENC_ARGS
+        command = self._reencode_command(thread, tmp_path)
+        assert command[command.index("-c:v") + 1] == "h264_nvenc"
+        assert "libx264" not in command
+
+    def test_gpu_decode_only_for_supported_codecs_with_nvenc(self, tmp_path):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        with patch.object(thread, "_run_command", return_value=True) as run:
+            thread._reencode_video("in.mp4", 10, 60, "out.mp4", "log", 3.0, "missing.json", "h264")
+            assert "-hwaccel" not in run.call_args.args[0]
+            thread.video_codec_args = powerhour_processor.NVENC_ARGS
+            thread._reencode_video("in.mp4", 10, 60, "out.mp4", "log", 3.0, "missing.json", "h264")
+            command = run.call_args.args[0]
+            assert command.index("-hwaccel") < command.index("-i")
+            thread._reencode_video("in.mp4", 10, 60, "out.mp4", "log", 3.0, "missing.json", "mpeg4")
+            assert "-hwaccel" not in run.call_args.args[0]
+
+    def test_fps_filter_only_when_rate_differs(self, tmp_path):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        filters = {}
+        with patch.object(thread, "_run_command", return_value=True) as run:
+            for fps in (30.0, 59.94, 24.0, None):
+                thread._reencode_video("in.mp4", 10, 60, "out.mp4", "log", 3.0, "missing.json", fps=fps)
+                command = run.call_args.args[0]
+                assert "-r" not in command
+                filters[fps] = command[command.index("-vf") + 1].split(", ")
+        assert not any(f.startswith("fps=") for f in filters[30.0])
+        assert filters[59.94][0] == filters[None][0] == "fps=30"
+        assert filters[24.0][-1] == "fps=30"
+
+    def test_fades_are_limited_to_their_window(self, tmp_path):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        with patch.object(thread, "_run_command", return_value=True) as run:
+            thread._reencode_video("in.mp4", 10, 60, "out.mp4", "log", 3.0, "missing.json", fps=30.0)
+        command = run.call_args.args[0]
+        assert command[command.index("-vf") + 1] == (
+            "scale=1280:720:flags=bicubic, "
+            "fade=t=in:st=0:d=3.0:enable='between(t,0,3.0)', "
+            "fade=t=out:st=57.0:d=3.0:enable='between(t,57.0,60.0)'")
+
+    def test_single_pass_normalization_skips_measurement(self, tmp_path):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {"audio_normalization_mode": "single_pass"})
+        (tmp_path / "m.json").write_text('{"input_i": "-30.0"}')
+        with patch.object(thread, "_run_command", return_value=True) as run:
+            thread._reencode_video("in.mp4", 10, 60, "out.mp4", "log", 3.0, str(tmp_path / "m.json"))
+        command = run.call_args.args[0]
+        assert command[command.index("-af") + 1] == powerhour_processor.SINGLE_PASS_LOUDNORM
+
+    def test_nvenc_test_encode_uses_the_real_encoder_options(self):
+        powerhour_processor.nvenc_available.cache_clear()
+        listed = MagicMock(stdout=" V....D h264_nvenc  NVIDIA NVENC H.264 encoder")
+        try:
+            with patch.object(powerhour_processor.subprocess, "run",
+                              side_effect=[listed, MagicMock(returncode=0)]) as run:
+                assert powerhour_processor.nvenc_available() is True
+            command = run.call_args.args[0]
+            start = command.index("-c:v")
+            assert tuple(command[start:start + len(powerhour_processor.NVENC_ARGS)]) == powerhour_processor.NVENC_ARGS
+            assert command[command.index("-pix_fmt") + 1] == "yuv420p"
+        finally:
+            powerhour_processor.nvenc_available.cache_clear()
+
+    def test_failed_nvenc_clip_is_not_retried_with_libx264(self):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        thread.video_codec_args = powerhour_processor.NVENC_ARGS
+        with patch.object(thread, "_run_command", return_value=False) as run:
+            assert not thread._reencode_video("in.mp4", 10, 60, "out.mp4", "clip.log", 3.0, "missing.json", "h264")
+        assert run.call_count == 1
+        command = run.call_args.args[0]
+        assert command[command.index("-c:v") + 1] == "h264_nvenc"
+
+    def test_nvenc_needs_a_working_test_encode(self):
+        powerhour_processor.nvenc_available.cache_clear()
+        listed = MagicMock(stdout=" V....D h264_nvenc  NVIDIA NVENC H.264 encoder")
+        failed = MagicMock(returncode=1)
+        try:
+            with patch.object(powerhour_processor.subprocess, "run", side_effect=[listed, failed]):
+                assert powerhour_processor.nvenc_available() is False
+            with patch.object(powerhour_processor.subprocess, "run", side_effect=FileNotFoundError):
+                assert powerhour_processor.nvenc_available() is False  # cached
+        finally:
+            powerhour_processor.nvenc_available.cache_clear()
+
+
+class TestParallelJobs:
+    def test_results_are_indexed_by_job(self):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        results = dict(thread._run_parallel(lambda a, b: a * b, [(1, 2), (3, 4), (5, 6)], 3))
+        assert results == {0: 2, 1: 12, 2: 30}
+
+    def test_stop_event_cancels_pending_jobs(self):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        ran = []
+
+        def job(n):
+            ran.append(n)
+            thread.stop_event.set()
+            return n
+
+        assert list(thread._run_parallel(job, [(n,) for n in range(20)], 1)) == []
+        assert len(ran) < 20
+
+    def test_libx264_splits_cores_between_jobs(self):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        with patch.object(powerhour_processor.os, "cpu_count", return_value=16):
+            assert thread._encode_workers() == 4
+        assert thread.encode_threads == 4
+        thread.video_codec_args = powerhour_processor.NVENC_ARGS
+        assert thread._encode_workers() == powerhour_processor.NVENC_WORKERS
+        assert thread.encode_threads == 0
+
+
+class TestProbeVideo:
+    def test_reads_duration_and_codec_from_one_call(self):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        output = b'{"streams": [{"codec_name": "hevc", "width": 1920, "height": 1080}], "format": {"duration": "93.5"}}'
+        with patch.object(powerhour_processor.subprocess, "check_output", return_value=output) as probe:
+            assert thread._probe_video("a.mkv") == {
+                "duration": 93.5, "codec_name": "hevc", "width": 1920, "height": 1080, "fps": None}
+        probe.assert_called_once()
+
+    def test_missing_duration_is_invalid(self):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        output = b'{"streams": [], "format": {"duration": "N/A"}}'
+        with patch.object(powerhour_processor.subprocess, "check_output", return_value=output):
+            assert thread._probe_video("a.mkv") is None
+
+    def test_frame_rate_is_parsed(self):
+        assert powerhour_processor._parse_rate("30000/1001") == 30000 / 1001
+        assert powerhour_processor._parse_rate("0/0") is None
+        assert powerhour_processor._parse_rate(None) is None
+
+
+class TestLoudnessBatch:
+    STDERR = (
+        "Input #0, mov,mp4 ...\n"
+        "[Parsed_loudnorm_1 @ 0x55d1] \n{\n\t\"input_i\" : \"-18.20\",\n\t\"input_tp\" : \"-1.00\"\n}\n"
+        "[Parsed_loudnorm_0 @ 0x55d0] \n{\n\t\"input_i\" : \"-30.10\",\n\t\"input_tp\" : \"-6.00\"\n}\n"
+    )
+
+    def test_one_run_measures_every_file(self, tmp_path):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        with patch.object(powerhour_processor.subprocess, "check_output", return_value=self.STDERR) as run, \
+                patch.object(thread, "_analyze_loudness") as single:
+            thread._analyze_loudness_files(["/v/a.mp4", "/v/b.mp4"], str(tmp_path / "l.log"), str(tmp_path))
+        command = run.call_args.args[0]
+        assert command.count("-i") == 2 and command.count("-map") == 2
+        single.assert_not_called()
+        a = json.loads((tmp_path / "a.mp4_loudness.json").read_text())
+        b = json.loads((tmp_path / "b.mp4_loudness.json").read_text())
+        assert a["input_i"] == "-30.10" and b["input_i"] == "-18.20"
+
+    def test_failed_batch_falls_back_to_single_runs(self, tmp_path):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        error = powerhour_processor.subprocess.CalledProcessError(1, "ffmpeg", output="no audio")
+        with patch.object(powerhour_processor.subprocess, "check_output", side_effect=error), \
+                patch.object(thread, "_analyze_loudness") as single:
+            thread._analyze_loudness_files(["/v/a.mp4", "/v/b.mp4"], str(tmp_path / "l.log"), str(tmp_path))
+        assert [c.args[0] for c in single.call_args_list] == ["/v/a.mp4", "/v/b.mp4"]
+        assert (tmp_path / "l.log").read_text() == "no audio"
+
+    def test_single_file_analysis_parses_loudnorm_block(self, tmp_path):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        result = MagicMock(stderr=self.STDERR.split("[Parsed_loudnorm_0")[0])
+        with patch.object(powerhour_processor.subprocess, "run", return_value=result) as run:
+            thread._analyze_loudness("/v/c.mp4", str(tmp_path / "c.log"), str(tmp_path))
+        assert "-nostats" in run.call_args.args[0]
+        assert json.loads((tmp_path / "c.mp4_loudness.json").read_text())["input_i"] == "-18.20"
+
+
+class TestDependencies:
+    def test_resolved_tool_paths_are_reused(self):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {"video_source": "https://x"})
+        with patch.object(powerhour_processor.shutil, "which", side_effect=lambda name: f"/opt/bin/{name}"):
+            assert thread._check_dependencies() is True
+        assert (thread.ffmpeg, thread.ffprobe, thread.ytdlp) == (
+            "/opt/bin/ffmpeg", "/opt/bin/ffprobe", "/opt/bin/yt-dlp")
+        with patch.object(powerhour_processor.subprocess, "check_output", return_value=b"{}") as probe:
+            thread._probe_video("a.mp4")
+        assert probe.call_args.args[0][0] == "/opt/bin/ffprobe"
+
+
+class TestDownloadPlaylist:
+    def _command(self, tmp_path, aria2c):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        process = MagicMock(stdout=[], returncode=0)
+        with patch.object(powerhour_processor.shutil, "which", return_value=aria2c), \
+                patch.object(powerhour_processor.subprocess, "Popen", return_value=process) as popen:
+            assert thread._download_playlist("https://x/list", str(tmp_path)) is True
+        return popen.call_args.args[0]
+
+    def test_fragments_download_concurrently(self, tmp_path):
+        command = self._command(tmp_path, None)
+        assert command[command.index("--concurrent-fragments") + 1] == "8"
+        assert "--downloader" not in command and command[-1] == "https://x/list"
+
+    def test_uses_aria2c_when_installed(self, tmp_path):
+        command = self._command(tmp_path, "/usr/bin/aria2c")
+        assert command[command.index("--downloader") + 1] == "aria2c"
+        assert command[-1] == "https://x/list"
+
+
+class TestProgressThrottle:
+    def test_intermediate_video_progress_is_rate_limited(self):
+        messages = queue.Queue()
+        thread = powerhour_processor.ProcessorThread(messages, {})
+        with patch.object(powerhour_processor.time, "monotonic", side_effect=[10.0, 10.01, 10.02, 10.2]):
+            for percent in (10.0, 20.0, 100.0, 30.0):
+                thread.send_video_progress(percent)
+        sent = [messages.get_nowait()["percent"] for _ in range(messages.qsize())]
+        assert sent == [10.0, 100.0, 30.0]
+
+    def test_run_command_reports_ffmpeg_progress(self, tmp_path):
+        thread = powerhour_processor.ProcessorThread(queue.Queue(), {})
+        process = MagicMock(stdout=["frame=30\n", "out_time_ms=1500000\n", "out_time_ms=N/A\n",
+                                    "out_time_ms=3000000\n", "progress=end\n"])
+        process.wait.return_value = 0
+        seconds = []
+        with patch.object(powerhour_processor.subprocess, "Popen", return_value=process) as popen:
+            assert thread._run_command(["ffmpeg", "-i", "in.mp4", "out.mp4"], str(tmp_path / "log"),
+                                       seconds.append) is True
+        assert popen.call_args.args[0] == ["ffmpeg", "-progress", "pipe:1", "-nostats", "-i", "in.mp4", "out.mp4"]
+        assert seconds == [1.5, 3.0]